@@ -1,18 +1,28 @@
 """Bot Arena Manager — runs 4 competing bots with 2-hour evolution cycles."""
 
 import argparse
+import functools
 import json
 import logging
+import re
 import sys
 import time
 import random
 import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
 import config
 import db
+import indicators
 import learning
+from bots.base_bot import BaseBot
 from bots.bot_momentum import MomentumBot
 from bots.bot_mean_rev import MeanRevBot
 from bots.bot_sentiment import SentimentBot
@@ -47,6 +57,20 @@ maker_logger = logging.getLogger("arena.maker")
 TRADE_INTERVAL = 15    # Discover markets + place trades every 15s (fast market discovery)
 RESOLVE_INTERVAL = 60  # Resolve trades + expire stale every 60s (expensive, no need to rush)
 FAST_POLL_INTERVAL = 0.5  # Poll market prices for SL/TP exits every 0.5s
+MAX_WORKERS = 8        # Concurrent network calls per cycle (orderflow fetches, bot trades)
+MARKET_CACHE_TTL = 5   # Reuse an active-markets snapshot this fresh instead of refetching
+
+# Keep-alive session for every Simmer call made from this module. The pool
+# is sized for the position monitor + main loop + worker threads.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Matches 5-min window ranges like "10:00pm-10:05pm"
+_FIVE_MIN_RE = re.compile(r'(\d{1,2}):(\d{2})(am|pm)-(\d{1,2}):(\d{2})(am|pm)')
+
+# (fetched_at, markets_list) — shared by discover_markets() and the position
+# monitor, which poll the same Simmer endpoint. Replaced atomically.
+_active_markets_cache = (0.0, [])
 
 
 def create_default_bots():
@@ -300,46 +324,77 @@ def run_evolution(bots, cycle_number):
 
 def load_api_key():
     try:
-        with open(config.SIMMER_API_KEY_PATH) as f:
-            return json.load(f).get("api_key")
+        return orjson.loads(Path(config.SIMMER_API_KEY_PATH).read_bytes()).get("api_key")
     except FileNotFoundError:
         logger.error(f"No API key at {config.SIMMER_API_KEY_PATH}")
         return None
 
 
+def fetch_active_markets(api_key, max_age=0.0, timeout=15):
+    """Return Simmer's active market list, reusing a snapshot younger than max_age.
+
+    Returns None on a non-200 response; network errors propagate.
+    """
+    global _active_markets_cache
+    fetched_at, markets_list = _active_markets_cache
+    if time.time() - fetched_at < max_age:
+        return markets_list
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    resp = _session.get(
+        f"{config.SIMMER_BASE_URL}/api/sdk/markets",
+        headers=headers,
+        params={"status": "active", "limit": 100},
+        timeout=timeout,
+    )
+    if resp.status_code != 200:
+        return None
+    data = resp.json()
+    markets_list = data if isinstance(data, list) else data.get("markets", [])
+    _active_markets_cache = (time.time(), markets_list)
+    return markets_list
+
+
+def _normalize(market):
+    """Give a Simmer market dict a canonical `market_id` key.
+
+    Simmer returns the id as `id` on some endpoints and `market_id` on others;
+    resolving it once here lets every bot and execute path read
+    market["market_id"] directly.
+    """
+    market["market_id"] = market.get("id") or market.get("market_id")
+    return market
+
+
 def discover_markets(api_key):
-    """Find the active BTC 5-min up/down market."""
-    import requests
+    """Find the active BTC 5-min up/down market.
+
+    The position monitor refreshes the active-markets snapshot every
+    FAST_POLL_INTERVAL while it has exit bots, so most cycles reuse its
+    response instead of paying for another round-trip. The TTL stays well
+    below TRADE_INTERVAL so prices are never a cycle old.
+    """
     markets = []
     try:
-        headers = {"Authorization": f"Bearer {api_key}"}
-        resp = requests.get(
-            f"{config.SIMMER_BASE_URL}/api/sdk/markets",
-            headers=headers,
-            params={"status": "active", "limit": 100},
-            timeout=15,
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            markets_list = data if isinstance(data, list) else data.get("markets", [])
-            for m in markets_list:
-                q = m.get("question", "").lower()
-                has_btc = "btc" in q or "bitcoin" in q
-                has_5min = any(kw in q for kw in config.TARGET_MARKET_KEYWORDS)
-                if has_btc and has_5min:
-                    markets.append(m)
+        markets_list = fetch_active_markets(api_key, max_age=MARKET_CACHE_TTL) or []
+        for m in markets_list:
+            q = m.get("question", "").lower()
+            has_btc = "btc" in q or "bitcoin" in q
+            has_5min = any(kw in q for kw in config.TARGET_MARKET_KEYWORDS)
+            if has_btc and has_5min:
+                markets.append(_normalize(m))
     except Exception as e:
         logger.error(f"Market discovery error: {e}")
     logger.info(f"Discovered {len(markets)} BTC 5-min markets")
     return markets
 
 
+@functools.lru_cache(maxsize=1024)
 def is_5min_market(question):
     """Check if this is a strict 5-minute window market (not 15-min or hourly)."""
-    import re
     q = question.lower()
     # Match patterns like "10:00PM-10:05PM" (5-min range)
-    range_match = re.search(r'(\d{1,2}):(\d{2})(am|pm)-(\d{1,2}):(\d{2})(am|pm)', q)
+    range_match = _FIVE_MIN_RE.search(q)
     if range_match:
         h1, m1 = int(range_match.group(1)), int(range_match.group(2))
         h2, m2 = int(range_match.group(4)), int(range_match.group(5))
@@ -368,7 +423,86 @@ def expire_stale_trades():
     return count
 
 
-def run_maker_section(maker_bot, market, signals, traded):
+def _fetch_market_signals(market, orderflow_feed, pm_price_feed, api_key):
+    """Fetch the per-market signals (Simmer orderflow + Polymarket YES momentum)."""
+    market_id = market["market_id"]
+    of_signals = orderflow_feed.get_signals(market_id, api_key)
+
+    # Polymarket YES price momentum — rate of change in the market's
+    # own prediction price over the last few minutes
+    yes_token = market.get("polymarket_token_id", "")
+    pm_data = pm_price_feed.get_momentum(yes_token) if yes_token else {}
+    pm_signals = {"pm_momentum": pm_data.get("momentum", 0.0),
+                  "pm_prices": pm_data.get("prices", [])}
+    if pm_data.get("fresh") and pm_data.get("prices"):
+        logger.debug(
+            f"PM momentum for {market.get('question','')[:40]}: "
+            f"{pm_data['momentum']:+.4f} prices={pm_data['prices']}"
+        )
+    return {**of_signals, **pm_signals}
+
+
+def _run_copy_bot(copy_bot, markets_by_token, api_key):
+    """Run one copy bot's poll + copy cycle. Called from the worker pool."""
+    try:
+        n = copy_bot.check_and_copy(markets_by_token, api_key)
+        if n > 0:
+            logger.info(
+                f"Copy bot [{copy_bot.label}]: mirrored {n} trades this cycle"
+            )
+    except Exception as e:
+        logger.error(f"Copy bot [{copy_bot.label}] error: {e}")
+
+
+def _run_bot_on_market(bot, market, signals, traded, traded_lock, cfg=None):
+    """Run one taker bot's decide + execute on one market.
+
+    Called from the worker pool, so every touch of the shared `traded` map
+    holds traded_lock. Returns True if a trade was placed.
+    """
+    market_id = market["market_id"]
+    try:
+        signal = bot.make_decision(market, signals)
+
+        # Skip if bot sees no edge
+        if signal.action == "skip":
+            with traded_lock:
+                traded[bot.name].add(market_id)
+            bot_mode = db.get_bot_mode(bot.name)
+            if bot_mode == "live":
+                logger.info("[%s] SKIP price=%.3f | %s", bot.name, market.get("current_price", 0), signal.reasoning)
+            else:
+                logger.debug("[%s] skip | %s", bot.name, signal.reasoning)
+            return False
+
+        result = bot.execute(signal, market, cfg)
+        with traded_lock:
+            traded[bot.name].add(market_id)
+        if result.get("success"):
+            logger.info(f"[{bot.name}] {signal.side.upper()} ${signal.suggested_amount:.2f} (conf={signal.confidence:.2f}) on {market.get('question', '')[:50]}")
+            return True
+        logger.warning(f"[{bot.name}] Trade failed on {market_id}: {result.get('reason')}")
+    except Exception as e:
+        logger.error(f"[{bot.name}] Error on {market_id}: {e}")
+        with traded_lock:
+            traded[bot.name].add(market_id)
+    return False
+
+
+def _run_bot_on_markets(bot, markets, traded, traded_lock, cfg=None):
+    """Run one taker bot over (market, signals) pairs, one market at a time.
+
+    The unit of work the arena's pool runs: BaseBot keeps per-bot mode state
+    that execute() re-binds, so one bot's markets stay on one worker.
+    Returns the number of trades placed.
+    """
+    return sum(
+        _run_bot_on_market(bot, market, signals, traded, traded_lock, cfg)
+        for market, signals in markets
+    )
+
+
+def run_maker_section(maker_bot, market, signals, traded, cfg=None):
     """Run one BtcMakerBot paper-trading cycle on a single market.
 
     Always paper-only: the bot's trading_mode is forced to 'paper' before every
@@ -376,16 +510,16 @@ def run_maker_section(maker_bot, market, signals, traded):
     Polymarket orders are ever placed from here.
 
     Logs maker metrics (edge, bid, ask) on every cycle regardless of whether a
-    trade is placed.
+    trade is placed; bid/ask are omitted when the bot returned no quote.
 
     Returns True if a paper trade was recorded, False otherwise.
     """
     # --- Safety: enforce paper mode unconditionally ---
     maker_bot.trading_mode = "paper"
 
-    market_id = market.get("id") or market.get("market_id")
-    key = (maker_bot.name, market_id)
-    if key in traded:
+    market_id = market["market_id"]
+    maker_traded = traded[maker_bot.name]
+    if market_id in maker_traded:
         return False
 
     try:
@@ -396,36 +530,39 @@ def run_maker_section(maker_bot, market, signals, traded):
         signal = maker_bot.analyze(market, signals)
 
         market_price = market.get("current_price", 0.5)
-        maker_bid = signal.get("maker_bid")
-        maker_ask = signal.get("maker_ask")
-        maker_mid = signal.get("maker_mid")
+        maker_bid = signal.maker_bid
+        maker_ask = signal.maker_ask
+        maker_mid = signal.maker_mid
         maker_side = signal.get("maker_side", "both")
         edge_bps = abs((maker_mid or market_price) - market_price) * 10000 if maker_mid is not None else 0.0
 
-        # Always log maker metrics so we can track quoting behaviour over time
+        # Always log maker metrics so we can track quoting behaviour over time.
+        # Holds outside a bot's window (LateWindowMaker) carry no quotes.
+        quotes = (
+            f"bid={maker_bid:.3f} ask={maker_ask:.3f} mid={maker_mid:.3f} "
+            if maker_mid is not None else "no quote "
+        )
         maker_logger.info(
             f"[{maker_bot.name}] market={market_id[:12]}... "
             f"price={market_price:.3f} "
-            f"bid={maker_bid:.3f} ask={maker_ask:.3f} mid={maker_mid:.3f} "
+            f"{quotes}"
             f"edge={edge_bps:.1f}bps lean={maker_side} "
-            f"conf={signal.get('confidence', 0.0):.3f}"
+            f"conf={signal.confidence:.3f}"
         )
 
-        if signal.get("action") == "hold":
+        if signal.action == "hold":
             # Edge too thin — skip, but still mark as visited this cycle
-            traded.add(key)
-            maker_logger.debug(
-                f"[{maker_bot.name}] HOLD (edge too thin): {signal.get('reasoning', '')}"
-            )
+            maker_traded.add(market_id)
+            maker_logger.debug("[%s] HOLD (edge too thin): %s", maker_bot.name, signal.reasoning)
             return False
 
         # Paper execute — records a simulated fill via Simmer
-        result = maker_bot.execute(signal, market)
-        traded.add(key)
+        result = maker_bot.execute(signal, market, cfg)
+        maker_traded.add(market_id)
 
         if result.get("success"):
             maker_logger.info(
-                f"[{maker_bot.name}] PAPER {signal['side'].upper()} "
+                f"[{maker_bot.name}] PAPER {signal.side.upper()} "
                 f"${signal.get('suggested_amount', 0):.2f} "
                 f"bid={maker_bid:.3f} ask={maker_ask:.3f} edge={edge_bps:.1f}bps "
                 f"on {market.get('question', '')[:50]}"
@@ -439,7 +576,7 @@ def run_maker_section(maker_bot, market, signals, traded):
 
     except Exception as e:
         maker_logger.error(f"[{maker_bot.name}] Maker section error on {market_id}: {e}")
-        traded.add(key)
+        maker_traded.add(market_id)
         return False
 
 
@@ -521,7 +658,6 @@ def _create_maker_bots():
 
 def resolve_trades(api_key):
     """Check Simmer for resolved markets and update trade outcomes."""
-    import requests
     try:
         headers = {"Authorization": f"Bearer {api_key}"}
 
@@ -535,10 +671,10 @@ def resolve_trades(api_key):
             return 0
 
         # Get unique market IDs we need to check
-        market_ids = list({t["market_id"] for t in pending})
+        market_id_set = {t["market_id"] for t in pending}
 
         # Fetch resolved markets from Simmer
-        resp = requests.get(
+        resp = _session.get(
             f"{config.SIMMER_BASE_URL}/api/sdk/markets",
             headers=headers,
             params={"status": "resolved", "limit": 200},
@@ -547,20 +683,21 @@ def resolve_trades(api_key):
         if resp.status_code != 200:
             return 0
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         markets_list = data if isinstance(data, list) else data.get("markets", [])
 
         # Build lookup: market_id -> market with outcome
         resolved_map = {}
         for m in markets_list:
             mid = m.get("id") or m.get("market_id")
-            if mid in market_ids:
+            if mid in market_id_set:
                 resolved_map[mid] = m
 
         if not resolved_map:
             return 0
 
-        count = 0
+        resolutions = []
+        outcomes = []
         for trade in pending:
             market_id = trade["market_id"]
             if market_id not in resolved_map:
@@ -579,13 +716,10 @@ def resolve_trades(api_key):
             except (IndexError, KeyError):
                 shares = 0
 
-            # Did this bot's voted side win?
-            if side == "yes":
-                won = market_outcome is True
-            else:
-                won = market_outcome is False
+            # Did this bot's voted side win? (YES wins on True, NO on False)
+            won = market_outcome is (side == db.Side.YES)
 
-            outcome = "win" if won else "loss"
+            outcome = db.Outcome.WIN if won else db.Outcome.LOSS
 
             # P&L: win = shares pay $1 each minus cost; loss = lose entire cost
             if shares > 0:
@@ -593,7 +727,7 @@ def resolve_trades(api_key):
             else:
                 pnl = 0  # This bot voted but wasn't the executor
 
-            db.resolve_trade(trade["id"], outcome, pnl)
+            resolutions.append((trade["id"], outcome, pnl))
 
             # Learn from outcome using features captured AT TRADE TIME (not resolution time)
             try:
@@ -611,10 +745,14 @@ def resolve_trades(api_key):
                 features = None
 
             if features:
-                learning.record_outcome(trade["bot_name"], features, side, won)
+                outcomes.append((trade["bot_name"], features, side, won))
 
-            count += 1
+        # Flush the whole burst in one transaction instead of a connection +
+        # commit per trade; learning updates are written in the background
+        db.resolve_trades_bulk(resolutions)
+        learning.record_outcomes_async(outcomes)
 
+        count = len(resolutions)
         if count > 0:
             logger.info(f"Resolved {count} trades ({sum(1 for t in pending if resolved_map.get(t['market_id']))} pending matched {len(resolved_map)} resolved markets)")
         return count
@@ -627,9 +765,8 @@ def resolve_trades(api_key):
 def load_bot_keys():
     """Load per-bot API keys. Returns dict of bot_name -> api_key."""
     try:
-        with open(config.SIMMER_BOT_KEYS_PATH) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return orjson.loads(Path(config.SIMMER_BOT_KEYS_PATH).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {}
 
 
@@ -691,19 +828,12 @@ class PositionMonitorThread(threading.Thread):
 
     def _fetch_market_prices(self):
         """Fetch current prices for all active markets from Simmer."""
-        import requests
         try:
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            resp = requests.get(
-                f"{config.SIMMER_BASE_URL}/api/sdk/markets",
-                headers=headers,
-                params={"status": "active", "limit": 100},
-                timeout=5,
+            markets_list = fetch_active_markets(
+                self.api_key, max_age=FAST_POLL_INTERVAL, timeout=5
             )
-            if resp.status_code != 200:
+            if markets_list is None:
                 return {}
-            data = resp.json()
-            markets_list = data if isinstance(data, list) else data.get("markets", [])
             return {
                 (m.get("id") or m.get("market_id")): m.get("current_price")
                 for m in markets_list
@@ -755,7 +885,7 @@ class PositionMonitorThread(threading.Thread):
 
             entry_price = amount / shares
 
-            if side == "yes":
+            if side == db.Side.YES:
                 current_share_price = current_yes_price
             else:
                 current_share_price = 1.0 - current_yes_price
@@ -776,7 +906,7 @@ class PositionMonitorThread(threading.Thread):
                 exit_reason = f"exit_tp ({pnl_pct:+.1%})"
 
             if exit_reason and exit_pnl is not None:
-                outcome = "exit_tp" if "tp" in exit_reason else "exit_sl"
+                outcome = db.Outcome.EXIT_TP if "tp" in exit_reason else db.Outcome.EXIT_SL
                 db.resolve_trade(trade["id"], outcome, exit_pnl)
                 logger.info(
                     f"[{trade['bot_name']}] EARLY EXIT: {exit_reason} on {market_id[:12]}... "
@@ -798,7 +928,7 @@ class PositionMonitorThread(threading.Thread):
 
                 if features:
                     won = exit_pnl > 0
-                    learning.record_outcome(trade["bot_name"], features, side, won)
+                    learning.record_outcomes_async([(trade["bot_name"], features, side, won)])
 
     def run(self):
         """Main monitor loop — polls every 0.5s."""
@@ -833,6 +963,17 @@ class PositionMonitorThread(threading.Thread):
                 self._stop_event.wait(2)
 
 
+def _sleep_remaining(cycle_start, interval):
+    """Sleep out what's left of interval since cycle_start (a monotonic time).
+
+    Keeps the loop on a steady cadence instead of adding a fixed sleep on top
+    of however long the cycle's work took. Returns the work time in seconds.
+    """
+    elapsed = time.monotonic() - cycle_start
+    time.sleep(max(0.0, interval - elapsed))
+    return elapsed
+
+
 def main_loop(bots, api_key):
     """Main trading loop — each bot trades independently on its own Simmer account."""
     price_feed = get_price_feed()
@@ -864,16 +1005,17 @@ def main_loop(bots, api_key):
     # Throttle resolve/expire — only run every RESOLVE_INTERVAL
     last_resolve_time = 0  # Run immediately on first iteration
 
-    # Load recently traded (bot_name, market_id) pairs from DB to prevent
-    # duplicate trades across restarts. 1h lookback is enough for 5-min markets.
-    traded = set()
+    # Load recently traded market_ids per bot from DB to prevent duplicate
+    # trades across restarts. 1h lookback is enough for 5-min markets.
+    traded: dict[str, set[str]] = defaultdict(set)
+    traded_lock = threading.Lock()
     with db.get_conn() as conn:
         recent = conn.execute(
             "SELECT bot_name, market_id FROM trades WHERE created_at >= datetime('now', '-1 hours')"
         ).fetchall()
         for r in recent:
-            traded.add((r["bot_name"], r["market_id"]))
-    logger.info(f"Loaded {len(traded)} recent trade keys from DB (dedup across restarts)")
+            traded[r["bot_name"]].add(r["market_id"])
+    logger.info(f"Loaded {len(recent)} recent trade keys from DB (dedup across restarts)")
 
     # Load per-bot API keys and assign slots
     bot_keys = load_bot_keys()
@@ -903,7 +1045,10 @@ def main_loop(bots, api_key):
     pos_monitor.update_bots(bots)
     pos_monitor.start()
 
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="arena-worker")
+
     while True:
+        cycle_start = time.monotonic()
         try:
             # Check for evolution
             if time.time() - last_evolution >= evolution_interval:
@@ -922,14 +1067,17 @@ def main_loop(bots, api_key):
             # Resolve completed trades + expire stale (throttled to every 60s)
             now = time.time()
             if now - last_resolve_time >= RESOLVE_INTERVAL:
-                if multi_account:
-                    for slot_key in set(bot_keys.values()):
-                        resolve_trades(slot_key)
-                else:
-                    resolve_trades(api_key)
+                # The resolved-markets listing is the same for every account and
+                # pending trades are read across all bots, so one fetch covers
+                # every slot (any key works for read-only)
+                resolve_trades(api_key)
                 expire_stale_trades()
                 last_resolve_time = now
 
+            # Mode-dependent limits + today's losses (after resolution), read
+            # once and shared by every execute() this tick
+            cfg = config.snapshot(daily_losses=db.get_daily_losses())
+
             # Discover active markets (any key works for read-only)
             markets = discover_markets(api_key)
 
@@ -946,20 +1094,21 @@ def main_loop(bots, api_key):
                         copy_markets_by_token[_yt] = _m
                     if _nt:
                         copy_markets_by_token[_nt] = _m
-                for copy_bot in copy_bots:
-                    try:
-                        n = copy_bot.check_and_copy(copy_markets_by_token, api_key)
-                        if n > 0:
-                            logger.info(
-                                f"Copy bot [{copy_bot.label}]: mirrored {n} trades this cycle"
-                            )
-                    except Exception as e:
-                        logger.error(f"Copy bot [{copy_bot.label}] error: {e}")
+                # Each bot polls its own wallet — run them side by side so the
+                # section costs one activity round-trip, not one per wallet
+                list(executor.map(
+                    functools.partial(
+                        _run_copy_bot,
+                        markets_by_token=copy_markets_by_token,
+                        api_key=api_key,
+                    ),
+                    copy_bots,
+                ))
 
             if not markets:
                 logger.debug("No active 5-min markets found, waiting...")
                 # Position monitor thread handles SL/TP independently
-                time.sleep(30)
+                _sleep_remaining(cycle_start, 30)
                 continue
 
             # Accept all discovered BTC up/down markets regardless of window duration
@@ -1016,7 +1165,7 @@ def main_loop(bots, api_key):
 
             if not tradeable_markets:
                 logger.debug("No eligible markets found, waiting...")
-                time.sleep(TRADE_INTERVAL)
+                _sleep_remaining(cycle_start, TRADE_INTERVAL)
                 continue
 
             # Trade ALL eligible markets, sorted soonest-first
@@ -1024,7 +1173,7 @@ def main_loop(bots, api_key):
             selected_market = tradeable_markets[0]  # used for maker section (one market at a time)
 
             for m in tradeable_markets:
-                mid = m.get("id") or m.get("market_id")
+                mid = m["market_id"]
                 tr = m.get("time_remaining_seconds")
                 ct = m.get("resolves_at") or m.get("end_time") or "unknown"
                 price = m.get("current_price", "?")
@@ -1045,57 +1194,54 @@ def main_loop(bots, api_key):
                     markets_by_token[no_tok] = m
 
             # Gather signals
+            # BTC candles (float64 arrays from the feed) are the same for
+            # every market and bot this tick
             price_signals = price_feed.get_signals("btc")
+            # Indicators (EMA, RSI, z-score, ...) memoised across all bots and
+            # markets this tick
+            price_signals["indicators"] = indicators.FeatureCache(
+                price_signals["prices"], price_signals["volumes"])
+            # Buy sizing reads the tick's snapshot, not config, per decision
+            price_signals["max_position"] = cfg.max_position
             sent_signals = sentiment_feed.get_signals("btc")
 
-            new_trades = 0
-            for market in five_min_markets:
-                market_id = market.get("id") or market.get("market_id")
-                of_signals = orderflow_feed.get_signals(market_id, api_key)
-
-                # Polymarket YES price momentum — rate of change in the market's
-                # own prediction price over the last few minutes
-                yes_token = market.get("polymarket_token_id", "")
-                pm_data = pm_price_feed.get_momentum(yes_token) if yes_token else {}
-                pm_signals = {"pm_momentum": pm_data.get("momentum", 0.0),
-                              "pm_prices": pm_data.get("prices", [])}
-                if pm_data.get("fresh") and pm_data.get("prices"):
-                    logger.debug(
-                        f"PM momentum for {market.get('question','')[:40]}: "
-                        f"{pm_data['momentum']:+.4f} prices={pm_data['prices']}"
-                    )
-
-                combined_signals = {**price_signals, **sent_signals, **of_signals, **pm_signals}
-
-                # Each bot trades independently on its own account
-                for bot in bots:
-                    key = (bot.name, market_id)
-                    if key in traded:
-                        continue
-
-                    try:
-                        signal = bot.make_decision(market, combined_signals)
-
-                        # Skip if bot sees no edge
-                        if signal.get("action") == "skip":
-                            traded.add(key)
-                            bot_mode = db.get_bot_mode(bot.name)
-                            if bot_mode == "live":
-                                logger.info(f"[{bot.name}] SKIP price={market.get('current_price', 0):.3f} | {signal.get('reasoning', '')}")
-                            else:
-                                logger.debug(f"[{bot.name}] skip | {signal.get('reasoning', '')}")
-                            continue
+            # Per-market signals are independent HTTP calls — fetch them concurrently
+            market_signals = list(executor.map(
+                functools.partial(
+                    _fetch_market_signals,
+                    orderflow_feed=orderflow_feed,
+                    pm_price_feed=pm_price_feed,
+                    api_key=api_key,
+                ),
+                five_min_markets,
+            ))
 
-                        result = bot.execute(signal, market)
-                        traded.add(key)
-                        if result.get("success"):
-                            new_trades += 1
-                            logger.info(f"[{bot.name}] {signal['side'].upper()} ${signal['suggested_amount']:.2f} (conf={signal['confidence']:.2f}) on {market.get('question', '')[:50]}")
-                        else:
-                            logger.warning(f"[{bot.name}] Trade failed on {market_id}: {result.get('reason')}")
-                    except Exception as e:
-                        logger.error(f"[{bot.name}] Error on {market_id}: {e}")
-                        traded.add(key)
+            # Decide + execute fans out per bot: different bots' trade
+            # round-trips overlap, while each bot works through its markets in
+            # order, so a bot never has two execute() calls in flight
+            bot_markets = {bot: [] for bot in bots}
+            for market, extra_signals in zip(five_min_markets, market_signals):
+                market_id = market["market_id"]
+                combined_signals = {**price_signals, **sent_signals, **extra_signals}
+
+                with traded_lock:
+                    pending_bots = [b for b in bots if market_id not in traded[b.name]]
+                if not pending_bots:
+                    continue
+                # Momentum, features and every bot's learned bias in one pass
+                combined_signals["market_context"] = BaseBot.prepare_decisions(
+                    pending_bots, market, combined_signals
+                )
+                for bot in pending_bots:
+                    bot_markets[bot].append((market, combined_signals))
+            trade_futures = [
+                executor.submit(
+                    _run_bot_on_markets, bot, bot_markets[bot],
+                    traded, traded_lock, cfg,
+                )
+                for bot in bots if bot_markets[bot]
+            ]
+            new_trades = sum(f.result() for f in trade_futures)
 
             if new_trades > 0:
                 logger.info(f"Placed {new_trades} new trades this cycle")
@@ -1104,13 +1250,17 @@ def main_loop(bots, api_key):
             # Runs after taker bots so it never blocks taker execution.
             maker_trades = 0
             for maker_bot in maker_bots:
-                if run_maker_section(maker_bot, selected_market, combined_signals, traded):
+                if run_maker_section(maker_bot, selected_market, combined_signals, traded, cfg):
                     maker_trades += 1
             if maker_trades > 0:
                 maker_logger.info(f"Maker section placed {maker_trades} paper trades this cycle")
 
             # Position monitor thread polls Simmer every 0.5s for SL/TP
-            time.sleep(TRADE_INTERVAL)
+            elapsed = _sleep_remaining(cycle_start, TRADE_INTERVAL)
+            if elapsed > TRADE_INTERVAL:
+                logger.warning(f"Cycle took {elapsed:.1f}s (interval {TRADE_INTERVAL}s)")
+            else:
+                logger.debug(f"Cycle took {elapsed:.1f}s")
 
         except KeyboardInterrupt:
             logger.info("Arena stopped by user")
@@ -1119,6 +1269,10 @@ def main_loop(bots, api_key):
             logger.error(f"Arena loop error: {e}")
             time.sleep(10)
 
+    executor.shutdown(wait=False)
+    db.flush_trades()
+    learning.flush_outcomes()
+
 
 def main():
     parser = argparse.ArgumentParser(description="Polymarket Bot Arena")
@@ -0,0 +1,69 @@
+"""Compact Bloom filter for copy-trading dedup keys.
+
+A wallet's seen {tx_hash}:{asset} keys only ever grow, so holding them in a
+set costs ~100 bytes per key for the life of the arena. A Bloom filter answers
+the same membership test in a few bytes per key. A false positive makes us
+skip a trade we never copied, which is the safe direction; we never copy a
+trade twice. The DB stays the source of truth across restarts.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over str keys (blake2b double hashing)."""
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "_bits", "_count")
+
+    def __init__(self, capacity=20_000, error_rate=1e-6):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def copy(self):
+        """An independent filter with the same shape and contents."""
+        other = BloomFilter.__new__(BloomFilter)
+        other.capacity = self.capacity
+        other.error_rate = self.error_rate
+        other.num_bits = self.num_bits
+        other.num_hashes = self.num_hashes
+        other._bits = bytearray(self._bits)
+        other._count = self._count
+        return other
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key):
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def update(self, keys):
+        """Add every key in an iterable, or merge another filter of the same shape."""
+        if isinstance(keys, BloomFilter):
+            if (keys.num_bits, keys.num_hashes) != (self.num_bits, self.num_hashes):
+                raise ValueError("cannot merge Bloom filters of different sizes")
+            merged = int.from_bytes(self._bits, "little") | int.from_bytes(keys._bits, "little")
+            self._bits = bytearray(merged.to_bytes(len(self._bits), "little"))
+            self._count += keys._count
+            return
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self):
+        """Number of keys added (an upper bound on distinct keys)."""
+        return self._count
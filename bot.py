@@ -9,21 +9,34 @@
 NOTE: This is a skeleton. It does NOT place real trades.
 """
 
+import atexit
 import time
-import json
 import math
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
+import orjson
 import requests
 
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy is optional; ema() falls back to the scalar recurrence
+    lfilter = None
+
 BASE_DIR = pathlib.Path(__file__).resolve().parent
 STATE_FILE = BASE_DIR / "state.json"
 TRADES_FILE = BASE_DIR / "trades.jsonl"
 EQUITY_FILE = BASE_DIR / "equity.jsonl"
 
+# Long-lived unbuffered handles, opened on first write: one open per run
+# instead of per write, and every JSON line reaches the OS in a single write()
+# as soon as it is complete. Importing the module creates no files.
+_LOG_HANDLES = {}
+
 INITIAL_EQUITY = 1000.0
 FEE_RATE = 0.001  # 0.1% per side
 
@@ -38,6 +51,9 @@ OHLC_API = "https://api.binance.com/api/v3/klines"
 INTERVAL = "1h"
 LIMIT = 200
 
+# Keep-alive session: one TCP+TLS handshake to Binance, reused every tick
+_SESSION = requests.Session()
+
 
 @dataclass
 class Position:
@@ -62,7 +78,7 @@ def now_iso() -> str:
 
 def load_state() -> AccountState:
     if STATE_FILE.exists():
-        data = json.loads(STATE_FILE.read_text())
+        data = orjson.loads(STATE_FILE.read_bytes())
         pos = data.get("position")
         position = Position(**pos) if pos else None
         return AccountState(equity=data["equity"], position=position)
@@ -70,92 +86,129 @@ def load_state() -> AccountState:
 
 
 def save_state(state: AccountState) -> None:
-    STATE_FILE.write_text(json.dumps({
+    STATE_FILE.write_bytes(orjson.dumps({
         "equity": state.equity,
         "position": asdict(state.position) if state.position else None,
     }))
 
 
+def _append_jsonl(path: pathlib.Path, record: dict) -> None:
+    fh = _LOG_HANDLES.get(path)
+    if fh is None:
+        fh = _LOG_HANDLES[path] = path.open("ab", buffering=0)
+        atexit.register(fh.close)
+    fh.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+
 def log_trade(record: dict) -> None:
-    with TRADES_FILE.open("a") as f:
-        f.write(json.dumps(record) + "\n")
+    _append_jsonl(TRADES_FILE, record)
 
 
 def log_equity(equity: float) -> None:
-    rec = {"timestamp": now_iso(), "equity": equity}
-    with EQUITY_FILE.open("a") as f:
-        f.write(json.dumps(rec) + "\n")
+    _append_jsonl(EQUITY_FILE, {"timestamp": now_iso(), "equity": equity})
+
 
+def fetch_ohlc(symbol: str) -> Dict[str, np.ndarray]:
+    """Fetch 1h OHLC for a symbol via Binance (used as proxy).
 
-def fetch_ohlc(symbol: str) -> List[dict]:
-    """Fetch 1h OHLC for a symbol via Binance (used as proxy)."""
+    Returns parallel arrays: "time" (open time, epoch ms, int64) and
+    "open"/"high"/"low"/"close" (float64), oldest first.
+    """
     params = {"symbol": symbol, "interval": INTERVAL, "limit": LIMIT}
-    resp = requests.get(OHLC_API, params=params, timeout=10)
+    resp = _SESSION.get(OHLC_API, params=params, timeout=10)
     resp.raise_for_status()
-    raw = resp.json()
-    candles = []
-    for k in raw:
-        open_time = datetime.fromtimestamp(k[0] / 1000, tz=timezone.utc)
-        candles.append({
-            "time": open_time,
-            "open": float(k[1]),
-            "high": float(k[2]),
-            "low": float(k[3]),
-            "close": float(k[4]),
-        })
-    return candles
-
-
-def ema(values: List[float], period: int) -> List[float]:
+    raw = orjson.loads(resp.content)
+    if not raw:
+        empty = np.empty(0, dtype=np.float64)
+        return {"time": np.empty(0, dtype=np.int64), "open": empty, "high": empty, "low": empty, "close": empty}
+    # kline rows are [open_time, "open", "high", "low", "close", ...]
+    arr = np.array([k[:5] for k in raw], dtype=object)
+    ohlc = arr[:, 1:5].astype(np.float64)
+    return {
+        "time": arr[:, 0].astype(np.int64),
+        "open": ohlc[:, 0],
+        "high": ohlc[:, 1],
+        "low": ohlc[:, 2],
+        "close": ohlc[:, 3],
+    }
+
+
+def _try_fetch_ohlc(symbol: str):
+    """fetch_ohlc() for the worker pool: returns (candles, None) or (None, error)."""
+    try:
+        return fetch_ohlc(symbol), None
+    except Exception as e:
+        return None, e
+
+
+def ema(values, period: int) -> np.ndarray:
+    """EMA seeded with the simple average of the first `period` values."""
+    values = np.asarray(values, dtype=np.float64)
     k = 2 / (period + 1)
-    result = []
-    ema_prev = sum(values[:period]) / period
-    result.extend([ema_prev] * period)
-    for v in values[period:]:
-        ema_prev = v * k + ema_prev * (1 - k)
-        result.append(ema_prev)
+    seed = values[:period].sum() / period
+    result = np.empty_like(values)
+    result[:period] = seed
+    tail = values[period:]
+    if tail.size:
+        if lfilter is not None:
+            # y[n] = k*x[n] + (1-k)*y[n-1], with y[-1] = seed
+            result[period:], _ = lfilter([k], [1.0, k - 1.0], tail, zi=[seed * (1 - k)])
+        else:
+            ema_prev = seed
+            for i, v in enumerate(tail.tolist(), start=period):
+                ema_prev = v * k + ema_prev * (1 - k)
+                result[i] = ema_prev
     return result
 
 
-def atr(candles: List[dict], period: int) -> List[float]:
-    trs = []
-    for i in range(len(candles)):
-        c = candles[i]
-        if i == 0:
-            tr = c["high"] - c["low"]
-        else:
-            prev_close = candles[i - 1]["close"]
-            tr = max(
-                c["high"] - c["low"],
-                abs(c["high"] - prev_close),
-                abs(c["low"] - prev_close),
-            )
-        trs.append(tr)
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Simple (unsmoothed) ATR; the first period-1 entries are the raw true range."""
+    tr = high - low
+    if tr.size > 1:
+        prev_close = close[:-1]
+        tr[1:] = np.maximum.reduce([
+            tr[1:],
+            np.abs(high[1:] - prev_close),
+            np.abs(low[1:] - prev_close),
+        ])
     # simple ATR for v0.1
-    atrs = []
-    for i in range(len(trs)):
-        if i + 1 < period:
-            atrs.append(trs[i])
-        else:
-            atrs.append(sum(trs[i + 1 - period: i + 1]) / period)
+    atrs = tr.copy()
+    if tr.size >= period:
+        csum = np.concatenate(([0.0], np.cumsum(tr)))
+        atrs[period - 1:] = (csum[period:] - csum[:-period]) / period
     return atrs
 
 
-def decide_entry(candles: List[dict], state: AccountState, pair_label: str) -> Optional[Position]:
-    """Decide whether to open a long or short position based on v0.1.1 rules."""
-    closes = [c["close"] for c in candles]
-    ema20 = ema(closes, 20)
-    ema50 = ema(closes, 50)
-    atr14 = atr(candles, 14)
+def compute_indicators(candles: Dict[str, np.ndarray]) -> dict:
+    """EMA20/EMA50/ATR14 for one symbol, computed once per tick and shared by
+    decide_entry(), check_exit() and the scan scoring."""
+    highs, lows, closes = candles["high"], candles["low"], candles["close"]
+    return {
+        "closes": closes,
+        "ema20": ema(closes, 20),
+        "ema50": ema(closes, 50),
+        "atr14": atr(highs, lows, closes, 14),
+    }
+
+
+def decide_entry(candles: Dict[str, np.ndarray], indicators: dict, state: AccountState, pair_label: str) -> Optional[Tuple[Position, float]]:
+    """Decide whether to open a long or short position based on v0.1.1 rules.
+
+    Returns (position, trend_strength) so callers can rank candidates
+    without recomputing the EMAs.
+    """
+    closes = indicators["closes"]
+    ema20 = indicators["ema20"]
+    ema50 = indicators["ema50"]
+    atr14 = indicators["atr14"]
 
-    c = candles[-1]
-    close = c["close"]
-    e20 = ema20[-1]
-    e50 = ema50[-1]
-    a14 = atr14[-1]
+    close = float(closes[-1])
+    e20 = float(ema20[-1])
+    e50 = float(ema50[-1])
+    a14 = float(atr14[-1])
 
-    swing_high = max(closes[-20:])
-    swing_low = min(closes[-20:])
+    swing_high = closes[-20:].max()
+    swing_low = closes[-20:].min()
 
     vol_ratio = a14 / close if close > 0 else 0
     if not (0.005 <= vol_ratio <= 0.10):
@@ -201,7 +254,7 @@ def decide_entry(candles: List[dict], state: AccountState, pair_label: str) -> O
 
     notional = size_base * entry_price
 
-    return Position(
+    pos = Position(
         side=side,
         entry_price=entry_price,
         size_base=size_base,
@@ -210,20 +263,20 @@ def decide_entry(candles: List[dict], state: AccountState, pair_label: str) -> O
         stop_price=stop_price,
         open_time=now_iso(),
     )
+    return pos, ts
 
 
-def check_exit(candles: List[dict], pos: Position, equity: float, pair_label: str) -> Optional[dict]:
+def check_exit(candles: Dict[str, np.ndarray], indicators: dict, pos: Position, equity: float, pair_label: str) -> Optional[dict]:
     """Return trade record if position should be closed, else None."""
-    closes = [c["close"] for c in candles]
-    ema20 = ema(closes, 20)
-    ema50 = ema(closes, 50)
-    atr14 = atr(candles, 14)
+    closes = indicators["closes"]
+    ema20 = indicators["ema20"]
+    ema50 = indicators["ema50"]
+    atr14 = indicators["atr14"]
 
-    c = candles[-1]
-    close = c["close"]
-    e20 = ema20[-1]
-    e50 = ema50[-1]
-    a14 = atr14[-1]
+    close = float(closes[-1])
+    e20 = float(ema20[-1])
+    e50 = float(ema50[-1])
+    a14 = float(atr14[-1])
 
     entry = pos.entry_price
     stop = pos.stop_price
@@ -291,31 +344,32 @@ def check_exit(candles: List[dict], pos: Position, equity: float, pair_label: st
 def main_loop():
     state = load_state()
     print(f"Starting bot – equity {state.equity:.2f} USDC")
+    fetch_pool = ThreadPoolExecutor(max_workers=len(SYMBOLS))
 
     while True:
+        tick_start = time.monotonic()
         # log equity every tick
         log_equity(state.equity)
 
         best_signal = None
+        scanned = {}  # symbol -> (candles, indicators) fetched this tick
 
         # scan multiple symbols, choose the strongest signal by trend strength
-        for sym in SYMBOLS:
-            try:
-                candles = fetch_ohlc(sym["symbol"])
-            except Exception as e:
-                print(f"Error fetching data for {sym['symbol']}:", e)
+        # (all symbols are fetched concurrently: one RTT per tick, not one per symbol)
+        fetched = fetch_pool.map(_try_fetch_ohlc, [sym["symbol"] for sym in SYMBOLS])
+        for sym, (candles, err) in zip(SYMBOLS, fetched):
+            if err is not None:
+                print(f"Error fetching data for {sym['symbol']}:", err)
                 continue
 
-            pos_candidate = decide_entry(candles, state, sym["pair"])
-            if not pos_candidate:
-                continue
+            indicators = compute_indicators(candles)
+            scanned[sym["symbol"]] = (candles, indicators)
 
-            closes = [c["close"] for c in candles]
-            ema20 = ema(closes, 20)
-            ema50 = ema(closes, 50)
-            ts = abs(ema20[-1] - ema50[-1]) / closes[-1]
+            res = decide_entry(candles, indicators, state, sym["pair"])
+            if not res:
+                continue
+            pos_candidate, score = res
 
-            score = ts
             if best_signal is None or score > best_signal["score"]:
                 best_signal = {"pos": pos_candidate, "pair": sym["pair"], "score": score}
 
@@ -328,14 +382,18 @@ def main_loop():
         else:
             # manage existing position using SOL candles as proxy
             # TODO: per-pair state; for v0.2 we reuse the first symbol's data
-            try:
-                candles = fetch_ohlc(SYMBOLS[0]["symbol"])
-            except Exception as e:
-                print("Error fetching data for exit check:", e)
-                time.sleep(60)
-                continue
-
-            res = check_exit(candles, state.position, state.equity, state.position.side + " " + "multi")
+            if SYMBOLS[0]["symbol"] in scanned:
+                candles, indicators = scanned[SYMBOLS[0]["symbol"]]
+            else:
+                try:
+                    candles = fetch_ohlc(SYMBOLS[0]["symbol"])
+                except Exception as e:
+                    print("Error fetching data for exit check:", e)
+                    time.sleep(60)
+                    continue
+                indicators = compute_indicators(candles)
+
+            res = check_exit(candles, indicators, state.position, state.equity, state.position.side + " " + "multi")
             if res:
                 rec = res["record"]
                 state.equity = res["new_equity"]
@@ -344,7 +402,9 @@ def main_loop():
                 state.position = None
                 save_state(state)
 
-        time.sleep(60)
+        # sleep out the rest of the minute so ticks stay 60s apart
+        elapsed = time.monotonic() - tick_start
+        time.sleep(max(0.0, 60 - elapsed))
 
 
 if __name__ == "__main__":
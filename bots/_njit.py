@@ -0,0 +1,17 @@
+"""Optional Numba JIT for the bots' numeric hot paths.
+
+``njit`` is numba's when it is installed. Otherwise it is a no-op decorator
+and the kernels run as plain Python with identical results.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -3,19 +3,170 @@
 import json
 import random
 import copy
+import functools
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 import sys
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import config
 import db
 import learning
 
+try:
+    import polymarket_client
+except ImportError:  # py_clob_client not installed — paper-only deployment
+    polymarket_client = None
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive session shared by every bot's Simmer trade calls, so a trade
+# reuses a warm TLS connection instead of handshaking per POST. Retry only
+# covers connection setup/idempotent requests — a trade POST is never resent.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32, pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+))
+
+# (connect, read) for trade POSTs. The read side stays at 30s: Simmer can
+# accept a trade slowly, and a trade we time out on is never logged.
+TRADE_TIMEOUT = (3, 30)
+
+
+def error_snippet(resp, limit=150):
+    """First `limit` chars of an error body, then drop the connection.
+
+    Expects a stream=True response, so only one 512-byte chunk is read
+    instead of downloading a large error payload to log its head.
+    """
+    try:
+        chunk = next(resp.iter_content(512), b"")
+        return chunk.decode("utf-8", errors="replace")[:limit]
+    finally:
+        resp.close()
+
+
+def _file_stamp(path):
+    """(mtime_ns, size) of path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _resolve_api_key(bot_name, slot=None):
+    """Simmer API key for a bot: per-bot key, then slot key, then default.
+
+    The key files are re-read only when one of them changes (new slot,
+    setup_multi_account), not on every trade.
+    """
+    return _resolve_api_key_cached(
+        bot_name, slot,
+        _file_stamp(config.SIMMER_BOT_KEYS_PATH),
+        _file_stamp(config.SIMMER_API_KEY_PATH),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_api_key_cached(bot_name, slot, bot_keys_stamp, default_key_stamp):
+    try:
+        with open(config.SIMMER_BOT_KEYS_PATH) as f:
+            bot_keys = json.load(f)
+        if bot_name in bot_keys:
+            return bot_keys[bot_name]
+        # Check by slot assignment (for evolved bots inheriting a slot)
+        if slot is not None and slot in bot_keys:
+            return bot_keys[slot]
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    # Fallback: default key
+    with open(config.SIMMER_API_KEY_PATH) as f:
+        return json.load(f).get("api_key")
+
+
+class LazyReasoning:
+    """Reasoning text formatted only when something reads it.
+
+    Skip/hold reasons are usually dropped (or logged at DEBUG), so they carry
+    the str.format() template + args and pay for float formatting only if
+    str()'d, logged or stored.
+    """
+    __slots__ = ("_fmt", "_args", "_text")
+
+    def __init__(self, fmt, *args):
+        self._fmt = fmt
+        self._args = args
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._fmt.format(*self._args)
+        return self._text
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __getitem__(self, key):
+        return str(self)[key]
+
+    def __repr__(self):
+        return repr(str(self))
+
+
+@dataclass(slots=True)
+class TradeSignal:
+    """A bot's trade decision, as returned by analyze() / make_decision().
+
+    Fields left as None are "not set". For code written against the old dict
+    payload, get() / [] / `in` treat those fields as missing keys.
+    """
+    action: str                        # "buy" | "sell" | "hold" | "skip"
+    side: str = "yes"                  # "yes" | "no"
+    confidence: float = 0.0
+    reasoning: str = ""                # str or LazyReasoning
+    suggested_amount: float = None
+    features: list = None
+    # Maker bots only
+    maker_bid: float = None
+    maker_ask: float = None
+    maker_mid: float = None
+    maker_side: str = None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+    def to_dict(self) -> dict:
+        """Plain dict of the fields that are set."""
+        return {f.name: getattr(self, f.name) for f in fields(self)
+                if getattr(self, f.name) is not None}
+
 
 class BaseBot(ABC):
     name: str
@@ -70,6 +221,12 @@ class BaseBot(ABC):
         "sentiment": 0.03,
         "hybrid": 0.03,
     }
+    # Strategy side → sign of its contribution to the combined signal
+    _YES_MAP = {"yes": 1.0, "no": -1.0}
+    # analyze() sizes every buy off the mode's max position; re-read it at
+    # most this often instead of on every market
+    MAX_POSITION_TTL = 5.0
+    _mp_cache = (float("-inf"), 0.0)  # (monotonic read time, max position)
 
     def __init__(self, name, strategy_type, params, generation=0, lineage=None):
         self.name = name
@@ -79,23 +236,118 @@ class BaseBot(ABC):
         self.lineage = lineage or name
         self._paused = False
         self.trading_mode = "paper"
+        # Per-strategy tuning, resolved once instead of on every decision
+        self._prior = self.STRATEGY_PRIORS.get(strategy_type, 0.5)
+        self._aggression = self.MARKET_PRICE_AGGRESSION.get(strategy_type, 1.0)
+        self._min_conf = self.MIN_TRADE_CONFIDENCE.get(strategy_type, 0.03)
+        self._bind_mode(self.trading_mode)
+
+    def _bind_mode(self, mode):
+        """Specialise execute() for a trading mode.
+
+        Binds the order path and position cap once, so execute() only
+        re-binds when the bot's mode actually changes. The (mode, order path,
+        cap) triple is published in one assignment and returned, so a caller
+        never pairs one mode's order path with another mode's cap.
+        """
+        cap = config.LIVE_MAX_POSITION if mode == "live" else config.PAPER_MAX_POSITION
+        binding = self._binding = (mode, self._order_path(mode), cap)
+        return binding
+
+    def _order_path(self, mode):
+        """The callable execute() places orders through for a mode:
+        (signal, market, amount) -> result dict."""
+        if mode == "live":
+            return functools.partial(self._execute_live, mode=mode)
+        return functools.partial(self._execute_paper, venue="simmer", mode=mode)
+
+    def max_position(self, signals=None):
+        """Max position for sizing a buy.
+
+        The arena puts its tick snapshot's value in signals["max_position"];
+        otherwise config.get_max_position(), cached for MAX_POSITION_TTL seconds.
+        """
+        if signals is not None:
+            value = signals.get("max_position")
+            if value is not None:
+                return value
+        read_at, value = self._mp_cache
+        now = time.monotonic()
+        if now - read_at > self.MAX_POSITION_TTL:
+            value = config.get_max_position()
+            self._mp_cache = (now, value)
+        return value
+
+    def _buy(self, signals, side, confidence, reasoning, **extra):
+        """Buy signal sized at the bot's position_size_pct of max position."""
+        return TradeSignal(
+            action="buy",
+            side=side,
+            confidence=confidence,
+            reasoning=reasoning,
+            suggested_amount=self.max_position(signals) * self.strategy_params["position_size_pct"],
+            **extra,
+        )
 
     @abstractmethod
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         """Analyze market + signals and return a trade signal.
 
         Returns:
-            {
-                "action": "buy" | "sell" | "hold",
-                "side": "yes" | "no",
-                "confidence": 0.0-1.0,
-                "reasoning": "why this trade",
-                "suggested_amount": float,
-            }
+            TradeSignal(
+                action="buy" | "sell" | "hold",
+                side="yes" | "no",
+                confidence=0.0-1.0,
+                reasoning="why this trade",
+                suggested_amount=float,
+            )
         """
         pass
 
-    def make_decision(self, market: dict, signals: dict) -> dict:
+    @staticmethod
+    def market_context(market: dict, signals: dict) -> dict:
+        """Bot-independent inputs to make_decision(): BTC momentum + learning features.
+
+        signals["prices"] may be a list or (from the arena) a float64 ndarray.
+        """
+        market_price = market.get("current_price", 0.5)
+        prices = signals.get("prices", [])
+        btc_latest = signals.get("latest", 0)
+        price_momentum = 0.0
+        if len(prices) >= 2 and prices[-1] > 0:
+            price_momentum = (prices[-1] - prices[-2]) / prices[-2]
+        elif btc_latest > 0 and len(prices) >= 1 and prices[-1] > 0:
+            # Use live price vs last closed candle
+            price_momentum = (btc_latest - prices[-1]) / prices[-1]
+        elif btc_latest > 0 and len(prices) == 0:
+            # No candles yet — use market price direction as weak proxy
+            # Market price > 0.5 suggests BTC trending up in this window
+            price_momentum = (market_price - 0.5) * 0.005
+        price_momentum = float(price_momentum)
+
+        of_data = signals.get("orderflow", {})
+        features = learning.extract_features(
+            market_price, price_momentum,
+            volume=of_data.get("volume_24h"),
+            time_rem=market.get("time_remaining_seconds"),
+        )
+        return {"price_momentum": price_momentum, "features": features}
+
+    @classmethod
+    def prepare_decisions(cls, bots, market: dict, signals: dict) -> dict:
+        """Compute the shared market context once for every bot on a market.
+
+        Momentum and features are the same for all bots, and the learned
+        biases for all of them come from one batched query. Put the result
+        in signals["market_context"] and make_decision() reuses it.
+        """
+        ctx = cls.market_context(market, signals)
+        priors = [b._prior for b in bots]
+        biases = learning.get_learned_bias_batch([b.name for b in bots], ctx["features"], priors)
+        ctx["learned_bias"] = {b.name: float(x) for b, x in zip(bots, biases)}
+        return ctx
+
+    def make_decision(self, market: dict, signals: dict) -> TradeSignal:
         """Make a trading decision using market price edge + strategy + learning.
 
         Signal hierarchy:
@@ -110,50 +362,33 @@ class BaseBot(ABC):
 
         # --- Signal 1: Market price edge ---
         # When YES is priced high, YES usually wins. The further from 50c, the stronger.
-        aggression = self.MARKET_PRICE_AGGRESSION.get(self.strategy_type, 1.0)
-        price_edge = (market_price - 0.5) * aggression
+        price_edge = (market_price - 0.5) * self._aggression
         # price_edge > 0 means lean YES, < 0 means lean NO
 
         # --- Signal 2: BTC momentum ---
-        prices = signals.get("prices", [])
-        btc_latest = signals.get("latest", 0)
-        price_momentum = 0.0
-        if len(prices) >= 2 and prices[-1] > 0:
-            price_momentum = (prices[-1] - prices[-2]) / prices[-2]
-        elif btc_latest > 0 and len(prices) >= 1 and prices[-1] > 0:
-            # Use live price vs last closed candle
-            price_momentum = (btc_latest - prices[-1]) / prices[-1]
-        elif btc_latest > 0 and len(prices) == 0:
-            # No candles yet — use market price direction as weak proxy
-            # Market price > 0.5 suggests BTC trending up in this window
-            price_momentum = (market_price - 0.5) * 0.005
+        ctx = signals.get("market_context") or self.market_context(market, signals)
+        price_momentum = ctx["price_momentum"]
         # Momentum signal: BTC going up → lean YES
         momentum_signal = max(-0.15, min(0.15, price_momentum * 30))
 
         # --- Signal 3: Strategy analysis ---
         raw_signal = self.analyze(market, signals)
         strategy_signal = 0.0
-        if raw_signal["action"] != "hold":
-            strategy_yes = 1.0 if raw_signal["side"] == "yes" else -1.0
-            strategy_signal = strategy_yes * raw_signal["confidence"] * 0.15
+        if raw_signal.action != "hold":
+            strategy_yes = self._YES_MAP.get(raw_signal.side, -1.0)
+            strategy_signal = strategy_yes * raw_signal.confidence * 0.15
 
         # --- Signal 4: Learning bias ---
-        of_data = signals.get("orderflow", {})
-        volume = of_data.get("volume_24h")
-        time_rem = market.get("time_remaining_seconds")
-        
-        features = learning.extract_features(
-            market_price, price_momentum, 
-            volume=volume, time_rem=time_rem
-        )
-        prior = self.STRATEGY_PRIORS.get(self.strategy_type, 0.5)
-        learned_yes_bias = learning.get_learned_bias(self.name, features, prior)
+        features = ctx["features"]
+        learned_yes_bias = ctx.get("learned_bias", {}).get(self.name)
+        if learned_yes_bias is None:
+            learned_yes_bias = learning.get_learned_bias(self.name, features, self._prior)
         # Convert from 0-1 to -0.5 to +0.5
         learning_signal = (learned_yes_bias - 0.5)
 
         # Dynamic learning weight: ramps up as bot accumulates data
         # Capped at 0.30 (was 0.60) — stale inherited data was making all bots identical
-        perf = db.get_bot_performance(self.name, hours=168)
+        perf = db.get_bot_performance_cached(self.name, hours=168)
         total_resolved = perf.get("total_trades", 0)
         learning_weight = min(0.30, 0.05 + total_resolved * 0.005)
 
@@ -182,52 +417,54 @@ class BaseBot(ABC):
         # Data: NO bets lose at EVERY confidence level (44% WR, -$132 all-time).
         # YES-only strategy is strictly better.
         if side == "no":
-            return {
-                "action": "skip",
-                "side": side,
-                "confidence": confidence,
-                "reasoning": f"NO ban: NO bets 44% WR all-time | price={market_price:.2f}",
-                "suggested_amount": 0,
-                "features": features,
-            }
+            return TradeSignal(
+                action="skip",
+                side=side,
+                confidence=confidence,
+                reasoning=LazyReasoning("NO ban: NO bets 44% WR all-time | price={:.2f}", market_price),
+                suggested_amount=0,
+                features=features,
+            )
 
         # --- High-price YES guard ---
         # Data: YES at >72c has bad risk/reward (pay 75c, profit 25c on win,
         # lose 75c on loss). conf 0.50+ is 59% WR but net -$23 from this.
         if market_price > 0.72:
-            return {
-                "action": "skip",
-                "side": side,
-                "confidence": confidence,
-                "reasoning": f"High-price guard: price={market_price:.2f} >72c, bad risk/reward for YES",
-                "suggested_amount": 0,
-                "features": features,
-            }
+            return TradeSignal(
+                action="skip",
+                side=side,
+                confidence=confidence,
+                reasoning=LazyReasoning("High-price guard: price={:.2f} >72c, bad risk/reward for YES", market_price),
+                suggested_amount=0,
+                features=features,
+            )
 
         # --- Market consensus guard ---
         # Data shows: betting against strong market consensus is 0-10% WR.
         if market_price < 0.35 and side == "yes":
-            return {
-                "action": "skip",
-                "side": side,
-                "confidence": confidence,
-                "reasoning": f"Market consensus guard: price={market_price:.2f} too low to bet YES",
-                "suggested_amount": 0,
-                "features": features,
-            }
+            return TradeSignal(
+                action="skip",
+                side=side,
+                confidence=confidence,
+                reasoning=LazyReasoning("Market consensus guard: price={:.2f} too low to bet YES", market_price),
+                suggested_amount=0,
+                features=features,
+            )
 
-        min_conf = self.MIN_TRADE_CONFIDENCE.get(self.strategy_type, 0.03)
+        min_conf = self._min_conf
 
         # --- Skip low-confidence trades (no edge = no bet) ---
         if confidence < min_conf:
-            return {
-                "action": "skip",
-                "side": side,
-                "confidence": confidence,
-                "reasoning": f"No edge: conf={confidence:.3f} < {min_conf:.3f} | price={market_price:.2f}",
-                "suggested_amount": 0,
-                "features": features,
-            }
+            return TradeSignal(
+                action="skip",
+                side=side,
+                confidence=confidence,
+                reasoning=LazyReasoning(
+                    "No edge: conf={:.3f} < {:.3f} | price={:.2f}", confidence, min_conf, market_price
+                ),
+                suggested_amount=0,
+                features=features,
+            )
 
         # --- Late-window conviction boost ---
         # BTC direction increasingly locked in during the final 60s of a market.
@@ -241,7 +478,7 @@ class BaseBot(ABC):
         # conf >0.50 drops to 48.6% WR but bets are bigger → big losses.
         # Cap bet-sizing confidence at 0.45 to stay in the profitable zone.
         bet_conf = min(confidence, 0.45)
-        max_pos = config.get_max_position()
+        max_pos = self.max_position(signals)
         if bet_conf > 0.2:
             # Moderate-to-strong edge
             amount = max_pos * (0.05 + bet_conf * 0.10)
@@ -257,57 +494,72 @@ class BaseBot(ABC):
             f"=> {side} conf={confidence:.2f}"
         )
 
-        return {
-            "action": "buy",
-            "side": side,
-            "confidence": confidence,
-            "reasoning": reasoning,
-            "suggested_amount": amount,
-            "features": features,
-        }
+        return TradeSignal(
+            action="buy",
+            side=side,
+            confidence=confidence,
+            reasoning=reasoning,
+            suggested_amount=amount,
+            features=features,
+        )
 
-    def execute(self, signal: dict, market: dict) -> dict:
-        """Place a trade via Simmer SDK based on the signal."""
+    def execute(self, signal: TradeSignal, market: dict, cfg: config.ConfigSnapshot = None) -> dict:
+        """Place a trade via Simmer SDK based on the signal.
+
+        cfg is the arena's per-tick config.snapshot(); read fresh if omitted.
+        """
+        cfg = cfg or config.snapshot()
         if self._paused:
-            logger.info(f"[{self.name}] Paused, skipping trade")
+            logger.info("[%s] Paused, skipping trade", self.name)
             return {"success": False, "reason": "bot_paused"}
 
         # Per-bot mode: fresh read from DB so dashboard toggles take effect immediately
-        self.trading_mode = db.get_bot_mode(self.name)
-        mode = self.trading_mode
-        venue = "polymarket" if mode == "live" else "simmer"
-        # Use per-bot mode for position limits (global config.TRADING_MODE is always "paper")
-        max_pos = config.LIVE_MAX_POSITION if mode == "live" else config.PAPER_MAX_POSITION
+        mode = self.trading_mode = db.get_bot_mode(self.name)
+        binding = self._binding
+        if binding[0] != mode:
+            binding = self._bind_mode(mode)
+        _, execute_impl, max_pos = binding
 
         # Check risk limits
-        daily_loss = db.get_bot_daily_loss(self.name, mode)
-        max_daily = config.get_max_daily_loss_per_bot()
-        if daily_loss >= max_daily:
-            self._paused = True
-            logger.warning(f"[{self.name}] Daily loss limit hit (${daily_loss:.2f}), pausing")
-            return {"success": False, "reason": "daily_loss_limit"}
-
-        total_daily = db.get_total_daily_loss(mode)
-        max_total = config.get_max_daily_loss_total()
-        if total_daily >= max_total:
-            logger.warning(f"[{self.name}] Total arena daily loss limit hit (${total_daily:.2f})")
-            return {"success": False, "reason": "arena_loss_limit"}
+        blocked = self.check_risk(cfg, mode)
+        if blocked:
+            return {"success": False, "reason": blocked}
 
+        # Per-bot position limit (global config.TRADING_MODE is always "paper")
         amount = min(signal.get("suggested_amount", max_pos * 0.5), max_pos)
 
         try:
-            if mode == "live":
-                return self._execute_live(signal, market, amount, mode)
-            else:
-                return self._execute_paper(signal, market, amount, venue, mode)
-
+            return execute_impl(signal, market, amount)
         except Exception as e:
             logger.error(f"[{self.name}] Trade exception: {e}")
             return {"success": False, "reason": str(e)}
 
+    def check_risk(self, cfg: config.ConfigSnapshot, mode: str):
+        """Return the failure reason if a daily loss limit is hit, else None.
+
+        Reads the losses captured on the tick's snapshot when present.
+        """
+        if cfg.daily_losses is None:
+            daily_loss = db.get_bot_daily_loss(self.name, mode)
+            total_daily = db.get_total_daily_loss(mode)
+        else:
+            losses = cfg.daily_losses.get(mode, {})
+            daily_loss = losses.get(self.name, 0.0)
+            total_daily = sum(losses.values())
+
+        if daily_loss >= cfg.max_daily_loss_per_bot:
+            self._paused = True
+            logger.warning(f"[{self.name}] Daily loss limit hit (${daily_loss:.2f}), pausing")
+            return "daily_loss_limit"
+
+        if total_daily >= cfg.max_daily_loss_total:
+            logger.warning(f"[{self.name}] Total arena daily loss limit hit (${total_daily:.2f})")
+            return "arena_loss_limit"
+        return None
+
     def get_performance(self, hours=12) -> dict:
         """Get bot performance stats."""
-        perf = db.get_bot_performance(self.name, hours)
+        perf = db.get_bot_performance_cached(self.name, hours)
         perf["name"] = self.name
         perf["strategy_type"] = self.strategy_type
         perf["generation"] = self.generation
@@ -326,7 +578,12 @@ class BaseBot(ABC):
     def mutate(self, winning_params: dict, mutation_rate: float = None) -> dict:
         """Create mutated params from winning bot's params."""
         rate = mutation_rate or config.MUTATION_RATE
-        new_params = copy.deepcopy(winning_params)
+        # Params are normally a flat dict of scalars — a shallow copy is
+        # enough; only walk the graph when something nested is in there
+        if any(isinstance(v, (dict, list, set)) for v in winning_params.values()):
+            new_params = copy.deepcopy(winning_params)
+        else:
+            new_params = winning_params.copy()
 
         numeric_keys = [k for k, v in new_params.items() if isinstance(v, (int, float))]
         num_mutations = min(random.randint(2, 3), len(numeric_keys))
@@ -349,51 +606,54 @@ class BaseBot(ABC):
 
     def _execute_paper(self, signal, market, amount, venue, mode):
         """Execute via Simmer (paper trading)."""
-        import requests
         api_key = self._load_api_key()
         headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        market_id = market["market_id"]
+        reasoning = str(signal.reasoning)
 
         payload = {
-            "market_id": market.get("id") or market.get("market_id"),
-            "side": signal["side"],
+            "market_id": market_id,
+            "side": signal.side,
             "amount": amount,
             "venue": venue,
             "source": f"arena:{self.name}",
-            "reasoning": signal.get("reasoning", ""),
+            "reasoning": reasoning,
         }
 
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{config.SIMMER_BASE_URL}/api/sdk/trade",
-            headers=headers, json=payload, timeout=30
+            headers=headers, json=payload, timeout=TRADE_TIMEOUT, stream=True,
         )
 
         if resp.status_code in (200, 201):
             result = resp.json()
-            db.log_trade(
+            db.log_trade_async(
                 bot_name=self.name,
-                market_id=market.get("id") or market.get("market_id"),
+                market_id=market_id,
                 market_question=market.get("question"),
-                side=signal["side"],
+                side=signal.side,
                 amount=amount,
                 venue=venue,
                 mode=mode,
-                confidence=signal["confidence"],
-                reasoning=signal.get("reasoning"),
+                confidence=signal.confidence,
+                reasoning=reasoning,
                 trade_id=result.get("trade_id"),
                 shares_bought=result.get("shares_bought"),
-                trade_features=signal.get("features"),
+                trade_features=signal.features,
             )
-            logger.info(f"[{self.name}] Paper trade: {signal['side']} ${amount:.2f} on {market.get('question', '')[:50]}")
+            logger.info("[%s] Paper trade: %s $%.2f on %.50s", self.name, signal.side, amount, market.get("question", ""))
             return {"success": True, "trade_id": result.get("trade_id")}
         else:
-            logger.error(f"[{self.name}] Paper trade failed: {resp.status_code} {resp.text[:200]}")
+            logger.error(f"[{self.name}] Paper trade failed: {resp.status_code} {error_snippet(resp, 200)}")
             return {"success": False, "reason": f"api_error_{resp.status_code}"}
 
     def _execute_live(self, signal, market, amount, mode):
         """Execute directly on Polymarket CLOB (live trading)."""
-        import polymarket_client
+        if polymarket_client is None:
+            logger.error(f"[{self.name}] Live trading unavailable: py_clob_client not installed")
+            return {"success": False, "reason": "live_trading_unavailable"}
 
-        side = signal["side"].lower()
+        side = signal.side.lower()
         if side == "yes":
             token_id = market.get("polymarket_token_id")
         else:
@@ -410,38 +670,25 @@ class BaseBot(ABC):
         )
 
         if result.get("success"):
-            db.log_trade(
+            db.log_trade_async(
                 bot_name=self.name,
-                market_id=market.get("id") or market.get("market_id"),
+                market_id=market["market_id"],
                 market_question=market.get("question"),
-                side=signal["side"],
+                side=signal.side,
                 amount=amount,
                 venue="polymarket",
                 mode=mode,
-                confidence=signal["confidence"],
-                reasoning=signal.get("reasoning"),
+                confidence=signal.confidence,
+                reasoning=str(signal.reasoning),
                 trade_id=result.get("order_id"),
                 shares_bought=result.get("size"),
             )
-            logger.info(f"[{self.name}] LIVE trade: {signal['side']} ${amount} at {result.get('price')} on {market.get('question', '')[:50]}")
+            logger.info("[%s] LIVE trade: %s $%s at %s on %.50s",
+                        self.name, signal.side, amount, result.get("price"), market.get("question", ""))
         else:
             logger.error(f"[{self.name}] LIVE trade failed: {result.get('error')}")
 
         return result
 
     def _load_api_key(self):
-        import json as _json
-        # Try per-bot key first, then fall back to default
-        try:
-            with open(config.SIMMER_BOT_KEYS_PATH) as f:
-                bot_keys = _json.load(f)
-            if self.name in bot_keys:
-                return bot_keys[self.name]
-            # Check by slot assignment (for evolved bots inheriting a slot)
-            if hasattr(self, '_api_key_slot') and self._api_key_slot in bot_keys:
-                return bot_keys[self._api_key_slot]
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-        # Fallback: default key
-        with open(config.SIMMER_API_KEY_PATH) as f:
-            return _json.load(f).get("api_key")
+        return _resolve_api_key(self.name, getattr(self, "_api_key_slot", None))
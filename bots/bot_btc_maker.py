@@ -23,10 +23,26 @@ size_shares        : float — shares per side posted to the book
 directional_weight : float — 0 = pure neutral market-making;
                              1 = only post in the directionally favoured side
 min_edge_bps       : int   — minimum edge in basis points to bother quoting
-max_open_orders    : int   — cancel oldest orders if this many are already open
+max_open_orders    : int   — at this many open orders, cancel the one priced
+                             furthest from fair value (oldest on ties)
 """
 
-from bots.base_bot import BaseBot
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import db
+from bots._njit import njit
+from bots.base_bot import BaseBot, LazyReasoning, TradeSignal
+
+try:
+    import polymarket_client
+except ImportError:  # py_clob_client not installed — paper-only deployment
+    polymarket_client = None
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_PARAMS = {
     "spread_ticks": 2,         # Half-spread: 2 ticks = ±$0.02 around mid
@@ -39,6 +55,70 @@ DEFAULT_PARAMS = {
 }
 
 
+# maker_side codes returned by _btc_maker_core
+_SIDE_HOLD, _SIDE_YES, _SIDE_NO, _SIDE_BOTH = 0, 1, 2, 3
+_SIDE_NAMES = {_SIDE_YES: "yes", _SIDE_NO: "no", _SIDE_BOTH: "both"}
+
+
+@njit(cache=True)
+def _btc_maker_core(prices, market_price, dw, lb, spread_ticks, min_edge_bps):
+    """Numeric core of BtcMakerBot.analyze().
+
+    Returns (momentum, fair_value, raw_bid, raw_ask, edge_bps, side, conf)
+    where side is one of the _SIDE_* codes (_SIDE_HOLD = edge too thin).
+    raw_bid/raw_ask are unrounded: the caller rounds them to the 2dp tick grid
+    with Python's round(), which numba's round() doesn't match on ties.
+
+    Clamps and abs are written as inline comparisons so the pure-Python
+    fallback (no numba) doesn't pay a builtin call for each; each form keeps
+    the exact min()/max() semantics.
+    """
+    # --- Directional lean from recent BTC candles ---
+    momentum = 0.0
+    n = prices.shape[0]
+    if n >= lb and prices[n - lb] > 0:
+        momentum = (prices[n - 1] - prices[n - lb]) / prices[n - lb]
+    # Clamp to ±1%
+    momentum = momentum if momentum < 0.01 else 0.01
+    momentum = momentum if momentum > -0.01 else -0.01
+    abs_momentum = momentum if momentum >= 0 else -momentum
+
+    # Fair value: blend market price with directional signal
+    # momentum > 0 → BTC going up → YES more likely → fair > market_price
+    fair_value = market_price + dw * momentum * 10  # scale momentum to price units
+    fair_value = fair_value if fair_value < 0.95 else 0.95
+    fair_value = fair_value if fair_value > 0.05 else 0.05
+
+    # Tick grid
+    half_spread = spread_ticks * 0.01
+    raw_bid = fair_value - half_spread
+    raw_bid = raw_bid if raw_bid > 0.01 else 0.01
+    raw_ask = fair_value + half_spread
+    raw_ask = raw_ask if raw_ask < 0.99 else 0.99
+
+    # Edge check: is the spread meaningful vs the current book?
+    edge = fair_value - market_price
+    edge_bps = (edge if edge >= 0 else -edge) * 10000
+    if edge_bps < min_edge_bps and abs_momentum < 0.001:
+        return momentum, fair_value, raw_bid, raw_ask, edge_bps, _SIDE_HOLD, 0.0
+
+    # Directional lean: if momentum is positive lean YES (post bid),
+    # if negative lean NO (post ask on YES == posting bid on NO).
+    if momentum > 0.002:
+        side = _SIDE_YES
+        conf = edge_bps / 1000 + abs_momentum * 50
+        conf = conf if conf < 0.85 else 0.85
+    elif momentum < -0.002:
+        side = _SIDE_NO
+        conf = edge_bps / 1000 + abs_momentum * 50
+        conf = conf if conf < 0.85 else 0.85
+    else:
+        side = _SIDE_BOTH
+        conf = edge_bps / 1000
+        conf = conf if conf < 0.60 else 0.60
+    return momentum, fair_value, raw_bid, raw_ask, edge_bps, side, conf
+
+
 class BtcMakerBot(BaseBot):
     """Passive limit-order market maker for BTC 5-minute prediction markets."""
 
@@ -52,231 +132,164 @@ class BtcMakerBot(BaseBot):
             generation=generation,
             lineage=lineage,
         )
-        # Track live order IDs so we can cancel stale orders later.
-        # {market_id: [order_id, …]}
-        self._open_orders: dict[str, list[str]] = {}
+        # Track live orders so we can cancel stale ones later.
+        # {market_id: [(post_ts, order_id, yes_price), …]}, oldest first;
+        # yes_price is the quote in YES terms (NO bids stored as 1 - price)
+        self._open_orders: dict[str, list[tuple[float, str, float]]] = {}
 
     # ------------------------------------------------------------------
     # Core analysis — computes mid-price edge and directional lean
     # ------------------------------------------------------------------
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         """Compute maker quote parameters.
 
-        Returns a signal dict with extra maker-specific fields:
+        Returns a TradeSignal with the maker-specific fields set:
             maker_bid, maker_ask, maker_mid, maker_side
         """
         p = self.strategy_params
-        prices = signals.get("prices", [])
+        prices = np.asarray(signals.get("prices", []), dtype=np.float64)
         market_price = market.get("current_price", 0.5)
 
-        # --- Directional lean from recent BTC candles ---
-        momentum = 0.0
-        lb = p["lookback_candles"]
-        if len(prices) >= lb and prices[-lb] > 0:
-            momentum = (prices[-1] - prices[-lb]) / prices[-lb]
-        # Clamp to ±1%
-        momentum = max(-0.01, min(0.01, momentum))
-
-        # Fair value: blend market price with directional signal
-        dw = p["directional_weight"]
-        # momentum > 0 → BTC going up → YES more likely → fair > market_price
-        fair_value = market_price + dw * momentum * 10  # scale momentum to price units
-        fair_value = max(0.05, min(0.95, fair_value))
-
-        # Tick grid
-        tick = 0.01
-        half_spread = p["spread_ticks"] * tick
-        maker_bid = round(max(0.01, fair_value - half_spread), 2)
-        maker_ask = round(min(0.99, fair_value + half_spread), 2)
-
-        # Edge check: is the spread meaningful vs the current book?
-        edge_bps = abs(fair_value - market_price) * 10000
-        min_edge = p["min_edge_bps"]
-        if edge_bps < min_edge and abs(momentum) < 0.001:
-            return {
-                "action": "hold",
-                "side": "yes",
-                "confidence": 0.0,
-                "reasoning": (
-                    f"Edge too thin: {edge_bps:.0f}bps < {min_edge}bps, "
-                    f"market_price={market_price:.2f}"
+        momentum, fair_value, raw_bid, raw_ask, edge_bps, side, conf = map(float, _btc_maker_core(
+            prices, float(market_price), float(p["directional_weight"]),
+            int(p["lookback_candles"]), float(p["spread_ticks"]), float(p["min_edge_bps"]),
+        ))
+        maker_bid = round(raw_bid, 2)
+        maker_ask = round(raw_ask, 2)
+
+        side = int(side)
+        if side == _SIDE_HOLD:
+            return TradeSignal(
+                action="hold",
+                side="yes",
+                confidence=0.0,
+                reasoning=LazyReasoning(
+                    "Edge too thin: {:.0f}bps < {}bps, market_price={:.2f}",
+                    edge_bps, p["min_edge_bps"], market_price,
                 ),
-                "maker_bid": maker_bid,
-                "maker_ask": maker_ask,
-                "maker_mid": fair_value,
-                "maker_side": "both",
-            }
-
-        # Directional lean: if momentum is positive lean YES (post bid),
-        # if negative lean NO (post ask on YES == posting bid on NO).
-        if momentum > 0.002:
-            maker_side = "yes"
-            conf = min(0.85, edge_bps / 1000 + abs(momentum) * 50)
-        elif momentum < -0.002:
-            maker_side = "no"
-            conf = min(0.85, edge_bps / 1000 + abs(momentum) * 50)
-        else:
-            maker_side = "both"
-            conf = min(0.60, edge_bps / 1000)
-
-        import config
-        amount = config.get_max_position() * p["position_size_pct"]
-
-        return {
-            "action": "buy",
-            "side": "yes" if maker_side in ("yes", "both") else "no",
-            "confidence": conf,
-            "reasoning": (
+                maker_bid=maker_bid,
+                maker_ask=maker_ask,
+                maker_mid=fair_value,
+                maker_side="both",
+            )
+        maker_side = _SIDE_NAMES[side]
+
+        return self._buy(
+            signals,
+            side="yes" if maker_side in ("yes", "both") else "no",
+            confidence=conf,
+            reasoning=(
                 f"Maker: fair={fair_value:.3f} bid={maker_bid:.2f} ask={maker_ask:.2f} "
                 f"edge={edge_bps:.0f}bps mom={momentum:+.4f} lean={maker_side}"
             ),
-            "suggested_amount": amount,
-            "maker_bid": maker_bid,
-            "maker_ask": maker_ask,
-            "maker_mid": fair_value,
-            "maker_side": maker_side,
-        }
+            maker_bid=maker_bid,
+            maker_ask=maker_ask,
+            maker_mid=fair_value,
+            maker_side=maker_side,
+        )
 
     # ------------------------------------------------------------------
     # Execution override — maker-specific logic for live mode
     # ------------------------------------------------------------------
 
-    def execute(self, signal: dict, market: dict) -> dict:
-        """Override execute to use limit orders in live mode."""
-        import config
-        import db
-        import logging
-
-        log = logging.getLogger(__name__)
-
-        if self._paused:
-            return {"success": False, "reason": "bot_paused"}
-
-        self.trading_mode = db.get_bot_mode(self.name)
-        mode = self.trading_mode
-
-        # Standard risk checks (inherited logic)
-        daily_loss = db.get_bot_daily_loss(self.name, mode)
-        max_daily = config.get_max_daily_loss_per_bot()
-        if daily_loss >= max_daily:
-            self._paused = True
-            log.warning(f"[{self.name}] Daily loss limit hit, pausing")
-            return {"success": False, "reason": "daily_loss_limit"}
-
-        total_daily = db.get_total_daily_loss(mode)
-        if total_daily >= config.get_max_daily_loss_total():
-            log.warning(f"[{self.name}] Arena daily loss limit hit")
-            return {"success": False, "reason": "arena_loss_limit"}
-
-        max_pos = config.LIVE_MAX_POSITION if mode == "live" else config.PAPER_MAX_POSITION
-        amount = min(signal.get("suggested_amount", max_pos * 0.5), max_pos)
-
-        try:
-            if mode == "live":
-                return self._execute_maker_live(signal, market, amount)
-            else:
-                return self._execute_paper(signal, market, amount, "simmer", mode)
-        except Exception as e:
-            log.error(f"[{self.name}] Trade exception: {e}")
-            return {"success": False, "reason": str(e)}
-
-    def _execute_maker_live(self, signal: dict, market: dict, amount: float) -> dict:
-        """Post limit orders to the Polymarket CLOB."""
-        import logging
-        import db
-        import polymarket_client
+    def _order_path(self, mode):
+        """Use limit orders instead of market orders in live mode."""
+        if mode == "live":
+            return self._execute_maker_live
+        return super()._order_path(mode)
 
-        log = logging.getLogger(__name__)
+    def _execute_maker_live(self, signal: TradeSignal, market: dict, amount: float) -> dict:
+        """Post limit orders to the Polymarket CLOB."""
+        if polymarket_client is None:
+            logger.error(f"[{self.name}] Live trading unavailable: py_clob_client not installed")
+            return {"success": False, "reason": "live_trading_unavailable"}
 
-        market_id = market.get("id") or market.get("market_id")
+        market_id = market["market_id"]
         maker_side = signal.get("maker_side", "yes")
-        maker_bid = signal.get("maker_bid")
-        maker_ask = signal.get("maker_ask")
+        maker_bid = signal.maker_bid
+        maker_ask = signal.maker_ask
+        fair_value = signal.maker_mid
         p = self.strategy_params
 
-        # Cancel stale open orders for this market if over the cap
-        existing = self._open_orders.get(market_id, [])
+        # Over the cap: cancel the quote furthest from current fair value (the
+        # least likely to fill usefully) rather than the oldest, which may be
+        # the one about to fill. Ties go to the oldest.
+        existing = self._open_orders.setdefault(market_id, [])
         max_open = p.get("max_open_orders", 4)
-        while len(existing) >= max_open:
-            old_id = existing.pop(0)
+        while existing and len(existing) >= max_open:
+            worst = max(range(len(existing)), key=lambda i: abs(existing[i][2] - fair_value))
+            _, old_id, _ = existing.pop(worst)
             cancel_result = polymarket_client.cancel_order(old_id)
-            log.info(f"[{self.name}] Cancelled stale order {old_id}: {cancel_result.get('success')}")
+            logger.info("[%s] Cancelled stale order %s: %s", self.name, old_id, cancel_result.get("success"))
 
-        results = []
         size = p.get("size_shares", 10.0)
+        orders = []  # (side, YES-equivalent price, place_limit_order kwargs)
 
         # Post bid (buy YES) if leaning YES or neutral
         if maker_side in ("yes", "both") and maker_bid and market.get("polymarket_token_id"):
-            res = polymarket_client.place_limit_order(
+            orders.append(("yes", maker_bid, dict(
                 token_id=market["polymarket_token_id"],
                 side="buy",
                 size=size,
                 price=maker_bid,
                 order_type="GTC",
-            )
-            if res.get("success") and res.get("order_id"):
-                existing.append(res["order_id"])
-                db.log_trade(
-                    bot_name=self.name,
-                    market_id=market_id,
-                    market_question=market.get("question"),
-                    side="yes",
-                    amount=amount,
-                    venue="polymarket",
-                    mode="live",
-                    confidence=signal["confidence"],
-                    reasoning=signal.get("reasoning"),
-                    trade_id=res["order_id"],
-                    shares_bought=size,
-                    trade_features=signal.get("features"),
-                )
-            results.append(res)
+            )))
 
         # Post ask (sell YES / buy NO) if leaning NO or neutral
         if maker_side in ("no", "both") and maker_ask and market.get("polymarket_no_token_id"):
-            res = polymarket_client.place_limit_order(
+            orders.append(("no", maker_ask, dict(
                 token_id=market["polymarket_no_token_id"],
                 side="buy",
                 size=size,
                 price=1.0 - maker_ask,  # NO token price = 1 - YES ask
                 order_type="GTC",
-            )
+            )))
+
+        # Both sides go out together when quoting neutral
+        results = polymarket_client.place_limit_orders([o for _, _, o in orders])
+        now = time.time()
+        for (trade_side, yes_price, _), res in zip(orders, results):
             if res.get("success") and res.get("order_id"):
-                existing.append(res["order_id"])
-                db.log_trade(
+                existing.append((now, res["order_id"], yes_price))
+                db.log_trade_async(
                     bot_name=self.name,
                     market_id=market_id,
                     market_question=market.get("question"),
-                    side="no",
+                    side=trade_side,
                     amount=amount,
                     venue="polymarket",
                     mode="live",
-                    confidence=signal["confidence"],
-                    reasoning=signal.get("reasoning"),
+                    confidence=signal.confidence,
+                    reasoning=str(signal.reasoning),
                     trade_id=res["order_id"],
                     shares_bought=size,
-                    trade_features=signal.get("features"),
+                    trade_features=signal.features,
                 )
-            results.append(res)
-
-        self._open_orders[market_id] = existing
 
         success = any(r.get("success") for r in results)
-        log.info(
+        logger.info(
             f"[{self.name}] LIVE maker orders: {len(results)} posted "
             f"(bid={maker_bid}, ask={maker_ask}) success={success}"
         )
         return {"success": success, "results": results}
 
     def cancel_all_open_orders(self):
-        """Cancel all tracked open orders. Call at shutdown or before evolution."""
-        import polymarket_client
-        import logging
-
-        log = logging.getLogger(__name__)
-        for market_id, order_ids in self._open_orders.items():
-            for oid in order_ids:
-                res = polymarket_client.cancel_order(oid)
-                log.info(f"[{self.name}] Shutdown cancel {oid}: {res.get('success')}")
+        """Cancel all tracked open orders. Call at shutdown or before evolution.
+
+        Cancels are independent network calls, so they go out concurrently.
+        """
+        all_oids = [oid for orders in self._open_orders.values() for _, oid, _ in orders]
+        if all_oids and polymarket_client is None:
+            logger.error(
+                f"[{self.name}] Cannot cancel {len(all_oids)} open orders: "
+                "py_clob_client not installed"
+            )
+        elif all_oids:
+            with ThreadPoolExecutor(max_workers=min(16, len(all_oids))) as ex:
+                results = list(ex.map(polymarket_client.cancel_order, all_oids))
+            for oid, res in zip(all_oids, results):
+                logger.info(f"[{self.name}] Shutdown cancel {oid}: {res.get('success')}")
+            ok = sum(1 for res in results if res.get("success"))
+            logger.info(f"[{self.name}] Shutdown cancelled {ok}/{len(all_oids)} open orders")
         self._open_orders.clear()
@@ -18,18 +18,49 @@ so we don't re-copy trades across arena restarts.
 import logging
 import sys
 import time
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import config
 import db
+from bloom import BloomFilter
+from bots.base_bot import TRADE_TIMEOUT, error_snippet
+from signals.activity import fetch_activity
+
+try:
+    import polymarket_client
+except ImportError:  # py_clob_client not installed — paper-only deployment
+    polymarket_client = None
 
 logger = logging.getLogger(__name__)
 
-ACTIVITY_API = "https://data-api.polymarket.com/activity"
+# Dedup Bloom filter: sized to twice the wallet's history at startup, with
+# this floor (~70KB at 1e-6), so a quiet wallet doesn't pre-allocate for a
+# busy one
+SEEN_KEYS_MIN_CAPACITY = 20_000
+SEEN_KEYS_ERROR_RATE = 1e-6
+
+_SEEN_KEYS_SQL = (
+    "SELECT source_tx_hash FROM copytrading_trades "
+    "WHERE wallet_address=? AND source_tx_hash IS NOT NULL "
+    "UNION SELECT key FROM copytrading_seen WHERE wallet_address=?"
+)
+
+# Keep-alive session for Simmer trades, so each copy reuses a warm TLS
+# connection instead of handshaking per POST (activity polls go through
+# signals.activity)
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "polymarket-bot-arena/copybot"
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
 
 
 class CopyBot:
@@ -55,11 +86,16 @@ class CopyBot:
         self.max_price = getattr(config, 'COPYTRADING_MAX_PRICE', 1.0)
         self.copy_no_bets = config.COPYTRADING_COPY_NO_BETS
         self.blocked_hours = set(config.COPYTRADING_BLOCKED_HOURS_UTC)
+        # Same hours as a 24-bit mask: bit h set = hour h blocked
+        self._blocked_mask = sum(1 << h for h in self.blocked_hours)
 
         # Dedup: load previously seen {tx_hash}:{asset} keys from DB
-        self.seen_keys: set[str] = set()
-        self._load_seen_keys()
+        self.seen_keys = self._load_seen_keys()
         self._monitor = None  # WalletMonitor (set via attach_monitor)
+        # Rows for trades / copytrading_trades, written once per cycle
+        self._pending_trades: list[dict] = []
+        self._pending_log: list[tuple] = []
+        self._seen_queue: list[str] = []  # keys marked seen, persisted per cycle
         logger.info(
             f"CopyBot [{self.label}] init: mode={mode} max=${max_size} "
             f"fraction={size_fraction:.0%} seen={len(self.seen_keys)} past trades"
@@ -67,19 +103,24 @@ class CopyBot:
 
     # ── DB helpers ────────────────────────────────────────────────────────────
 
-    def _load_seen_keys(self):
-        """Seed seen_keys from DB so restarts don't re-copy old trades."""
+    def _load_seen_keys(self) -> BloomFilter:
+        """Seen keys from DB, so restarts don't re-copy (or re-filter) old trades."""
+        args = (self.wallet, self.wallet)
         try:
             with db.get_conn() as conn:
-                rows = conn.execute(
-                    "SELECT source_tx_hash FROM copytrading_trades "
-                    "WHERE wallet_address=? AND source_tx_hash IS NOT NULL",
-                    (self.wallet,),
-                ).fetchall()
-                for r in rows:
-                    self.seen_keys.add(r[0])
+                (count,) = conn.execute(
+                    f"SELECT COUNT(*) FROM ({_SEEN_KEYS_SQL})", args
+                ).fetchone()
+                seen = BloomFilter(
+                    capacity=max(SEEN_KEYS_MIN_CAPACITY, 2 * count),
+                    error_rate=SEEN_KEYS_ERROR_RATE,
+                )
+                # Iterating the cursor streams rows; no fetchall() list
+                seen.update(r[0] for r in conn.execute(_SEEN_KEYS_SQL, args))
+                return seen
         except Exception as e:
             logger.warning(f"CopyBot [{self.label}]: could not load seen keys: {e}")
+            return BloomFilter(capacity=SEEN_KEYS_MIN_CAPACITY, error_rate=SEEN_KEYS_ERROR_RATE)
 
     def _get_today_losses(self) -> float:
         """Return today's loss exposure: resolved losses + pending at-risk amount.
@@ -92,7 +133,6 @@ class CopyBot:
         for today, only losses AFTER that timestamp are counted.
         """
         try:
-            from datetime import date
             reset_key = f"copy_loss_reset_{self.name}_{date.today()}"
             since = db.get_arena_state(reset_key)  # None or "YYYY-MM-DD HH:MM:SS"
             if since:
@@ -100,7 +140,10 @@ class CopyBot:
                 params_resolved = (self.name, since)
                 params_pending  = (self.name, since)
             else:
-                time_filter = "AND date(created_at)=date('now')"
+                # Range form of date(created_at)=date('now') so the
+                # (bot_name, outcome, created_at) index can seek on it
+                time_filter = ("AND created_at >= date('now') "
+                               "AND created_at < date('now', '+1 day')")
                 params_resolved = (self.name,)
                 params_pending  = (self.name,)
 
@@ -121,13 +164,36 @@ class CopyBot:
 
     def _log_copy_trade(self, market_id: str, side: str, amount: float,
                         our_trade_id: str, source_key: str):
+        self._pending_log.append(
+            (self.wallet, market_id, side, amount, our_trade_id, source_key)
+        )
+
+    def _mark_seen(self, key: str):
+        self.seen_keys.add(key)
+        self._seen_queue.append(key)
+
+    def _flush_logs(self):
+        """Write this cycle's trades, then copy records + seen keys, one transaction each."""
+        trades, self._pending_trades = self._pending_trades, []
+        copies, self._pending_log = self._pending_log, []
+        seen, self._seen_queue = self._seen_queue, []
+        try:
+            db.log_trades_bulk(trades)
+        except Exception as e:
+            logger.warning(f"CopyBot [{self.label}]: trade log failed: {e}")
+        if not copies and not seen:
+            return
         try:
             with db.get_conn() as conn:
-                conn.execute(
+                conn.executemany(
                     """INSERT INTO copytrading_trades
                        (wallet_address, market_id, side, amount, our_trade_id, source_tx_hash)
                        VALUES (?, ?, ?, ?, ?, ?)""",
-                    (self.wallet, market_id, side, amount, our_trade_id, source_key),
+                    copies,
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO copytrading_seen (wallet_address, key) VALUES (?, ?)",
+                    [(self.wallet, k) for k in seen],
                 )
         except Exception as e:
             logger.warning(f"CopyBot [{self.label}]: DB log failed: {e}")
@@ -148,36 +214,26 @@ class CopyBot:
     def fetch_new_trades(self) -> list[dict]:
         """Poll Polymarket activity API; return unseen trade entries."""
         try:
-            resp = requests.get(
-                ACTIVITY_API,
-                params={"user": self.wallet, "limit": 30},
-                timeout=10,
-            )
-            if resp.status_code != 200:
-                logger.warning(f"CopyBot [{self.label}]: activity API {resp.status_code}")
+            status, trades = fetch_activity(self.wallet, limit=30, timeout=10)
+            if status != 200:
+                logger.warning(f"CopyBot [{self.label}]: activity API {status}")
                 return []
 
-            trades = resp.json()
             if not isinstance(trades, list):
                 return []
 
-            new_trades = []
-            seen_this_call: set[str] = set()
-
+            # First occurrence per key; the dict dedups the response itself,
+            # so seen_keys is probed once per distinct key
+            fresh: dict[str, dict] = {}
             for t in trades:
-                tx = t.get("transactionHash", "")
-                asset = t.get("asset", "")
-                key = f"{tx}:{asset}"
-
-                if not key or key == ":":
-                    continue
-                if key in self.seen_keys or key in seen_this_call:
-                    continue
+                key = f"{t.get('transactionHash', '')}:{t.get('asset', '')}"
+                if key != ":":
+                    fresh.setdefault(key, t)
 
-                seen_this_call.add(key)
-                new_trades.append({**t, "_key": key})
-
-            return new_trades
+            # Entries come from fetch_activity's shared result (WalletMonitor
+            # may hold the same dicts), so tag copies, never the originals
+            seen_keys = self.seen_keys
+            return [{**t, "_key": key} for key, t in fresh.items() if key not in seen_keys]
 
         except Exception as e:
             logger.error(f"CopyBot [{self.label}]: fetch error: {e}")
@@ -189,7 +245,7 @@ class CopyBot:
                        side: str, amount: float, reasoning: str, api_key: str):
         """Execute via Simmer paper trading."""
         try:
-            resp = requests.post(
+            resp = _SESSION.post(
                 f"{config.SIMMER_BASE_URL}/api/sdk/trade",
                 headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
                 json={
@@ -200,14 +256,15 @@ class CopyBot:
                     "source": f"copy:{self.label}",
                     "reasoning": reasoning,
                 },
-                timeout=30,
+                timeout=TRADE_TIMEOUT,
+                stream=True,
             )
             if resp.status_code in (200, 201):
-                rdata = resp.json()
+                rdata = orjson.loads(resp.content)
                 trade_id = rdata.get("trade_id", "")
                 shares_bought = rdata.get("shares_bought")
                 # Also log to main trades table so dashboard shows it
-                db.log_trade(
+                self._pending_trades.append(dict(
                     bot_name=self.name,
                     market_id=market_id,
                     market_question=market_question,
@@ -218,10 +275,10 @@ class CopyBot:
                     reasoning=reasoning,
                     trade_id=trade_id,
                     shares_bought=shares_bought,
-                )
+                ))
                 return True, trade_id
             else:
-                logger.error(f"CopyBot [{self.label}]: Simmer trade failed {resp.status_code}: {resp.text[:150]}")
+                logger.error(f"CopyBot [{self.label}]: Simmer trade failed {resp.status_code}: {error_snippet(resp)}")
                 return False, None
         except Exception as e:
             logger.error(f"CopyBot [{self.label}]: paper execute error: {e}")
@@ -230,9 +287,10 @@ class CopyBot:
     def _execute_live(self, token_id: str, market_id: str,
                       market_question: str, side: str, amount: float, reasoning: str):
         """Execute directly on Polymarket CLOB using the exact token."""
+        if polymarket_client is None:
+            logger.error(f"CopyBot [{self.label}]: live trading unavailable: py_clob_client not installed")
+            return False, None
         try:
-            import polymarket_client
-
             # Pre-flight: check actual CLOB best ask before placing.
             # Simmer and CLOB prices diverge — the Simmer guard alone isn't enough.
             # If the CLOB book is empty or best ask already > max_price, abort.
@@ -248,7 +306,7 @@ class CopyBot:
             result = polymarket_client.place_market_order(token_id, side, amount)
             if result.get("success"):
                 trade_id = result.get("order_id", "")
-                db.log_trade(
+                self._pending_trades.append(dict(
                     bot_name=self.name,
                     market_id=market_id,
                     market_question=market_question,
@@ -259,7 +317,7 @@ class CopyBot:
                     reasoning=reasoning,
                     trade_id=trade_id,
                     shares_bought=result.get("size"),
-                )
+                ))
                 return True, trade_id
             else:
                 logger.error(f"CopyBot [{self.label}]: CLOB trade failed: {result.get('error')}")
@@ -268,104 +326,112 @@ class CopyBot:
             logger.error(f"CopyBot [{self.label}]: live execute error: {e}")
             return False, None
 
-    def _execute_one(self, activity: dict, markets_by_token: dict, api_key: str) -> bool:
-        """Execute a single copied trade. Returns True on success."""
+    def _execute_one(self, activity: dict, quotes_by_token: dict, api_key: str,
+                     now: float, current_hour: int) -> bool:
+        """Execute a single copied trade. Returns True on success.
+
+        quotes_by_token maps token id -> (Simmer market_id, current price);
+        now / current_hour are the cycle's time.time() and UTC hour. All three
+        are built once by check_and_copy() for the whole batch.
+        """
         key = activity["_key"]
-        asset = activity.get("asset", "")
-        outcome_idx = activity.get("outcomeIndex", 0)
-        usdc_size = activity.get("usdcSize", 0)
-        price = activity.get("price", 0.5)
         title = activity.get("title", "unknown")
-        outcome = activity.get("outcome", "")
-
-        # Determine side from outcomeIndex (0=YES/Up, 1=NO/Down)
-        side = "yes" if outcome_idx == 0 else "no"
+        # Read several times below — bind once
+        label = self.label
+        min_price, max_price = self.min_price, self.max_price
+        mark_seen = self._mark_seen
 
         # --- Filters (mark seen so we don't retry skipped trades) ---
+        # Ordered cheapest / most often rejecting first.
 
-        # Age filter: skip trades older than 5 minutes — stale copies fill at
-        # the current (often near-resolution) market price, not the whale's entry
-        # price, destroying the edge. e.g. whale bought at 0.45, we copy 10 min
-        # later, Simmer fills at 0.98 → +$0.02 win but -$1.00 loss = EV-negative.
-        trade_ts = activity.get("timestamp", 0)
-        trade_age = time.time() - trade_ts if trade_ts else 999
-        if trade_age > 300:  # 5 minutes
-            logger.info(
-                f"CopyBot [{self.label}]: skipping — trade too old "
-                f"({trade_age:.0f}s > 300s) ({title[:40]})"
-            )
-            self.seen_keys.add(key)
+        # Side filter: skip NO bets if disabled
+        # Determine side from outcomeIndex (0=YES/Up, 1=NO/Down)
+        side = "yes" if activity.get("outcomeIndex", 0) == 0 else "no"
+        if side == "no" and not self.copy_no_bets:
+            logger.info(f"CopyBot [{label}]: skipping NO bet on {title[:40]}")
+            mark_seen(key)
             return False
 
         # Hour filter: skip blocked UTC hours
-        current_hour = datetime.now(timezone.utc).hour
-        if current_hour in self.blocked_hours:
-            logger.info(f"CopyBot [{self.label}]: skipping — blocked hour {current_hour:02d}:xx UTC ({title[:40]})")
-            self.seen_keys.add(key)
-            return False
-
-        # Side filter: skip NO bets if disabled
-        if side == "no" and not self.copy_no_bets:
-            logger.info(f"CopyBot [{self.label}]: skipping NO bet on {title[:40]}")
-            self.seen_keys.add(key)
+        if (self._blocked_mask >> current_hour) & 1:
+            logger.info(f"CopyBot [{label}]: skipping — blocked hour {current_hour:02d}:xx UTC ({title[:40]})")
+            mark_seen(key)
             return False
 
         # Price filter: skip entries outside [min_price, max_price]
-        if price < self.min_price:
+        price = activity.get("price", 0.5)
+        if price < min_price:
             logger.info(
-                f"CopyBot [{self.label}]: skipping — price {price:.2f} < min {self.min_price:.2f} ({title[:40]})"
+                f"CopyBot [{label}]: skipping — price {price:.2f} < min {min_price:.2f} ({title[:40]})"
             )
-            self.seen_keys.add(key)
+            mark_seen(key)
             return False
-        if price > self.max_price:
+        if price > max_price:
             logger.info(
-                f"CopyBot [{self.label}]: skipping — price {price:.2f} > max {self.max_price:.2f} ({title[:40]})"
+                f"CopyBot [{label}]: skipping — price {price:.2f} > max {max_price:.2f} ({title[:40]})"
             )
-            self.seen_keys.add(key)
+            mark_seen(key)
             return False
 
-        # Position size: fraction of whale's trade, capped
-        amount = round(min(self.max_size, max(1.0, usdc_size * self.size_fraction)), 2)
+        # Age filter: skip trades older than 5 minutes — stale copies fill at
+        # the current (often near-resolution) market price, not the whale's entry
+        # price, destroying the edge. e.g. whale bought at 0.45, we copy 10 min
+        # later, Simmer fills at 0.98 → +$0.02 win but -$1.00 loss = EV-negative.
+        trade_ts = activity.get("timestamp", 0)
+        trade_age = now - trade_ts if trade_ts else 999
+        if trade_age > 300:  # 5 minutes
+            logger.info(
+                f"CopyBot [{label}]: skipping — trade too old "
+                f"({trade_age:.0f}s > 300s) ({title[:40]})"
+            )
+            mark_seen(key)
+            return False
 
-        # Find the Simmer market via token lookup
-        market = markets_by_token.get(asset)
-        if market is None:
-            trade_age = time.time() - activity.get("timestamp", 0)
+        # Find the Simmer market via token lookup. Checked after the filters
+        # above so a trade they reject is marked seen rather than retried.
+        asset = activity.get("asset", "")
+        quote = quotes_by_token.get(asset)
+        if quote is None:
             if trade_age > 120:
                 # Old trade from an already-resolved market — mark seen so we stop retrying
-                self.seen_keys.add(key)
-                logger.debug(f"CopyBot [{self.label}]: old trade, no active market ({title[:40]})")
+                mark_seen(key)
+                logger.debug(f"CopyBot [{label}]: old trade, no active market ({title[:40]})")
             else:
                 # Very recent trade — market might not be indexed yet, retry next cycle
                 logger.info(
-                    f"CopyBot [{self.label}]: market not found yet for recent trade "
+                    f"CopyBot [{label}]: market not found yet for recent trade "
                     f"({title[:40]}), will retry"
                 )
             return False
 
-        market_id = market.get("id") or market.get("market_id")
+        usdc_size = activity.get("usdcSize", 0)
+        outcome = activity.get("outcome", "")
+
+        # Position size: fraction of whale's trade, capped
+        amount = round(min(self.max_size, max(1.0, usdc_size * self.size_fraction)), 2)
+
+        market_id, simmer_price = quote
 
         # Simmer fill-price guard: reject if Simmer's current market price already
         # exceeds max_price — this catches the case where Female-Bongo buys at 0.52
         # on Polymarket but Simmer has diverged to 0.98 (different AMM state).
         # Without this check we'd lock in a terrible entry: risk $0.98 to win $0.02.
-        simmer_price = market.get("current_price", 0.5)
         simmer_side_price = simmer_price if side == "yes" else (1.0 - simmer_price)
-        if simmer_side_price > self.max_price:
+        if simmer_side_price > max_price:
             logger.info(
-                f"CopyBot [{self.label}]: skipping — Simmer fill ~{simmer_side_price:.2f} "
-                f"> max {self.max_price:.2f} (whale paid {price:.2f}) ({title[:40]})"
+                f"CopyBot [{label}]: skipping — Simmer fill ~{simmer_side_price:.2f} "
+                f"> max {max_price:.2f} (whale paid {price:.2f}) ({title[:40]})"
             )
-            self.seen_keys.add(key)
+            mark_seen(key)
             return False
 
         reasoning = (
-            f"copy:{self.label} {side} {outcome} @ {price:.2f} "
+            f"copy:{label} {side} {outcome} @ {price:.2f} "
             f"(whale ${usdc_size:.2f} → us ${amount:.2f}, simmer~{simmer_side_price:.2f})"
         )
 
         # Always mark as seen before executing to prevent double-trade on retry
-        self.seen_keys.add(key)
+        mark_seen(key)
 
         if self.mode == "live":
             success, trade_id = self._execute_live(
@@ -379,7 +445,7 @@ class CopyBot:
         if success:
             self._log_copy_trade(market_id, side, amount, trade_id or "", key)
             logger.info(
-                f"CopyBot [{self.label}] ✓ {side.upper()} ${amount:.2f} "
+                f"CopyBot [{label}] ✓ {side.upper()} ${amount:.2f} "
                 f"(whale ${usdc_size:.2f} × {self.size_fraction:.0%}) "
                 f"on {title[:50]}"
             )
@@ -410,31 +476,45 @@ class CopyBot:
             )
             # Still mark all new trades as seen so we don't retry them tomorrow
             for trade in new_trades:
-                self.seen_keys.add(trade["_key"])
+                self._mark_seen(trade["_key"])
+            self._flush_logs()
             return 0
 
-        count = 0
-        for trade in new_trades:
-            # Per-cycle cap
-            if count >= self.max_per_cycle:
-                logger.info(
-                    f"CopyBot [{self.label}]: per-cycle cap hit ({self.max_per_cycle}), "
-                    f"deferring {len(new_trades) - count} trades to next cycle"
-                )
-                break
-
-            # Re-check losses before each trade
-            today_losses = self._get_today_losses()
-            if today_losses >= self.daily_loss_limit:
-                logger.warning(
-                    f"CopyBot [{self.label}]: daily loss limit reached mid-cycle "
-                    f"(${today_losses:.2f} losses / ${self.daily_loss_limit:.2f} cap)"
-                )
-                break
+        # Constant across the batch — read once, not per trade
+        quotes_by_token = {
+            tok: (m["market_id"], m.get("current_price", 0.5))
+            for tok, m in markets_by_token.items()
+        }
+        now = time.time()
+        current_hour = datetime.now(timezone.utc).hour
 
-            if self._execute_one(trade, markets_by_token, api_key):
-                count += 1
-                time.sleep(0.5)  # small delay between consecutive live orders
+        count = 0
+        try:
+            for trade in new_trades:
+                # Per-cycle cap
+                if count >= self.max_per_cycle:
+                    logger.info(
+                        f"CopyBot [{self.label}]: per-cycle cap hit ({self.max_per_cycle}), "
+                        f"deferring {len(new_trades) - count} trades to next cycle"
+                    )
+                    break
+
+                # Re-check exposure before each trade. Nothing resolves inside
+                # this loop, so the only change since the query above is the
+                # pending amount of the trades placed (and buffered) this cycle
+                exposure = today_losses + sum(t["amount"] for t in self._pending_trades)
+                if exposure >= self.daily_loss_limit:
+                    logger.warning(
+                        f"CopyBot [{self.label}]: daily loss limit reached mid-cycle "
+                        f"(${exposure:.2f} losses / ${self.daily_loss_limit:.2f} cap)"
+                    )
+                    break
+
+                if self._execute_one(trade, quotes_by_token, api_key, now, current_hour):
+                    count += 1
+                    time.sleep(0.5)  # small delay between consecutive live orders
+        finally:
+            self._flush_logs()
 
         return count
 
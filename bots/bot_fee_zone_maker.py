@@ -24,9 +24,8 @@ Competing hypothesis:
   60-82¢ range, and more trades → more learning data.
 """
 
-import config
 import learning
-from bots.base_bot import BaseBot
+from bots.base_bot import BaseBot, TradeSignal
 
 # Fee formula constant — C=1.0 reproduces 1.56% at p=0.5
 _FEE_C = 1.0
@@ -37,6 +36,19 @@ def taker_fee(price: float) -> float:
     return _FEE_C * 0.25 * (price * (1.0 - price)) ** 2
 
 
+# taker_fee in bps for every 1¢ tick. Indexed only when the price sits exactly
+# on the tick (i / 100 == price), so lookups match taker_fee() bit for bit.
+_FEE_BPS_TABLE = tuple(taker_fee(i / 100) * 10000 for i in range(101))
+
+
+def taker_fee_bps(price: float) -> float:
+    """taker_fee(price) in basis points, from the tick table when possible."""
+    i = int(price * 100 + 0.5)
+    if 0 <= i <= 100 and i / 100 == price:
+        return _FEE_BPS_TABLE[i]
+    return taker_fee(price) * 10000
+
+
 DEFAULT_PARAMS = {
     "min_price_zone": 0.60,    # Only quote at YES price ≥ 60¢
     "max_price_zone": 0.82,    # Only quote at YES price ≤ 82¢ (above this: too cheap to earn)
@@ -63,7 +75,7 @@ class FeeZoneMakerBot(BaseBot):
             lineage=lineage,
         )
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         p = self.strategy_params
         market_price = market.get("current_price", 0.5)
         time_rem = market.get("time_remaining_seconds")
@@ -76,16 +88,16 @@ class FeeZoneMakerBot(BaseBot):
         maker_mid = market_price
 
         def _hold(reason):
-            return {
-                "action": "hold",
-                "side": "yes",
-                "confidence": 0.0,
-                "reasoning": reason,
-                "maker_bid": maker_bid,
-                "maker_ask": maker_ask,
-                "maker_mid": maker_mid,
-                "maker_side": "both",
-            }
+            return TradeSignal(
+                action="hold",
+                side="yes",
+                confidence=0.0,
+                reasoning=reason,
+                maker_bid=maker_bid,
+                maker_ask=maker_ask,
+                maker_mid=maker_mid,
+                maker_side="both",
+            )
 
         # ── Fee-zone gate ─────────────────────────────────────────────────────
         # Only quote where taker fee gives us meaningful advantage
@@ -97,8 +109,7 @@ class FeeZoneMakerBot(BaseBot):
             )
 
         # Verify taker fee is large enough to justify quoting
-        fee = taker_fee(market_price)
-        fee_bps = fee * 10000
+        fee_bps = taker_fee_bps(market_price)
         min_fee = p["min_fee_bps"]
         if fee_bps < min_fee:
             return _hold(f"fzm: fee {fee_bps:.0f}bps < {min_fee}bps at price={market_price:.2f}")
@@ -136,21 +147,18 @@ class FeeZoneMakerBot(BaseBot):
             time_rem=time_rem,
         )
 
-        amount = config.get_max_position() * p["position_size_pct"]
-
-        return {
-            "action": "buy",
-            "side": "yes",
-            "confidence": confidence,
-            "reasoning": (
+        return self._buy(
+            signals,
+            side="yes",
+            confidence=confidence,
+            reasoning=(
                 f"fzm: price={market_price:.2f} fee={fee_bps:.0f}bps "
                 f"mom={momentum:+.5f} psig={price_signal:.2f} conf={confidence:.3f} "
                 f"bid={maker_bid:.2f} ask={maker_ask:.2f}"
             ),
-            "suggested_amount": amount,
-            "features": features,
-            "maker_bid": maker_bid,
-            "maker_ask": maker_ask,
-            "maker_mid": maker_mid,
-            "maker_side": "yes",
-        }
+            features=features,
+            maker_bid=maker_bid,
+            maker_ask=maker_ask,
+            maker_mid=maker_mid,
+            maker_side="yes",
+        )
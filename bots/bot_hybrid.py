@@ -1,6 +1,6 @@
 """Bot 4: Hybrid / Ensemble strategy combining all signals."""
 
-from bots.base_bot import BaseBot
+from bots.base_bot import BaseBot, TradeSignal
 from bots.bot_momentum import MomentumBot
 from bots.bot_mean_rev import MeanRevBot
 from bots.bot_sentiment import SentimentBot
@@ -30,38 +30,43 @@ class HybridBot(BaseBot):
         self._mean_rev = MeanRevBot(name="_internal_mr")
         self._sentiment = SentimentBot(name="_internal_sent")
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         """Combine signals from momentum, mean reversion, and sentiment."""
-        mom_signal = self._momentum.analyze(market, signals)
-        mr_signal = self._mean_rev.analyze(market, signals)
-        sent_signal = self._sentiment.analyze(market, signals)
+        # Sub-strategies' numeric cores only — their TradeSignals and
+        # reasoning strings would be thrown away here
+        p = self.strategy_params
+        mom = self._momentum._score(market, signals)
+        mr = self._mean_rev._score(market, signals)
+        sent = self._sentiment._score(market, signals)
 
-        sub_signals = [
-            (mom_signal, self.strategy_params["momentum_weight"]),
-            (mr_signal, self.strategy_params["mean_rev_weight"]),
-            (sent_signal, self.strategy_params["sentiment_weight"]),
-        ]
+        # Common case: nothing interesting in this market
+        if not (mom[0] or mr[0] or sent[0]):
+            return TradeSignal(action="hold", side="yes", confidence=0,
+                               reasoning="All sub-strategies say hold")
 
-        # Score: +confidence for "yes", -confidence for "no", 0 for "hold"
+        sub_scores = (
+            (mom, p["momentum_weight"]),
+            (mr, p["mean_rev_weight"]),
+            (sent, p["sentiment_weight"]),
+        )
+
+        # Score: +confidence for "yes", -confidence for "no", 0 for "hold".
+        # Votes are tallied in the same pass.
         weighted_score = 0
-        active_signals = 0
-        reasons = []
+        yes_votes = no_votes = 0
+        active_reasons = []
 
-        for sig, weight in sub_signals:
-            if sig["action"] == "hold":
+        for (direction, sub_conf, reason), weight in sub_scores:
+            if not direction:
                 continue
-            active_signals += 1
-            direction = 1 if sig["side"] == "yes" else -1
-            weighted_score += direction * sig["confidence"] * weight
-            reasons.append(f"{sig.get('reasoning', '')[:60]}")
-
-        if active_signals == 0:
-            return {"action": "hold", "side": "yes", "confidence": 0,
-                    "reasoning": "All sub-strategies say hold"}
+            if direction > 0:
+                yes_votes += 1
+            else:
+                no_votes += 1
+            weighted_score += direction * sub_conf * weight
+            active_reasons.append(reason)
 
         # Check agreement
-        yes_votes = sum(1 for s, _ in sub_signals if s["action"] != "hold" and s["side"] == "yes")
-        no_votes = sum(1 for s, _ in sub_signals if s["action"] != "hold" and s["side"] == "no")
         agreement = max(yes_votes, no_votes) >= 2
 
         confidence = abs(weighted_score)
@@ -71,17 +76,14 @@ class HybridBot(BaseBot):
 
         threshold = self.strategy_params["confidence_threshold"]
         if confidence < threshold:
-            return {"action": "hold", "side": "yes", "confidence": confidence,
-                    "reasoning": f"Ensemble confidence {confidence:.2f} below threshold {threshold}"}
+            return TradeSignal(action="hold", side="yes", confidence=confidence,
+                               reasoning=f"Ensemble confidence {confidence:.2f} below threshold {threshold}")
 
         side = "yes" if weighted_score > 0 else "no"
-        import config
-        amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-
-        return {
-            "action": "buy",
-            "side": side,
-            "confidence": confidence,
-            "reasoning": f"Ensemble ({yes_votes}Y/{no_votes}N, agree={agreement}): " + " | ".join(reasons),
-            "suggested_amount": amount,
-        }
+        return self._buy(
+            signals,
+            side=side,
+            confidence=confidence,
+            reasoning=f"Ensemble ({yes_votes}Y/{no_votes}N, agree={agreement}): "
+                      + " | ".join(str(r)[:60] for r in active_reasons),
+        )
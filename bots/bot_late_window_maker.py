@@ -18,9 +18,11 @@ Competing hypothesis:
   always-on fee-zone bets because the signal is strongest in the final seconds.
 """
 
-import config
+import functools
+
+import indicators
 import learning
-from bots.base_bot import BaseBot
+from bots.base_bot import BaseBot, LazyReasoning, TradeSignal
 
 DEFAULT_PARAMS = {
     "entry_window_sec": 90,    # Only activate in the last 90 seconds of a market
@@ -33,6 +35,18 @@ DEFAULT_PARAMS = {
 }
 
 
+@functools.lru_cache(maxsize=128)
+def _hold_quotes(market_price):
+    """(maker_bid, maker_ask) logged with a hold: market_price ± 2¢, clamped.
+
+    Most calls are holds and market prices repeat tick to tick, so the two
+    round()s are done once per distinct price.
+    """
+    bid = market_price - 0.02
+    ask = market_price + 0.02
+    return round(bid if bid > 0.01 else 0.01, 2), round(ask if ask < 0.99 else 0.99, 2)
+
+
 class LateWindowMakerBot(BaseBot):
     """Posts directional YES in the final 90s when BTC momentum and price align."""
 
@@ -47,35 +61,44 @@ class LateWindowMakerBot(BaseBot):
             lineage=lineage,
         )
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         p = self.strategy_params
         time_rem = market.get("time_remaining_seconds")
-        market_price = market.get("current_price", 0.5)
-
-        # Maker quote fields always returned so run_maker_section() can log them
-        def _hold(reason):
-            return {
-                "action": "hold",
-                "side": "yes",
-                "confidence": 0.0,
-                "reasoning": reason,
-                "maker_bid": round(max(0.01, market_price - 0.02), 2),
-                "maker_ask": round(min(0.99, market_price + 0.02), 2),
-                "maker_mid": market_price,
-                "maker_side": "both",
-            }
 
         # ── Time gate ────────────────────────────────────────────────────────
         entry_window = p["entry_window_sec"]
         if time_rem is None or time_rem > entry_window:
-            return _hold(f"lwm: waiting (rem={time_rem}s, window={entry_window}s)")
+            # Nearly every call lands here: no quotes (we aren't quoting yet)
+            # and the reason is only formatted if something reads it
+            return TradeSignal(
+                action="hold",
+                side="yes",
+                confidence=0.0,
+                reasoning=LazyReasoning(
+                    "lwm: waiting (rem={}s, window={}s)", time_rem, entry_window),
+                maker_side="both",
+            )
+
+        market_price = market.get("current_price", 0.5)
+
+        # Maker quote fields returned so run_maker_section() can log them
+        hold_bid, hold_ask = _hold_quotes(market_price)
+
+        def _hold(reason):
+            return TradeSignal(
+                action="hold",
+                side="yes",
+                confidence=0.0,
+                reasoning=reason,
+                maker_bid=hold_bid,
+                maker_ask=hold_ask,
+                maker_mid=market_price,
+                maker_side="both",
+            )
 
         # ── BTC momentum ─────────────────────────────────────────────────────
-        prices = signals.get("prices", [])
-        lb = p["lookback_candles"]
-        momentum = 0.0
-        if len(prices) >= lb and prices[-lb] > 0:
-            momentum = (prices[-1] - prices[-lb]) / prices[-lb]
+        # Same pct change MomentumBot reads, computed once per tick
+        momentum = indicators.shared(signals).pct_change(p["lookback_candles"]) or 0.0
 
         min_mom = p["min_momentum"]
         if abs(momentum) < min_mom:
@@ -97,15 +120,18 @@ class LateWindowMakerBot(BaseBot):
 
         # ── Maker quote computation ───────────────────────────────────────────
         # What we'd post as a limit order: slightly ahead of market to capture spread
-        maker_ask = round(min(max_price, market_price + p["maker_offset_pct"]), 2)
-        maker_bid = round(max(0.01, market_price - 0.02), 2)
+        maker_ask = market_price + p["maker_offset_pct"]
+        maker_ask = round(maker_ask if maker_ask < max_price else max_price, 2)
+        maker_bid = hold_bid
         maker_mid = round((maker_bid + maker_ask) / 2, 3)
         edge_bps = p["maker_offset_pct"] * 10000  # spread captured if filled
 
         # ── Confidence: urgency × momentum strength ───────────────────────────
         time_weight = 1.0 - (time_rem / entry_window)  # 0 at window-open, 1 at close
-        mom_strength = min(1.0, abs(momentum) / (min_mom * 5))
-        confidence = min(0.92, 0.45 + time_weight * 0.30 + mom_strength * 0.20)
+        mom_strength = momentum / (min_mom * 5)  # momentum > 0 past the NO ban
+        mom_strength = mom_strength if mom_strength < 1.0 else 1.0
+        confidence = 0.45 + time_weight * 0.30 + mom_strength * 0.20
+        confidence = confidence if confidence < 0.92 else 0.92
 
         # ── Features ─────────────────────────────────────────────────────────
         of_data = signals.get("orderflow", {})
@@ -115,21 +141,18 @@ class LateWindowMakerBot(BaseBot):
             time_rem=time_rem,
         )
 
-        amount = config.get_max_position() * p["position_size_pct"]
-
-        return {
-            "action": "buy",
-            "side": "yes",
-            "confidence": confidence,
-            "reasoning": (
+        return self._buy(
+            signals,
+            side="yes",
+            confidence=confidence,
+            reasoning=(
                 f"lwm: time={time_rem:.0f}s mom={momentum:+.5f} "
                 f"price={market_price:.2f} limit={maker_ask:.2f} "
                 f"edge={edge_bps:.0f}bps tw={time_weight:.2f}"
             ),
-            "suggested_amount": amount,
-            "features": features,
-            "maker_bid": maker_bid,
-            "maker_ask": maker_ask,
-            "maker_mid": maker_mid,
-            "maker_side": "yes",
-        }
+            features=features,
+            maker_bid=maker_bid,
+            maker_ask=maker_ask,
+            maker_mid=maker_mid,
+            maker_side="yes",
+        )
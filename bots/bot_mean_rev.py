@@ -1,7 +1,7 @@
 """Bot 2: Mean Reversion strategy."""
 
-import math
-from bots.base_bot import BaseBot
+import indicators
+from bots.base_bot import BaseBot, LazyReasoning, TradeSignal
 
 DEFAULT_PARAMS = {
     "lookback_candles": 20,
@@ -16,86 +16,61 @@ DEFAULT_PARAMS = {
 
 
 class MeanRevBot(BaseBot):
-    def __init__(self, name="meanrev-v1", params=None, generation=0, lineage=None):
+    def __init__(self, name="meanrev-v1", params=None, generation=0, lineage=None,
+                 strategy_type="mean_reversion"):
         super().__init__(
             name=name,
-            strategy_type="mean_reversion",
+            strategy_type=strategy_type,
             params=params or DEFAULT_PARAMS.copy(),
             generation=generation,
             lineage=lineage,
         )
 
-    def _calc_rsi(self, prices, period):
-        if len(prices) < period + 1:
-            return 50  # neutral
-        gains, losses = [], []
-        for i in range(1, len(prices)):
-            delta = prices[i] - prices[i-1]
-            gains.append(max(delta, 0))
-            losses.append(max(-delta, 0))
+    def _score(self, market: dict, signals: dict):
+        """Numeric core of analyze(): (direction, confidence, reasoning).
 
-        gains = gains[-period:]
-        losses = losses[-period:]
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-
-        if avg_loss == 0:
-            return 100
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
-
-    def _calc_zscore(self, prices, lookback):
-        if len(prices) < lookback:
-            return 0
-        window = prices[-lookback:]
-        mean = sum(window) / len(window)
-        variance = sum((p - mean) ** 2 for p in window) / len(window)
-        std = math.sqrt(variance) if variance > 0 else 1
-        return (prices[-1] - mean) / std
-
-    def analyze(self, market: dict, signals: dict) -> dict:
-        """Bet against overextended moves."""
-        prices = signals.get("prices", [])
+        direction is +1 (yes), -1 (no) or 0 (hold). reasoning is lazy, so
+        callers that only need the numbers (HybridBot) never format it.
+        """
+        feats = indicators.shared(signals)
         lookback = self.strategy_params["lookback_candles"]
 
-        if len(prices) < lookback:
-            return {"action": "hold", "side": "yes", "confidence": 0, "reasoning": "insufficient data"}
+        if len(feats.prices) < lookback:
+            return 0, 0, "insufficient data"
 
         # Z-score: how far price is from recent mean
-        zscore = self._calc_zscore(prices, lookback)
+        zscore = feats.zscore(lookback)
 
         # RSI: momentum oscillator
-        rsi = self._calc_rsi(prices, self.strategy_params["rsi_period"])
+        rsi = feats.rsi(self.strategy_params["rsi_period"])
 
         threshold = self.strategy_params["reversion_threshold"]
 
         # Overextended UP → bet NO (expect reversion down)
         if zscore > threshold and rsi > self.strategy_params["rsi_overbought"]:
-            confidence = min(0.95, 0.5 + abs(zscore) * 0.15 + (rsi - 70) * 0.005)
-            import config
-            amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-            return {
-                "action": "buy",
-                "side": "no",
-                "confidence": confidence,
-                "reasoning": f"Mean reversion SHORT: z={zscore:.2f}, RSI={rsi:.1f} (overbought)",
-                "suggested_amount": amount,
-            }
+            confidence = 0.5 + abs(zscore) * 0.15 + (rsi - 70) * 0.005
+            confidence = confidence if confidence < 0.95 else 0.95
+            return -1, confidence, LazyReasoning(
+                "Mean reversion SHORT: z={:.2f}, RSI={:.1f} (overbought)", zscore, rsi)
 
         # Overextended DOWN → bet YES (expect reversion up)
         if zscore < -threshold and rsi < self.strategy_params["rsi_oversold"]:
-            confidence = min(0.95, 0.5 + abs(zscore) * 0.15 + (30 - rsi) * 0.005)
-            import config
-            amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-            return {
-                "action": "buy",
-                "side": "yes",
-                "confidence": confidence,
-                "reasoning": f"Mean reversion LONG: z={zscore:.2f}, RSI={rsi:.1f} (oversold)",
-                "suggested_amount": amount,
-            }
+            confidence = 0.5 + abs(zscore) * 0.15 + (30 - rsi) * 0.005
+            confidence = confidence if confidence < 0.95 else 0.95
+            return 1, confidence, LazyReasoning(
+                "Mean reversion LONG: z={:.2f}, RSI={:.1f} (oversold)", zscore, rsi)
 
-        return {
-            "action": "hold", "side": "yes", "confidence": 0,
-            "reasoning": f"No reversion signal: z={zscore:.2f}, RSI={rsi:.1f}"
-        }
+        return 0, 0, LazyReasoning("No reversion signal: z={:.2f}, RSI={:.1f}", zscore, rsi)
+
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
+        """Bet against overextended moves."""
+        direction, confidence, reasoning = self._score(market, signals)
+        if not direction:
+            return TradeSignal(action="hold", side="yes", confidence=confidence, reasoning=reasoning)
+
+        return self._buy(
+            signals,
+            side="yes" if direction > 0 else "no",
+            confidence=confidence,
+            reasoning=reasoning,
+        )
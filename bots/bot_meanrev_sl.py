@@ -6,7 +6,6 @@ Because downside is capped at 25%, this bot trades more aggressively:
 - Willing to take marginal edges that a normal bot would skip
 """
 
-import config
 from bots.bot_mean_rev import MeanRevBot, DEFAULT_PARAMS
 
 
@@ -20,8 +19,8 @@ class MeanRevSLBot(MeanRevBot):
             params=params or DEFAULT_PARAMS.copy(),
             generation=generation,
             lineage=lineage,
+            strategy_type="mean_reversion_sl",
         )
-        self.strategy_type = "mean_reversion_sl"
 
     def make_decision(self, market, signals):
         """SL bot: scale up position size since downside is capped at 25%.
@@ -31,10 +30,10 @@ class MeanRevSLBot(MeanRevBot):
         """
         decision = super().make_decision(market, signals)
 
-        if decision.get("action") == "buy":
+        if decision.action == "buy":
             # Scale up position size — max loss is 25% of position, not 100%
-            amount = decision.get("suggested_amount", 0) * 1.5
-            decision["suggested_amount"] = min(amount, config.get_max_position())
-            decision["reasoning"] += " [SL: 1.5x size, loss capped 25%]"
+            amount = (decision.suggested_amount or 0) * 1.5
+            decision.suggested_amount = min(amount, self.max_position(signals))
+            decision.reasoning += " [SL: 1.5x size, loss capped 25%]"
 
         return decision
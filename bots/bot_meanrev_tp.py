@@ -23,8 +23,8 @@ class MeanRevTPBot(MeanRevBot):
             params=params or DEFAULT_PARAMS.copy(),
             generation=generation,
             lineage=lineage,
+            strategy_type="mean_reversion_tp",
         )
-        self.strategy_type = "mean_reversion_tp"
 
     def make_decision(self, market, signals):
         """TP bot: enter when base logic says buy, monitor for 2x exit.
@@ -34,7 +34,7 @@ class MeanRevTPBot(MeanRevBot):
         """
         decision = super().make_decision(market, signals)
 
-        if decision.get("action") == "buy":
-            decision["reasoning"] += " [TP: monitoring for 2x exit @0.5s]"
+        if decision.action == "buy":
+            decision.reasoning += " [TP: monitoring for 2x exit @0.5s]"
 
         return decision
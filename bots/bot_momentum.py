@@ -1,6 +1,7 @@
 """Bot 1: Momentum / Trend Following strategy."""
 
-from bots.base_bot import BaseBot
+import indicators
+from bots.base_bot import BaseBot, LazyReasoning, TradeSignal
 
 DEFAULT_PARAMS = {
     "lookback_candles": 5,
@@ -12,6 +13,45 @@ DEFAULT_PARAMS = {
 }
 
 
+def _momentum_score(feats, lookback, threshold, tw, vw):
+    """MomentumBot's (direction, confidence, reasoning) for one tick's candles."""
+    if len(feats.prices) < lookback:
+        return 0, 0, "insufficient price data"
+
+    pct_change = feats.pct_change(lookback)
+    if pct_change is None:
+        return 0, 0, "zero price"
+
+    # Calculate trend strength (consecutive moves in same direction)
+    trend_strength = feats.trend_strength(lookback)
+
+    # Volume signal (if available)
+    n_vol = len(feats.volumes)
+    vol_signal = 0.5
+    if n_vol >= lookback:
+        recent_vol = feats.volume_sum(n_vol - lookback, n_vol)
+        prev_vol = (feats.volume_sum(n_vol - lookback * 2, n_vol - lookback)
+                    if n_vol >= lookback * 2 else recent_vol)
+        vol_ratio = recent_vol / (prev_vol if prev_vol > 1 else 1)
+        vol_signal = (vol_ratio if vol_ratio < 1.0 else 1.0) * 0.5 + 0.25
+
+    # Combine signals
+    confidence = (trend_strength * tw + vol_signal * vw)
+
+    if abs(pct_change) < threshold:
+        return 0, confidence, LazyReasoning(
+            "momentum {:.4f} below threshold {}", pct_change, threshold)
+
+    return (
+        1 if pct_change > 0 else -1,
+        confidence if confidence < 0.95 else 0.95,
+        LazyReasoning(
+            "Momentum {:.4f} ({} candles), trend_str={:.2f}, vol={:.2f}",
+            pct_change, lookback, trend_strength, vol_signal,
+        ),
+    )
+
+
 class MomentumBot(BaseBot):
     def __init__(self, name="momentum-v1", params=None, generation=0, lineage=None):
         super().__init__(
@@ -22,58 +62,34 @@ class MomentumBot(BaseBot):
             lineage=lineage,
         )
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def _score(self, market: dict, signals: dict):
+        """Numeric core of analyze(): (direction, confidence, reasoning).
+
+        direction is +1 (yes), -1 (no) or 0 (hold). reasoning is lazy, so
+        callers that only need the numbers (HybridBot) never format it.
+
+        The score depends only on the tick's candles and these params, not
+        on the market, so it is computed once per tick and shared by every
+        market (and every momentum bot with the same params).
+        """
+        feats = indicators.shared(signals)
+        p = self.strategy_params
+        lookback = p["lookback_candles"]
+        threshold = p["momentum_threshold"]
+        tw = p["trend_strength_weight"]
+        vw = p["volume_weight"]
+        return feats.memo(("momentum_score", lookback, threshold, tw, vw),
+                          _momentum_score, feats, lookback, threshold, tw, vw)
+
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         """Trade in the direction of short-term price momentum."""
-        prices = signals.get("prices", [])
-        if len(prices) < self.strategy_params["lookback_candles"]:
-            return {"action": "hold", "side": "yes", "confidence": 0, "reasoning": "insufficient price data"}
-
-        lookback = self.strategy_params["lookback_candles"]
-        recent = prices[-lookback:]
-        oldest = recent[0]
-        newest = recent[-1]
-
-        if oldest == 0:
-            return {"action": "hold", "side": "yes", "confidence": 0, "reasoning": "zero price"}
-
-        pct_change = (newest - oldest) / oldest
-        threshold = self.strategy_params["momentum_threshold"]
-
-        # Calculate trend strength (consecutive moves in same direction)
-        consecutive = 0
-        for i in range(1, len(recent)):
-            if pct_change > 0 and recent[i] > recent[i-1]:
-                consecutive += 1
-            elif pct_change < 0 and recent[i] < recent[i-1]:
-                consecutive += 1
-
-        trend_strength = consecutive / (len(recent) - 1) if len(recent) > 1 else 0
-
-        # Volume signal (if available)
-        volumes = signals.get("volumes", [])
-        vol_signal = 0.5
-        if len(volumes) >= lookback:
-            recent_vol = sum(volumes[-lookback:])
-            prev_vol = sum(volumes[-lookback*2:-lookback]) if len(volumes) >= lookback*2 else recent_vol
-            vol_signal = min(1.0, recent_vol / max(prev_vol, 1)) * 0.5 + 0.25
-
-        # Combine signals
-        tw = self.strategy_params["trend_strength_weight"]
-        vw = self.strategy_params["volume_weight"]
-        confidence = (trend_strength * tw + vol_signal * vw)
-
-        if abs(pct_change) < threshold:
-            return {"action": "hold", "side": "yes", "confidence": confidence,
-                    "reasoning": f"momentum {pct_change:.4f} below threshold {threshold}"}
-
-        side = "yes" if pct_change > 0 else "no"
-        import config
-        amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-
-        return {
-            "action": "buy",
-            "side": side,
-            "confidence": min(confidence, 0.95),
-            "reasoning": f"Momentum {pct_change:.4f} ({lookback} candles), trend_str={trend_strength:.2f}, vol={vol_signal:.2f}",
-            "suggested_amount": amount,
-        }
+        direction, confidence, reasoning = self._score(market, signals)
+        if not direction:
+            return TradeSignal(action="hold", side="yes", confidence=confidence, reasoning=reasoning)
+
+        return self._buy(
+            signals,
+            side="yes" if direction > 0 else "no",
+            confidence=confidence,
+            reasoning=reasoning,
+        )
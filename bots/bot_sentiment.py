@@ -1,6 +1,9 @@
 """Bot 3: Sentiment-based strategy using X/social signals."""
 
-from bots.base_bot import BaseBot
+import functools
+
+from bots.base_bot import BaseBot, LazyReasoning, TradeSignal
+from signals.sentiment import Sentiment
 
 DEFAULT_PARAMS = {
     "sentiment_window_min": 5,
@@ -15,6 +18,57 @@ DEFAULT_PARAMS = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _sentiment_score(sentiment, min_posts, influencer_weight, sw, mw,
+                     bullish_thresh, bearish_thresh):
+    """SentimentBot's (direction, confidence, reasoning) for one reading.
+
+    Sentiment is frozen and hashable, and the feed emits one per tick, so
+    every market (and bot with the same params) shares one computation.
+    """
+    score = sentiment.score
+    post_count = sentiment.post_count
+    influencer_score = sentiment.influencer_score
+    momentum = sentiment.momentum
+
+    # Filter noise: need minimum posts to trust the signal
+    if post_count < min_posts:
+        return 0, 0, LazyReasoning("too few posts ({}) for reliable signal", post_count)
+
+    # Weight influencer sentiment higher
+    weighted_score = (
+        score + (influencer_score - 0.5) * influencer_weight
+    ) / (1 + influencer_weight * 0.5)
+    weighted_score = weighted_score if weighted_score < 1 else 1
+    weighted_score = weighted_score if weighted_score > 0 else 0
+
+    # Combine raw sentiment with momentum
+    # Momentum > 0 means sentiment is improving
+    momentum_signal = 0.5 + momentum * 5  # scale momentum
+    momentum_signal = momentum_signal if momentum_signal < 1 else 1
+    momentum_signal = momentum_signal if momentum_signal > 0 else 0
+
+    combined = weighted_score * sw + momentum_signal * mw
+
+    if combined > bullish_thresh:
+        confidence = 0.5 + (combined - bullish_thresh) * 2
+        confidence = confidence if confidence < 0.95 else 0.95
+        return 1, confidence, LazyReasoning(
+            "Bullish sentiment: score={:.2f}, influencer={:.2f}, momentum={:.3f}, posts={}",
+            score, influencer_score, momentum, post_count,
+        )
+
+    if combined < bearish_thresh:
+        confidence = 0.5 + (bearish_thresh - combined) * 2
+        confidence = confidence if confidence < 0.95 else 0.95
+        return -1, confidence, LazyReasoning(
+            "Bearish sentiment: score={:.2f}, influencer={:.2f}, momentum={:.3f}, posts={}",
+            score, influencer_score, momentum, post_count,
+        )
+
+    return 0, 0, LazyReasoning("Neutral sentiment: combined={:.2f}", combined)
+
+
 class SentimentBot(BaseBot):
     def __init__(self, name="sentiment-v1", params=None, generation=0, lineage=None):
         super().__init__(
@@ -25,74 +79,41 @@ class SentimentBot(BaseBot):
             lineage=lineage,
         )
 
-    def analyze(self, market: dict, signals: dict) -> dict:
+    def _score(self, market: dict, signals: dict):
+        """Numeric core of analyze(): (direction, confidence, reasoning).
+
+        direction is +1 (yes), -1 (no) or 0 (hold). reasoning is lazy, so
+        callers that only need the numbers (HybridBot) never format it.
+        """
+        sentiment = signals.get("sentiment")
+
+        if not sentiment:
+            return 0, 0, "no sentiment data"
+
+        # signals.sentiment.Sentiment; the older dict form is still accepted
+        if isinstance(sentiment, dict):
+            sentiment = Sentiment.from_dict(sentiment)
+
+        p = self.strategy_params
+        return _sentiment_score(
+            sentiment,
+            p["noise_filter_min_posts"],
+            p["influencer_weight"],
+            p["raw_sentiment_weight"],
+            p["sentiment_momentum_weight"],
+            p["bullish_threshold"],
+            p["bearish_threshold"],
+        )
+
+    def analyze(self, market: dict, signals: dict) -> TradeSignal:
         """Trade based on X/social sentiment for BTC/SOL."""
-        sentiment_data = signals.get("sentiment", {})
-
-        if not sentiment_data:
-            return {"action": "hold", "side": "yes", "confidence": 0, "reasoning": "no sentiment data"}
-
-        # Sentiment data expected format:
-        # {
-        #   "score": 0.0-1.0 (0=bearish, 0.5=neutral, 1=bullish),
-        #   "post_count": int,
-        #   "influencer_score": 0.0-1.0,
-        #   "momentum": float (change in sentiment over window),
-        # }
-
-        score = sentiment_data.get("score", 0.5)
-        post_count = sentiment_data.get("post_count", 0)
-        influencer_score = sentiment_data.get("influencer_score", 0.5)
-        momentum = sentiment_data.get("momentum", 0)
-
-        # Filter noise: need minimum posts to trust the signal
-        if post_count < self.strategy_params["noise_filter_min_posts"]:
-            return {"action": "hold", "side": "yes", "confidence": 0,
-                    "reasoning": f"too few posts ({post_count}) for reliable signal"}
-
-        # Weight influencer sentiment higher
-        weighted_score = (
-            score + (influencer_score - 0.5) * self.strategy_params["influencer_weight"]
-        ) / (1 + self.strategy_params["influencer_weight"] * 0.5)
-        weighted_score = max(0, min(1, weighted_score))
-
-        # Combine raw sentiment with momentum
-        sw = self.strategy_params["raw_sentiment_weight"]
-        mw = self.strategy_params["sentiment_momentum_weight"]
-        # Momentum > 0 means sentiment is improving
-        momentum_signal = 0.5 + momentum * 5  # scale momentum
-        momentum_signal = max(0, min(1, momentum_signal))
-
-        combined = weighted_score * sw + momentum_signal * mw
-
-        bullish_thresh = self.strategy_params["bullish_threshold"]
-        bearish_thresh = self.strategy_params["bearish_threshold"]
-
-        if combined > bullish_thresh:
-            confidence = min(0.95, 0.5 + (combined - bullish_thresh) * 2)
-            import config
-            amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-            return {
-                "action": "buy",
-                "side": "yes",
-                "confidence": confidence,
-                "reasoning": f"Bullish sentiment: score={score:.2f}, influencer={influencer_score:.2f}, momentum={momentum:.3f}, posts={post_count}",
-                "suggested_amount": amount,
-            }
-
-        if combined < bearish_thresh:
-            confidence = min(0.95, 0.5 + (bearish_thresh - combined) * 2)
-            import config
-            amount = config.get_max_position() * self.strategy_params["position_size_pct"]
-            return {
-                "action": "buy",
-                "side": "no",
-                "confidence": confidence,
-                "reasoning": f"Bearish sentiment: score={score:.2f}, influencer={influencer_score:.2f}, momentum={momentum:.3f}, posts={post_count}",
-                "suggested_amount": amount,
-            }
-
-        return {
-            "action": "hold", "side": "yes", "confidence": 0,
-            "reasoning": f"Neutral sentiment: combined={combined:.2f}"
-        }
+        direction, confidence, reasoning = self._score(market, signals)
+        if not direction:
+            return TradeSignal(action="hold", side="yes", confidence=confidence, reasoning=reasoning)
+
+        return self._buy(
+            signals,
+            side="yes" if direction > 0 else "no",
+            confidence=confidence,
+            reasoning=reasoning,
+        )
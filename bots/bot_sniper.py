@@ -10,9 +10,8 @@ v2 adjustments from sniper-v1 trade data (13 trades):
 Trades less often but with much higher accuracy.
 """
 
-import config
 import learning
-from bots.base_bot import BaseBot
+from bots.base_bot import BaseBot, TradeSignal
 
 DEFAULT_PARAMS = {
     "min_price_yes": 0.40,     # Min YES price for YES bets
@@ -39,7 +38,7 @@ class SniperBot(BaseBot):
 
     def analyze(self, market, signals):
         """Only emit a signal when conditions match high-WR patterns."""
-        return {"action": "hold", "side": "yes", "confidence": 0, "reasoning": "sniper: no signal"}
+        return TradeSignal(action="hold", side="yes", confidence=0, reasoning="sniper: no signal")
 
     def make_decision(self, market, signals):
         """Override full decision logic — pure data-driven rules.
@@ -74,20 +73,20 @@ class SniperBot(BaseBot):
 
         # --- Rule 1: Skip coin-flip zone (50-58c) ---
         if skip_lo <= market_price <= skip_hi:
-            return {
-                "action": "skip", "side": "yes", "confidence": 0,
-                "reasoning": f"sniper: skip coin-flip zone price={market_price:.2f}",
-                "suggested_amount": 0, "features": features,
-            }
+            return TradeSignal(
+                action="skip", side="yes", confidence=0,
+                reasoning=f"sniper: skip coin-flip zone price={market_price:.2f}",
+                suggested_amount=0, features=features,
+            )
 
         # --- Rule 2: Skip bad risk/reward zone (>85c for YES) ---
         if market_price > max_yes:
             # YES shares too expensive, profit tiny on win, loss huge on loss
-            return {
-                "action": "skip", "side": "yes", "confidence": 0,
-                "reasoning": f"sniper: skip bad r/r price={market_price:.2f} (>85c)",
-                "suggested_amount": 0, "features": features,
-            }
+            return TradeSignal(
+                action="skip", side="yes", confidence=0,
+                reasoning=f"sniper: skip bad r/r price={market_price:.2f} (>85c)",
+                suggested_amount=0, features=features,
+            )
 
         # --- Determine side ---
         side = None
@@ -110,37 +109,37 @@ class SniperBot(BaseBot):
 
         # NO zone: banned — NO bets lose at all confidence levels (44% WR, -$132 all-time)
         elif market_price <= max_no:
-            return {
-                "action": "skip", "side": "no", "confidence": 0,
-                "reasoning": f"sniper: NO ban (price={market_price:.2f} in NO zone, but NO bets lose money)",
-                "suggested_amount": 0, "features": features,
-            }
+            return TradeSignal(
+                action="skip", side="no", confidence=0,
+                reasoning=f"sniper: NO ban (price={market_price:.2f} in NO zone, but NO bets lose money)",
+                suggested_amount=0, features=features,
+            )
 
         else:
             # 25-40c: marginal zone, skip
-            return {
-                "action": "skip", "side": "yes", "confidence": 0,
-                "reasoning": f"sniper: marginal zone price={market_price:.2f}",
-                "suggested_amount": 0, "features": features,
-            }
+            return TradeSignal(
+                action="skip", side="yes", confidence=0,
+                reasoning=f"sniper: marginal zone price={market_price:.2f}",
+                suggested_amount=0, features=features,
+            )
 
         # --- Rule 3: BTC momentum must confirm ---
         mom_thresh = p.get("momentum_threshold", 0.0003)
         if require_mom:
             if side == "yes" and btc_momentum < -mom_thresh:
                 # BTC dropping, don't bet YES
-                return {
-                    "action": "skip", "side": side, "confidence": confidence,
-                    "reasoning": f"sniper: BTC momentum negative ({btc_momentum:+.4f}), skip YES",
-                    "suggested_amount": 0, "features": features,
-                }
+                return TradeSignal(
+                    action="skip", side=side, confidence=confidence,
+                    reasoning=f"sniper: BTC momentum negative ({btc_momentum:+.4f}), skip YES",
+                    suggested_amount=0, features=features,
+                )
             if side == "no" and btc_momentum > mom_thresh:
                 # BTC rising, don't bet NO
-                return {
-                    "action": "skip", "side": side, "confidence": confidence,
-                    "reasoning": f"sniper: BTC momentum positive ({btc_momentum:+.4f}), skip NO",
-                    "suggested_amount": 0, "features": features,
-                }
+                return TradeSignal(
+                    action="skip", side=side, confidence=confidence,
+                    reasoning=f"sniper: BTC momentum positive ({btc_momentum:+.4f}), skip NO",
+                    suggested_amount=0, features=features,
+                )
 
         # --- Learned bias adjustment ---
         prior = 0.50
@@ -156,11 +155,11 @@ class SniperBot(BaseBot):
         # --- Minimum confidence gate ---
         min_conf = p.get("min_confidence", 0.10)
         if confidence < min_conf:
-            return {
-                "action": "skip", "side": side, "confidence": confidence,
-                "reasoning": f"sniper: conf {confidence:.2f} < {min_conf}",
-                "suggested_amount": 0, "features": features,
-            }
+            return TradeSignal(
+                action="skip", side=side, confidence=confidence,
+                reasoning=f"sniper: conf {confidence:.2f} < {min_conf}",
+                suggested_amount=0, features=features,
+            )
 
         # --- Early-window boost ---
         window_age = market.get("window_age_seconds")
@@ -177,7 +176,7 @@ class SniperBot(BaseBot):
             reasoning_parts.append(f"late-window-boost(rem={time_rem:.0f}s)")
 
         # --- Position sizing ---
-        max_pos = config.get_max_position()
+        max_pos = self.max_position(signals)
         size_pct = p.get("position_size_pct", 0.08)
         if window_age is not None and 0 <= window_age < 90:
             size_pct *= 1.2  # Larger positions in early window
@@ -190,11 +189,11 @@ class SniperBot(BaseBot):
         reasoning_parts.append(mom_str)
         reasoning_parts.append(f"=> {side} conf={confidence:.2f}")
 
-        return {
-            "action": "buy",
-            "side": side,
-            "confidence": confidence,
-            "reasoning": "sniper: " + " ".join(reasoning_parts),
-            "suggested_amount": amount,
-            "features": features,
-        }
+        return TradeSignal(
+            action="buy",
+            side=side,
+            confidence=confidence,
+            reasoning="sniper: " + " ".join(reasoning_parts),
+            suggested_amount=amount,
+            features=features,
+        )
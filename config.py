@@ -3,6 +3,7 @@ Polymarket Bot Arena Configuration
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 # Trading Mode: "paper" (default, uses $SIM) or "live" (real USDC)
@@ -20,6 +21,10 @@ SIMMER_BOT_KEYS_PATH = Path.home() / ".config/simmer/bot_keys.json"
 POLYMARKET_KEY_PATH = Path.home() / ".config/polymarket/credentials.json"
 POLYMARKET_HOST = "https://clob.polymarket.com"
 POLYMARKET_CHAIN_ID = 137  # Polygon
+# L2 API creds derived from the wallet key, saved so a restart skips the
+# signing round-trip. Re-derived when older than the max age or the wallet changes.
+POLYMARKET_DERIVED_CREDS_PATH = Path.home() / ".config/polymarket/derived_creds.json"
+POLYMARKET_DERIVED_CREDS_MAX_AGE_DAYS = 30
 
 # Database
 DB_PATH = Path(__file__).parent / "bot_arena.db"
@@ -101,6 +106,32 @@ def get_venue():
     return "polymarket" if TRADING_MODE == "live" else "simmer"
 
 
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Mode-dependent settings frozen for one arena tick."""
+    mode: str
+    venue: str
+    max_position: float
+    max_daily_loss_per_bot: float
+    max_daily_loss_total: float
+    mutation_rate: float
+    # db.get_daily_losses() taken with the snapshot; None = query per check
+    daily_losses: dict = None
+
+
+def snapshot(daily_losses: dict = None) -> ConfigSnapshot:
+    """Read the mode-dependent settings once, for reuse across a whole tick"""
+    return ConfigSnapshot(
+        mode=get_current_mode(),
+        venue=get_venue(),
+        max_position=get_max_position(),
+        max_daily_loss_per_bot=get_max_daily_loss_per_bot(),
+        max_daily_loss_total=get_max_daily_loss_total(),
+        mutation_rate=MUTATION_RATE,
+        daily_losses=daily_losses,
+    )
+
+
 def set_trading_mode(mode: str):
     """
     Set trading mode (paper or live)
@@ -4,12 +4,20 @@ import logging
 import sys
 from pathlib import Path
 
+import orjson
+import requests
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import config
 import db
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive session for Simmer copytrading calls; the Authorization header
+# is still set per call since the API key can differ between calls
+_SESSION = requests.Session()
+_SESSION.headers["Content-Type"] = "application/json"
+
 
 class TradeCopier:
     def __init__(self, tracker):
@@ -31,37 +39,38 @@ class TradeCopier:
         top_n = min(10, len(addresses))
 
         try:
-            import requests
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            }
+            headers = {"Authorization": f"Bearer {api_key}"}
             payload = {
                 "wallets": addresses[:config.COPYTRADING_MAX_WALLETS_TO_TRACK],
                 "max_usd_per_position": max_usd,
                 "top_n": top_n,
             }
 
-            resp = requests.post(
+            resp = _SESSION.post(
                 f"{config.SIMMER_BASE_URL}/api/sdk/copytrading/execute",
-                headers=headers, json=payload, timeout=30
+                headers=headers, data=orjson.dumps(payload), timeout=30
             )
 
             if resp.status_code in (200, 201):
-                result = resp.json()
+                result = orjson.loads(resp.content)
                 trades = result.get("trades", [])
-                for t in trades:
-                    db.log_trade(
+                # One transaction for the whole batch, not one per trade
+                venue = config.get_venue()
+                mode = config.get_current_mode()
+                db.log_trades_bulk([
+                    dict(
                         bot_name="copytrade",
                         market_id=t.get("market_id", ""),
                         market_question=t.get("market_question", ""),
                         side=t.get("side", ""),
                         amount=t.get("amount", 0),
-                        venue=config.get_venue(),
-                        mode=config.get_current_mode(),
+                        venue=venue,
+                        mode=mode,
                         reasoning=f"Copied from wallet {t.get('wallet', '')[:12]}",
                         trade_id=t.get("trade_id"),
                     )
+                    for t in trades
+                ])
                 logger.info(f"Copied {len(trades)} trades from {len(addresses)} wallets")
                 return trades
             else:
@@ -77,8 +86,8 @@ class TradeCopier:
         with db.get_conn() as conn:
             row = conn.execute("""
                 SELECT COUNT(*) as total, COALESCE(SUM(pnl), 0) as total_pnl,
-                       SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                       SUM(CASE WHEN pnl <= 0 AND outcome IS NOT NULL THEN 1 ELSE 0 END) as losses
+                       COUNT(*) FILTER (WHERE pnl > 0) as wins,
+                       COUNT(*) FILTER (WHERE pnl <= 0 AND outcome IS NOT NULL) as losses
                 FROM trades WHERE bot_name='copytrade'
             """).fetchone()
             d = dict(row)
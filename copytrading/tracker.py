@@ -4,14 +4,26 @@ import json
 import logging
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import config
 import db
 
 logger = logging.getLogger(__name__)
 
+SCAN_CONCURRENCY = 8  # parallel position fetches, within Simmer's rate limits
+
+# Keep-alive session for position fetches, so a scan reuses warm TLS
+# connections instead of handshaking per wallet
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=SCAN_CONCURRENCY))
+
 
 class WalletTracker:
     def __init__(self):
@@ -38,25 +50,34 @@ class WalletTracker:
     def get_wallet_positions(self, address: str, api_key: str) -> list:
         """Get positions for a tracked wallet."""
         try:
-            import requests
             headers = {"Authorization": f"Bearer {api_key}"}
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"{config.SIMMER_BASE_URL}/api/sdk/wallet/{address}/positions",
                 headers=headers, timeout=15
             )
             if resp.status_code == 200:
-                return resp.json().get("positions", [])
+                return orjson.loads(resp.content).get("positions", [])
         except Exception as e:
             logger.error(f"Error fetching wallet {address[:12]} positions: {e}")
         return []
 
     def scan_all(self, api_key: str) -> dict:
-        """Scan all tracked wallets for current positions."""
-        results = {}
-        for address in list(self.tracked_wallets):
-            positions = self.get_wallet_positions(address, api_key)
-            results[address] = positions
-            self.tracked_wallets[address]["last_check"] = time.time()
+        """Scan all tracked wallets for current positions.
+
+        Wallets are fetched concurrently (at most SCAN_CONCURRENCY at a
+        time), so a scan costs about one round-trip rather than one per wallet.
+        """
+        addresses = list(self.tracked_wallets)
+        if not addresses:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(SCAN_CONCURRENCY, len(addresses))) as ex:
+            positions = ex.map(lambda a: self.get_wallet_positions(a, api_key), addresses)
+            results = dict(zip(addresses, positions))
+        now = time.time()
+        for address in addresses:
+            wallet = self.tracked_wallets.get(address)
+            if wallet is not None:
+                wallet["last_check"] = now
         return results
 
     def get_tracked(self) -> list:
@@ -1,15 +1,25 @@
 """FastAPI dashboard backend for the Bot Arena."""
 
+import asyncio
+import base64
+import functools
+import hashlib
+import hmac
 import json
+import os
 import secrets
 import sys
+import threading
 import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from fastapi import FastAPI, Request, Depends, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.staticfiles import StaticFiles
 import config
@@ -34,21 +44,88 @@ def verify_auth(credentials: HTTPBasicCredentials = Depends(security)):
     return credentials.username
 
 
-app = FastAPI(title="Polymarket Bot Arena Dashboard", dependencies=[Depends(verify_auth)])
-
-# Balance cache: key -> {"balance": float, "fetched_at": float}
+app = FastAPI(
+    title="Polymarket Bot Arena Dashboard",
+    dependencies=[Depends(verify_auth)],
+    default_response_class=ORJSONResponse,
+)
+
+# Keep-alive session for Simmer/Polymarket lookups, so each balance fetch on
+# an /api/bots poll reuses a warm TLS connection. Only GETs go through it.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
+
+# (connect, read) per upstream call
+HTTP_TIMEOUTS = {
+    "balance": (3, 10),
+    "markets": (3, 10),
+}
+
+# Balance cache: key -> {"balance": float, "fetched_at": float}. Keys are
+# slot names plus "polymarket_live"; capped so retired slots can't pile up.
 _balance_cache = {}
 BALANCE_CACHE_TTL = 60  # seconds
+BALANCE_CACHE_MAX = 64
+
+# Per-key fetch locks: /api/bots polls that miss together wait for the first
+# caller's fetch instead of all hitting Simmer/Polymarket for the same slot
+_balance_locks = {}
+_balance_locks_guard = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json(path, mtime_ns, size):
+    with open(path) as f:
+        return json.load(f)
+
+
+def read_json_cached(path):
+    """json.load() of a small config file, re-read only when it changes.
+
+    Keyed on (mtime, size), so rewriting the file is picked up on the next
+    call. The result is shared between callers: don't mutate it.
+    """
+    st = os.stat(path)
+    return _read_json(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _cached_balance(cache_key, now):
+    """The cached entry for cache_key if still fresh, else None."""
+    cached = _balance_cache.get(cache_key)
+    if cached and (now - cached["fetched_at"]) < BALANCE_CACHE_TTL:
+        return cached
+    return None
+
+
+def _store_balance(cache_key, balance, now):
+    if cache_key not in _balance_cache and len(_balance_cache) >= BALANCE_CACHE_MAX:
+        for key in [k for k, v in _balance_cache.items()
+                    if now - v["fetched_at"] >= BALANCE_CACHE_TTL]:
+            del _balance_cache[key]
+        if len(_balance_cache) >= BALANCE_CACHE_MAX:
+            # Everything is fresh: drop the oldest entry
+            del _balance_cache[min(_balance_cache, key=lambda k: _balance_cache[k]["fetched_at"])]
+    _balance_cache[cache_key] = {"balance": balance, "fetched_at": now}
+
+
+def _balance_lock(cache_key):
+    with _balance_locks_guard:
+        lock = _balance_locks.get(cache_key)
+        if lock is None:
+            lock = _balance_locks[cache_key] = threading.Lock()
+        return lock
 
 
 def _fetch_slot_balance(api_key):
     """Fetch balance for a Simmer account."""
-    import requests
     try:
         headers = {"Authorization": f"Bearer {api_key}"}
-        resp = requests.get(
+        resp = _http.get(
             f"{config.SIMMER_BASE_URL}/api/sdk/agents/me",
-            headers=headers, timeout=10,
+            headers=headers, timeout=HTTP_TIMEOUTS["balance"],
         )
         if resp.status_code == 200:
             data = resp.json()
@@ -58,62 +135,71 @@ def _fetch_slot_balance(api_key):
     return None
 
 
-def get_bot_balance(slot_name, bot_keys, trading_mode="paper"):
-    """Get cached or fresh balance for a bot slot. Live bots show Polymarket USDC balance."""
-    cache_key = "polymarket_live" if trading_mode == "live" else slot_name
-    now = time.time()
-    cached = _balance_cache.get(cache_key)
-    if cached and (now - cached["fetched_at"]) < BALANCE_CACHE_TTL:
-        return cached["balance"], trading_mode == "live"
+@functools.lru_cache(maxsize=4)
+def _decode_secret(api_secret):
+    return base64.urlsafe_b64decode(api_secret)
 
-    if trading_mode == "live":
-        try:
-            import hmac as _hmac
-            import hashlib as _hashlib
-            import base64 as _base64
-            import json as _json
-            import requests as _req
-            from pathlib import Path as _Path
-            with open(_Path.home() / ".config/polymarket/credentials.json") as f:
-                creds = _json.load(f)
-            api_key = creds["api_key"]
-            api_secret = creds["api_secret"]
-            api_passphrase = creds["api_passphrase"]
-            signer_address = creds["signer_address"]
-            # Build HMAC signature for Level 2 auth
-            # signature_type=1 = POLY_PROXY (queries funder/proxy wallet balance)
-            ts = str(int(time.time()))
-            msg = ts + "GET" + "/balance-allowance"
-            secret_bytes = _base64.urlsafe_b64decode(api_secret)
-            sig = _base64.urlsafe_b64encode(
-                _hmac.new(secret_bytes, msg.encode(), _hashlib.sha256).digest()
-            ).decode()
-            headers = {
-                "POLY_ADDRESS": signer_address,
-                "POLY_SIGNATURE": sig,
-                "POLY_TIMESTAMP": ts,
-                "POLY_API_KEY": api_key,
-                "POLY_PASSPHRASE": api_passphrase,
-            }
-            resp = _req.get(
-                "https://clob.polymarket.com/balance-allowance"
-                "?asset_type=COLLATERAL&signature_type=1",
-                headers=headers, timeout=10,
-            )
-            data = resp.json()
-            raw = data.get("balance", "0") if isinstance(data, dict) else "0"
-            balance = int(raw) / 1e6
-        except Exception:
-            balance = None
-        _balance_cache[cache_key] = {"balance": balance, "fetched_at": now}
-        return balance, True
-
-    api_key = bot_keys.get(slot_name)
-    if not api_key:
-        return None, False
-    balance = _fetch_slot_balance(api_key)
-    _balance_cache[cache_key] = {"balance": balance, "fetched_at": now}
-    return balance, False
+
+def _fetch_live_balance():
+    """Polymarket USDC balance of the live trading wallet, or None."""
+    try:
+        creds = read_json_cached(config.POLYMARKET_KEY_PATH)
+        api_key = creds["api_key"]
+        api_passphrase = creds["api_passphrase"]
+        signer_address = creds["signer_address"]
+        # Build HMAC signature for Level 2 auth
+        # signature_type=1 = POLY_PROXY (queries funder/proxy wallet balance)
+        ts = str(int(time.time()))
+        msg = ts + "GET" + "/balance-allowance"
+        sig = base64.urlsafe_b64encode(
+            hmac.new(_decode_secret(creds["api_secret"]), msg.encode(), hashlib.sha256).digest()
+        ).decode()
+        headers = {
+            "POLY_ADDRESS": signer_address,
+            "POLY_SIGNATURE": sig,
+            "POLY_TIMESTAMP": ts,
+            "POLY_API_KEY": api_key,
+            "POLY_PASSPHRASE": api_passphrase,
+        }
+        resp = _http.get(
+            "https://clob.polymarket.com/balance-allowance"
+            "?asset_type=COLLATERAL&signature_type=1",
+            headers=headers, timeout=HTTP_TIMEOUTS["balance"],
+        )
+        data = resp.json()
+        raw = data.get("balance", "0") if isinstance(data, dict) else "0"
+        return int(raw) / 1e6
+    except Exception:
+        return None
+
+
+def get_bot_balance(slot_name, bot_keys, trading_mode="paper"):
+    """Get cached or fresh balance for a bot slot. Live bots show Polymarket USDC balance.
+
+    Blocking; called from worker threads. Concurrent misses on one key share
+    a single upstream fetch.
+    """
+    is_live = trading_mode == "live"
+    cache_key = "polymarket_live" if is_live else slot_name
+    cached = _cached_balance(cache_key, time.time())
+    if cached:
+        return cached["balance"], is_live
+
+    api_key = None
+    if not is_live:
+        api_key = bot_keys.get(slot_name)
+        if not api_key:
+            return None, False
+
+    with _balance_lock(cache_key):
+        # Another caller may have fetched it while we waited
+        now = time.time()
+        cached = _cached_balance(cache_key, now)
+        if cached:
+            return cached["balance"], is_live
+        balance = _fetch_live_balance() if is_live else _fetch_slot_balance(api_key)
+        _store_balance(cache_key, balance, now)
+    return balance, is_live
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -138,7 +224,7 @@ async def set_mode(request: Request):
     body = await request.json()
     mode = body.get("mode")
     if mode not in ("paper", "live"):
-        return JSONResponse({"error": "Mode must be 'paper' or 'live'"}, 400)
+        return ORJSONResponse({"error": "Mode must be 'paper' or 'live'"}, 400)
     config.set_trading_mode(mode)
     return {"mode": config.get_current_mode()}
 
@@ -148,7 +234,7 @@ async def set_bot_mode(bot_name: str, request: Request):
     body = await request.json()
     mode = body.get("mode")
     if mode not in ("paper", "live"):
-        return JSONResponse({"error": "Mode must be 'paper' or 'live'"}, 400)
+        return ORJSONResponse({"error": "Mode must be 'paper' or 'live'"}, 400)
     db.set_bot_mode(bot_name, mode)
     return {"bot_name": bot_name, "trading_mode": mode}
 
@@ -156,15 +242,14 @@ async def set_bot_mode(bot_name: str, request: Request):
 @app.get("/api/markets")
 async def get_markets():
     """Get active BTC 5-min markets with close times."""
-    import requests as req
     try:
-        api_key = json.load(open(config.SIMMER_API_KEY_PATH))["api_key"]
+        api_key = read_json_cached(config.SIMMER_API_KEY_PATH)["api_key"]
         headers = {"Authorization": f"Bearer {api_key}"}
-        resp = req.get(
+        resp = _http.get(
             f"{config.SIMMER_BASE_URL}/api/sdk/markets",
             headers=headers,
             params={"status": "active", "limit": 50},
-            timeout=10,
+            timeout=HTTP_TIMEOUTS["markets"],
         )
         data = resp.json()
         markets_list = data if isinstance(data, list) else data.get("markets", [])
@@ -179,22 +264,63 @@ async def get_markets():
                     "resolves_at": m.get("resolves_at"),
                     "url": m.get("url"),
                 })
-        return JSONResponse(btc_markets)
+        return ORJSONResponse(btc_markets)
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 @app.get("/api/overview")
 async def get_overview():
     stats = db.get_dashboard_stats()
     active_bots = db.get_active_bots()
-    return JSONResponse({
+    return ORJSONResponse({
         "stats": stats,
         "active_bots": active_bots,
         "mode": config.get_current_mode(),
     })
 
 
+def _build_bot_entry(i, bot_cfg, bot_keys, stats):
+    """One /api/bots row: config, stats from db.get_bots_bundle(), and balance.
+
+    Blocks on the balance HTTP call, so get_bots runs it in a worker thread.
+    """
+    # Parse params JSON string if needed (get_active_bots() rows are fresh
+    # dicts, so this edits our own copy)
+    cfg = bot_cfg
+    if isinstance(cfg.get("params"), str):
+        try:
+            cfg["params"] = json.loads(cfg["params"])
+        except (json.JSONDecodeError, TypeError):
+            pass
+    trading_mode = cfg.get("trading_mode") or "paper"
+
+    # Balance: Polymarket USDC for live bots, Simmer SIM for paper bots
+    slot_name = f"slot_{i}"
+    balance, balance_is_live = get_bot_balance(slot_name, bot_keys, trading_mode)
+
+    # For live bots, include the trading key address so dashboard can show where to deposit
+    trading_key_address = None
+    if trading_mode == "live":
+        try:
+            pk_creds = read_json_cached(config.POLYMARKET_KEY_PATH)
+            trading_key_address = pk_creds.get("signer_address")
+        except Exception:
+            pass
+
+    return {
+        "config": cfg,
+        "performance_12h": stats["performance_12h"],
+        "performance_24h": stats["performance_24h"],
+        "recent_trades": stats["recent_trades"],
+        "pending_trades": stats["pending_trades"],
+        "trading_mode": trading_mode,
+        "balance": balance,
+        "balance_is_live": balance_is_live,
+        "trading_key_address": trading_key_address,
+    }
+
+
 @app.get("/api/bots")
 async def get_bots():
     active = db.get_active_bots()
@@ -202,66 +328,23 @@ async def get_bots():
     # Load bot keys for balance fetching
     bot_keys = {}
     try:
-        with open(config.SIMMER_BOT_KEYS_PATH) as f:
-            bot_keys = json.load(f)
+        bot_keys = read_json_cached(config.SIMMER_BOT_KEYS_PATH)
     except (FileNotFoundError, json.JSONDecodeError):
         pass
 
-    result = []
-    for i, bot_cfg in enumerate(active):
-        # Parse params JSON string if needed
-        cfg = dict(bot_cfg)
-        if isinstance(cfg.get("params"), str):
-            try:
-                cfg["params"] = json.loads(cfg["params"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        trading_mode = db.get_bot_mode(cfg["bot_name"])
-        is_live = trading_mode == "live"
-
-        # Live bots: show all-time live-only stats; paper bots: show 12h/24h paper stats
-        if is_live:
-            perf_12h = db.get_bot_performance(cfg["bot_name"], hours=None, mode="live")
-            perf_24h = perf_12h  # same — all live trades
-        else:
-            perf_12h = db.get_bot_performance(cfg["bot_name"], hours=12)
-            perf_24h = db.get_bot_performance(cfg["bot_name"], hours=24)
-
-        trades = db.get_bot_trades(cfg["bot_name"], limit=10)
-        # Count pending (unresolved) trades so dashboard shows activity
-        with db.get_conn() as conn:
-            row = conn.execute(
-                "SELECT COUNT(*) as c FROM trades WHERE bot_name=? AND outcome IS NULL",
-                (cfg["bot_name"],)
-            ).fetchone()
-            pending_count = dict(row)["c"]
-
-        # Balance: Polymarket USDC for live bots, Simmer SIM for paper bots
-        slot_name = f"slot_{i}"
-        balance, balance_is_live = get_bot_balance(slot_name, bot_keys, trading_mode)
-
-        # For live bots, include the trading key address so dashboard can show where to deposit
-        trading_key_address = None
-        if trading_mode == "live":
-            try:
-                with open(config.POLYMARKET_KEY_PATH) as f:
-                    pk_creds = json.load(f)
-                trading_key_address = pk_creds.get("signer_address")
-            except Exception:
-                pass
+    # Stats for every bot in a few grouped queries (live bots: all-time live
+    # stats; paper bots: 12h/24h stats)
+    live = [b["bot_name"] for b in active if b.get("trading_mode") == "live"]
+    paper = [b["bot_name"] for b in active if b.get("trading_mode") != "live"]
+    bundle = await asyncio.to_thread(db.get_bots_bundle, paper, live)
 
-        result.append({
-            "config": cfg,
-            "performance_12h": perf_12h,
-            "performance_24h": perf_24h,
-            "recent_trades": trades,
-            "pending_trades": pending_count,
-            "trading_mode": trading_mode,
-            "balance": balance,
-            "balance_is_live": balance_is_live,
-            "trading_key_address": trading_key_address,
-        })
-    return JSONResponse(result)
+    # Bots are independent: overlap their balance round-trips so the poll
+    # takes as long as the slowest bot, not the sum of all of them
+    result = await asyncio.gather(*(
+        asyncio.to_thread(_build_bot_entry, i, bot_cfg, bot_keys, bundle[bot_cfg["bot_name"]])
+        for i, bot_cfg in enumerate(active)
+    ))
+    return ORJSONResponse(result)
 
 
 @app.get("/api/evolution")
@@ -271,13 +354,13 @@ async def get_evolution():
         for key in ("survivors", "replaced", "new_bots", "rankings"):
             if isinstance(h.get(key), str):
                 h[key] = json.loads(h[key])
-    return JSONResponse(history)
+    return ORJSONResponse(history)
 
 
 @app.get("/api/trades")
 async def get_trades(bot: str = None, limit: int = 50):
     if bot:
-        return JSONResponse(db.get_bot_trades(bot, limit=limit))
+        return ORJSONResponse(db.get_bot_trades(bot, limit=limit))
     with db.get_conn() as conn:
         # Show trades with real P&L first, then pending. Skip phantom pnl=0 resolved trades.
         rows = conn.execute(
@@ -288,7 +371,7 @@ async def get_trades(bot: str = None, limit: int = 50):
                    resolved_at DESC, created_at DESC
                LIMIT ?""", (limit,)
         ).fetchall()
-        return JSONResponse([dict(r) for r in rows])
+        return ORJSONResponse([dict(r) for r in rows])
 
 
 @app.get("/api/copytrading")
@@ -311,19 +394,19 @@ async def get_copytrading():
                    FROM trades WHERE bot_name=? ORDER BY created_at DESC LIMIT 5""",
                 (bot_name,),
             ).fetchall()
-        p = dict(perf)
-        total = (p.get("wins") or 0) + (p.get("losses") or 0)
+        wins = perf["wins"] or 0
+        total = wins + (perf["losses"] or 0)
         result.append({
             "wallet": w["address"],
             "label": w["label"],
             "mode": w.get("trading_mode", "paper"),
-            "total_trades": p.get("total") or 0,
+            "total_trades": perf["total"] or 0,
             "resolved_trades": total,
-            "win_rate": (p.get("wins") or 0) / total if total > 0 else None,
-            "pnl": p.get("pnl") or 0,
+            "win_rate": wins / total if total > 0 else None,
+            "pnl": perf["pnl"] or 0,
             "recent_trades": [dict(r) for r in recent],
         })
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.get("/api/earnings")
@@ -345,7 +428,7 @@ async def get_earnings():
             "SELECT * FROM trades WHERE pnl IS NOT NULL ORDER BY pnl ASC LIMIT 5"
         ).fetchall()
 
-        return JSONResponse({
+        return ORJSONResponse({
             "daily": [dict(r) for r in daily],
             "best_trades": [dict(r) for r in best],
             "worst_trades": [dict(r) for r in worst],
@@ -359,7 +442,43 @@ async def get_learning():
     for bot_cfg in active:
         name = bot_cfg["bot_name"]
         result[name] = learning.get_bot_learning_summary(name)
-    return JSONResponse(result)
+    return ORJSONResponse(result)
+
+
+async def _dashboard_section(section):
+    """A section's JSON body; {"error": ...} if it raised, so one failing
+    section doesn't blank the rest of the page."""
+    try:
+        resp = await section
+    except Exception as e:
+        resp = {"error": str(e)}
+    if not isinstance(resp, Response):
+        resp = ORJSONResponse(resp)
+    return resp.body
+
+
+@app.get("/api/dashboard")
+async def get_dashboard(trades_limit: int = 50):
+    """Every section the dashboard page renders, in one response.
+
+    Same payloads as the individual endpoints, which stay for other clients.
+    Section bodies are spliced in as already-encoded JSON rather than decoded
+    and re-encoded.
+    """
+    sections = {
+        "status": get_status(),
+        "overview": get_overview(),
+        "bots": get_bots(),
+        "evolution": get_evolution(),
+        "trades": get_trades(limit=trades_limit),
+        "earnings": get_earnings(),
+        "copytrading": get_copytrading(),
+    }
+    bodies = await asyncio.gather(*(_dashboard_section(s) for s in sections.values()))
+    content = b"{" + b",".join(
+        b'"%s":%s' % (name.encode(), body) for name, body in zip(sections, bodies)
+    ) + b"}"
+    return Response(content, media_type="application/json")
 
 
 if __name__ == "__main__":
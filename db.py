@@ -1,7 +1,13 @@
 """SQLite database for all trades, bot performance, evolution history."""
 
+import atexit
 import sqlite3
 import json
+import logging
+import queue
+import threading
+import time
+from enum import Enum
 from pathlib import Path
 from datetime import datetime, timedelta
 from contextlib import contextmanager
@@ -9,6 +15,40 @@ import config
 
 DB_PATH = config.DB_PATH
 
+logger = logging.getLogger(__name__)
+
+
+class Side(str, Enum):
+    """trades.side values. str-valued so they bind and compare as the stored TEXT."""
+    YES = "yes"
+    NO = "no"
+
+
+class Outcome(str, Enum):
+    """trades.outcome values (NULL while the trade is open)."""
+    WIN = "win"
+    LOSS = "loss"
+    EXIT_TP = "exit_tp"
+    EXIT_SL = "exit_sl"
+    EXPIRED = "expired"
+
+
+# Applied to every connection. WAL lets the dashboard read while the arena
+# writes; NORMAL sync is safe under WAL and avoids an fsync per commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+# get_bot_performance_cached() entries: (bot_name, hours, mode) -> (fetched_at, stats).
+# Only resolutions change these stats, and both resolve paths below clear it.
+PERF_CACHE_TTL = 60
+_perf_cache = {}
+
 
 def init_db():
     with get_conn() as conn:
@@ -33,6 +73,19 @@ def init_db():
                 created_at TEXT DEFAULT (datetime('now'))
             );
 
+            -- Partial index: only open trades are indexed, so the resolve and
+            -- SL/TP monitor scans cost O(pending) instead of O(all trades)
+            CREATE INDEX IF NOT EXISTS idx_trades_pending
+                ON trades(bot_name) WHERE outcome IS NULL;
+
+            -- Per-bot daily loss/exposure sums (copy bots' loss cap)
+            CREATE INDEX IF NOT EXISTS idx_trades_bot_outcome_created
+                ON trades(bot_name, outcome, created_at);
+
+            -- Covers TradeCopier.get_copy_stats(): an index-only scan of one bot
+            CREATE INDEX IF NOT EXISTS idx_trades_copy_stats
+                ON trades(bot_name, pnl, outcome);
+
             CREATE TABLE IF NOT EXISTS bot_configs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 bot_name TEXT NOT NULL,
@@ -93,6 +146,14 @@ def init_db():
                 active INTEGER DEFAULT 1
             );
 
+            -- Every activity key a copy bot has handled (copied or skipped),
+            -- so skipped trades stay skipped across restarts
+            CREATE TABLE IF NOT EXISTS copytrading_seen (
+                wallet_address TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (wallet_address, key)
+            ) WITHOUT ROWID;
+
             CREATE TABLE IF NOT EXISTS copytrading_trades (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 wallet_address TEXT NOT NULL,
@@ -117,11 +178,31 @@ def init_db():
             except sqlite3.OperationalError:
                 pass  # Column already exists
 
+        # Covers CopyBot's seen-key load (needs the migrated source_tx_hash),
+        # so a restart reads the index alone instead of scanning the table
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_copytrading_wallet "
+            "ON copytrading_trades(wallet_address, source_tx_hash)"
+        )
+    optimize()
+
+
+def optimize():
+    """Refresh the planner's stats where they've gone stale.
+
+    Cheap unless they have. Run at startup and after each resolve batch, which
+    is when the pending set shrinks, rather than on every connection.
+    """
+    with get_conn() as conn:
+        conn.execute("PRAGMA optimize")
+
 
 @contextmanager
 def get_conn():
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     try:
         yield conn
         conn.commit()
@@ -129,27 +210,126 @@ def get_conn():
         conn.close()
 
 
+_INSERT_TRADE_SQL = """INSERT INTO trades (bot_name, market_id, market_question, side, amount,
+   confidence, reasoning, trade_features, venue, mode, trade_id, shares_bought)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _trade_row(bot_name, market_id, side, amount, venue, mode, confidence=None,
+               reasoning=None, market_question=None, trade_id=None, shares_bought=None,
+               trade_features=None):
+    return (bot_name, market_id, market_question, side, amount,
+            confidence, reasoning,
+            json.dumps(trade_features) if trade_features else None,
+            venue, mode, trade_id, shares_bought)
+
+
 def log_trade(bot_name, market_id, side, amount, venue, mode, confidence=None,
               reasoning=None, market_question=None, trade_id=None, shares_bought=None,
               trade_features=None):
     with get_conn() as conn:
         conn.execute(
-            """INSERT INTO trades (bot_name, market_id, market_question, side, amount,
-               confidence, reasoning, trade_features, venue, mode, trade_id, shares_bought)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (bot_name, market_id, market_question, side, amount,
-             confidence, reasoning,
-             json.dumps(trade_features) if trade_features else None,
-             venue, mode, trade_id, shares_bought)
+            _INSERT_TRADE_SQL,
+            _trade_row(bot_name, market_id, side, amount, venue, mode, confidence,
+                       reasoning, market_question, trade_id, shares_bought, trade_features)
         )
 
 
+def _write_trades(rows):
+    with get_conn() as conn:
+        conn.executemany(_INSERT_TRADE_SQL, rows)
+
+
+def log_trades_bulk(trades):
+    """Insert several trades (dicts of log_trade() arguments) in one transaction."""
+    if trades:
+        _write_trades([_trade_row(**t) for t in trades])
+
+
+# Background trade writer: log_trade_async() queues rows and one thread
+# inserts them in batches — one transaction per ~100ms burst, not per trade.
+TRADE_FLUSH_INTERVAL = 0.1
+TRADE_FLUSH_MAX = 100
+_trade_q = queue.Queue(maxsize=10_000)
+_trade_writer = None
+_trade_writer_lock = threading.Lock()
+
+
+def _trade_writer_loop():
+    while True:
+        batch = [_trade_q.get()]
+        deadline = time.monotonic() + TRADE_FLUSH_INTERVAL
+        while len(batch) < TRADE_FLUSH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_trade_q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _write_trades(batch)
+        except Exception as e:
+            logger.error(f"Trade log write failed for {len(batch)} trades: {e}")
+        finally:
+            for _ in batch:
+                _trade_q.task_done()
+
+
+def log_trade_async(**trade):
+    """Queue a trade row for the background writer; same arguments as log_trade().
+
+    Falls back to a synchronous insert if the queue is full.
+    """
+    global _trade_writer
+    if _trade_writer is None:
+        with _trade_writer_lock:
+            if _trade_writer is None:
+                _trade_writer = threading.Thread(
+                    target=_trade_writer_loop, name="trade-writer", daemon=True
+                )
+                _trade_writer.start()
+    row = _trade_row(**trade)
+    try:
+        _trade_q.put_nowait(row)
+    except queue.Full:
+        logger.warning("Trade log queue full — writing inline")
+        _write_trades([row])
+
+
+def flush_trades():
+    """Block until every queued trade row has been written."""
+    if _trade_writer is not None:
+        _trade_q.join()
+
+
+atexit.register(flush_trades)
+
+
 def resolve_trade(internal_id, outcome, pnl):
     with get_conn() as conn:
         conn.execute(
             "UPDATE trades SET outcome=?, pnl=?, resolved_at=datetime('now') WHERE id=?",
             (outcome, pnl, internal_id)
         )
+    _perf_cache.clear()
+
+
+def resolve_trades_bulk(resolutions):
+    """Resolve many trades in one write transaction.
+
+    resolutions: list of (internal_id, outcome, pnl) tuples.
+    """
+    if not resolutions:
+        return
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "UPDATE trades SET outcome=?, pnl=?, resolved_at=datetime('now') WHERE id=?",
+            [(outcome, pnl, internal_id) for internal_id, outcome, pnl in resolutions]
+        )
+    _perf_cache.clear()
+    optimize()
 
 
 def get_bot_trades(bot_name, hours=None, limit=50):
@@ -198,6 +378,22 @@ def get_bot_performance(bot_name, hours=12, mode=None):
         return result
 
 
+def get_bot_performance_cached(bot_name, hours=12, mode=None):
+    """get_bot_performance() memoised in-process for up to PERF_CACHE_TTL seconds.
+
+    For the trading hot path, which asks for every bot's record on every
+    market each cycle. Returns a fresh dict callers may modify.
+    """
+    key = (bot_name, hours, mode)
+    now = time.time()
+    cached = _perf_cache.get(key)
+    if cached is not None and now - cached[0] < PERF_CACHE_TTL:
+        return dict(cached[1])
+    perf = get_bot_performance(bot_name, hours, mode)
+    _perf_cache[key] = (now, perf)
+    return dict(perf)
+
+
 def get_all_bots_performance(hours=12):
     with get_conn() as conn:
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
@@ -223,6 +419,119 @@ def get_all_bots_performance(hours=12):
         return results
 
 
+_RESOLVED_OUTCOMES = "outcome IN ('win', 'loss', 'exit_tp', 'exit_sl')"
+
+
+def _perf_dict(total_trades=0, wins=0, losses=0, total_pnl=0, avg_pnl=0):
+    """Stats shaped like get_bot_performance()'s result."""
+    wins = wins or 0
+    losses = losses or 0
+    total = wins + losses
+    return {
+        "total_trades": total_trades,
+        "wins": wins,
+        "losses": losses,
+        "total_pnl": total_pnl,
+        "avg_pnl": avg_pnl,
+        "win_rate": wins / total if total > 0 else 0,
+    }
+
+
+def get_bots_bundle(paper_bots, live_bots=()):
+    """Everything the dashboard's bot cards need, for all bots at once.
+
+    Same numbers as calling, per bot, get_bot_performance() (12h and 24h for
+    paper bots; all-time live-mode for live bots), get_bot_trades(limit=10)
+    and a pending-trade count, but in one statement per aggregate rather
+    than four per bot, on one connection.
+
+    Returns {bot_name: {"performance_12h", "performance_24h",
+    "recent_trades", "pending_trades"}}.
+    """
+    paper_bots = list(dict.fromkeys(paper_bots))
+    live_bots = list(dict.fromkeys(live_bots))
+    names = paper_bots + live_bots
+    bundle = {
+        name: {"performance_12h": _perf_dict(), "performance_24h": _perf_dict(),
+               "recent_trades": [], "pending_trades": 0}
+        for name in names
+    }
+    if not names:
+        return bundle
+
+    now = datetime.utcnow()
+    cutoff_12h = (now - timedelta(hours=12)).strftime("%Y-%m-%d %H:%M:%S")
+    cutoff_24h = (now - timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
+
+    with get_conn() as conn:
+        if paper_bots:
+            # One pass over the last 24h; the 12h stats are the recent subset
+            marks = ",".join("?" * len(paper_bots))
+            rows = conn.execute(f"""
+                SELECT
+                    bot_name,
+                    COUNT(*) as total_24h,
+                    SUM(CASE WHEN outcome IN ('win', 'exit_tp') THEN 1 ELSE 0 END) as wins_24h,
+                    SUM(CASE WHEN outcome IN ('loss', 'exit_sl') THEN 1 ELSE 0 END) as losses_24h,
+                    COALESCE(SUM(pnl), 0) as pnl_24h,
+                    COALESCE(AVG(pnl), 0) as avg_24h,
+                    SUM(created_at>=?) as total_12h,
+                    SUM(created_at>=? AND outcome IN ('win', 'exit_tp')) as wins_12h,
+                    SUM(created_at>=? AND outcome IN ('loss', 'exit_sl')) as losses_12h,
+                    COALESCE(SUM(CASE WHEN created_at>=? THEN pnl END), 0) as pnl_12h,
+                    COALESCE(AVG(CASE WHEN created_at>=? THEN pnl END), 0) as avg_12h
+                FROM trades
+                WHERE bot_name IN ({marks}) AND {_RESOLVED_OUTCOMES} AND created_at>=?
+                GROUP BY bot_name
+            """, (*[cutoff_12h] * 5, *paper_bots, cutoff_24h)).fetchall()
+            for r in rows:
+                entry = bundle[r["bot_name"]]
+                entry["performance_24h"] = _perf_dict(
+                    r["total_24h"], r["wins_24h"], r["losses_24h"], r["pnl_24h"], r["avg_24h"])
+                entry["performance_12h"] = _perf_dict(
+                    r["total_12h"], r["wins_12h"], r["losses_12h"], r["pnl_12h"], r["avg_12h"])
+
+        if live_bots:
+            marks = ",".join("?" * len(live_bots))
+            rows = conn.execute(f"""
+                SELECT
+                    bot_name,
+                    COUNT(*) as total_trades,
+                    SUM(CASE WHEN outcome IN ('win', 'exit_tp') THEN 1 ELSE 0 END) as wins,
+                    SUM(CASE WHEN outcome IN ('loss', 'exit_sl') THEN 1 ELSE 0 END) as losses,
+                    COALESCE(SUM(pnl), 0) as total_pnl,
+                    COALESCE(AVG(pnl), 0) as avg_pnl
+                FROM trades
+                WHERE bot_name IN ({marks}) AND {_RESOLVED_OUTCOMES} AND mode='live'
+                GROUP BY bot_name
+            """, live_bots).fetchall()
+            for r in rows:
+                perf = _perf_dict(r["total_trades"], r["wins"], r["losses"],
+                                  r["total_pnl"], r["avg_pnl"])
+                # Live bots show all live trades in both slots
+                bundle[r["bot_name"]]["performance_12h"] = perf
+                bundle[r["bot_name"]]["performance_24h"] = perf
+
+        marks = ",".join("?" * len(names))
+        for r in conn.execute(f"""
+            SELECT bot_name, COUNT(*) as c FROM trades
+            WHERE outcome IS NULL AND bot_name IN ({marks})
+            GROUP BY bot_name
+        """, names):
+            bundle[r["bot_name"]]["pending_trades"] = r["c"]
+
+        # Each arm is the same top-10 lookup get_bot_trades() does
+        recent_sql = " UNION ALL ".join(
+            "SELECT * FROM (SELECT * FROM trades WHERE bot_name=? "
+            "ORDER BY created_at DESC LIMIT 10)"
+            for _ in names
+        )
+        for r in conn.execute(recent_sql, names):
+            bundle[r["bot_name"]]["recent_trades"].append(dict(r))
+
+    return bundle
+
+
 def save_bot_config(bot_name, strategy_type, generation, params, lineage=None):
     with get_conn() as conn:
         conn.execute(
@@ -320,6 +629,26 @@ def get_bot_daily_loss(bot_name, mode="paper"):
         return abs(dict(row)["total_loss"])
 
 
+def get_daily_losses():
+    """Today's realized losses for every bot in both modes, in one query.
+
+    Returns {mode: {bot_name: loss}} with losses as positive amounts; a
+    mode's arena-wide total (get_total_daily_loss) is the sum of its values.
+    """
+    with get_conn() as conn:
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        rows = conn.execute("""
+            SELECT mode, bot_name, SUM(pnl) as total_loss
+            FROM trades
+            WHERE date(created_at)=? AND pnl < 0 AND outcome IS NOT NULL
+            GROUP BY mode, bot_name
+        """, (today,)).fetchall()
+    losses = {}
+    for r in rows:
+        losses.setdefault(r["mode"], {})[r["bot_name"]] = abs(r["total_loss"])
+    return losses
+
+
 def get_dashboard_stats():
     with get_conn() as conn:
         today = datetime.utcnow().strftime("%Y-%m-%d")
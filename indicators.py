@@ -0,0 +1,162 @@
+"""Per-tick price indicators shared by every bot.
+
+MomentumBot, MeanRevBot, PhantomBot and LateWindowMakerBot all derive their
+indicators from the same BTC candle series, and every market in a tick sees
+the same series. The arena builds one FeatureCache per tick and puts it in
+signals["indicators"]. Each indicator is computed on first use and reused by
+every later bot and market that asks for the same parameters.
+
+Lookbacks are per-bot strategy params (evolution mutates them), so results
+are memoised per (indicator, parameter) rather than precomputed for a fixed
+set of periods.
+"""
+
+import numpy as np
+
+from bots._njit import njit
+
+
+@njit(cache=True)
+def _ema_loop(prices, alpha):
+    """EMA recurrence over the whole series, seeded with the first value.
+
+    One compiled kernel for every period: alpha is an argument, so a period
+    evolution hasn't seen before costs no JIT, and the on-disk cache means
+    restarts don't recompile.
+    """
+    ema = prices[0]
+    for i in range(1, prices.shape[0]):
+        ema = (prices[i] * alpha) + (ema * (1 - alpha))
+    return ema
+
+
+def ema(arr, period):
+    """EMA of the whole series; the plain mean when it is shorter than period."""
+    if len(arr) < period:
+        return float(arr.mean()) if len(arr) else 0
+    return float(_ema_loop(arr, 2 / (period + 1)))
+
+
+def rsi(arr, period):
+    """RSI over the last `period` deltas."""
+    if len(arr) < period + 1:
+        return 50  # neutral
+    d = np.diff(arr[-period - 1:])
+    avg_gain = float(np.maximum(d, 0.0).mean())
+    avg_loss = float(np.maximum(-d, 0.0).mean())
+    if avg_loss == 0:
+        return 100
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def zscore(arr, lookback):
+    """How far the last price sits from the lookback mean, in std devs."""
+    if len(arr) < lookback:
+        return 0
+    window = arr[-lookback:]
+    mean = window.mean()
+    std = window.std()
+    return float((arr[-1] - mean) / std) if std > 0 else 0.0
+
+
+def atr(arr, period):
+    """Simple ATR approximation using close prices since we don't have H/L."""
+    if len(arr) < period + 1:
+        return 0
+    return float(np.abs(np.diff(arr[-period - 1:])).mean())
+
+
+def trend_strength(arr, lookback, pct_change):
+    """Share of the last lookback-1 moves that went pct_change's way."""
+    recent = arr[-lookback:]
+    if len(recent) < 2:
+        return 0
+    if pct_change == 0:
+        return 0.0
+    target = 1.0 if pct_change > 0 else -1.0
+    consecutive = int((np.sign(np.diff(recent)) == target).sum())
+    return consecutive / (len(recent) - 1)
+
+
+class FeatureCache:
+    """Lazily computed, memoised indicators over one tick's price series.
+
+    Safe to share between the arena's worker threads: a race only means
+    two threads compute the same value, and the dict store is atomic.
+    """
+
+    __slots__ = ("prices", "volumes", "_memo", "_vol_cum")
+
+    def __init__(self, prices, volumes=()):
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.float64)
+        self._memo = {}
+        self._vol_cum = None
+
+    def memo(self, key, fn, *args):
+        """fn(*args), computed once per key for this tick."""
+        memo = self._memo
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = fn(*args)
+            return value
+
+    def pct_change(self, lookback):
+        """(prices[-1] - prices[-lookback]) / prices[-lookback], or None if
+        there are fewer than lookback prices or the base price is zero."""
+        return self.memo(("pct_change", lookback), self._pct_change, lookback)
+
+    def _pct_change(self, lookback):
+        arr = self.prices
+        if len(arr) < lookback or not len(arr):
+            return None
+        oldest = arr[-lookback]
+        if oldest == 0:
+            return None
+        return float((arr[-1] - oldest) / oldest)
+
+    def trend_strength(self, lookback):
+        pct = self.pct_change(lookback)
+        return self.memo(("trend_strength", lookback), trend_strength,
+                         self.prices, lookback, pct or 0.0)
+
+    def volume_sum(self, start, stop):
+        """sum(volumes[start:stop]) for 0 <= start <= stop <= len(volumes),
+        as one subtraction on a prefix sum built on first use."""
+        vol_cum = self._vol_cum
+        if vol_cum is None:
+            vol_cum = np.zeros(len(self.volumes) + 1)
+            np.cumsum(self.volumes, out=vol_cum[1:])
+            self._vol_cum = vol_cum
+        return float(vol_cum[stop] - vol_cum[start])
+
+    def ema(self, period):
+        return self.memo(("ema", period), ema, self.prices, period)
+
+    def rsi(self, period):
+        return self.memo(("rsi", period), rsi, self.prices, period)
+
+    def zscore(self, lookback):
+        return self.memo(("zscore", lookback), zscore, self.prices, lookback)
+
+    def atr(self, period):
+        return self.memo(("atr", period), atr, self.prices, period)
+
+    def window_range(self, lookback):
+        """(high, low) of the last lookback prices."""
+        return self.memo(("window_range", lookback), self._window_range, lookback)
+
+    def _window_range(self, lookback):
+        window = self.prices[-lookback:]
+        return float(window.max()), float(window.min())
+
+
+def shared(signals):
+    """The tick's FeatureCache from signals, or a private one for callers
+    (tests, bot.py, HybridBot outside the arena) that didn't attach one."""
+    cache = signals.get("indicators")
+    if cache is None:
+        cache = FeatureCache(signals.get("prices", ()), signals.get("volumes", ()))
+    return cache
@@ -6,9 +6,15 @@ that were present get their win/loss counts updated. When making new
 decisions, the bot queries its learned win rates to bias yes/no.
 """
 
+import atexit
+import functools
 import math
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+
+import numpy as np
 
 import db
 
@@ -65,23 +71,44 @@ def extract_features(market_price, price_momentum, hour_et=None, volume=None, ti
     Returns:
         list of feature key strings
     """
-    features = []
+    if hour_et is None:
+        # UTC hour straight from the epoch (POSIX time has no leap seconds),
+        # instead of building a datetime per call; then UTC to ET approx
+        hour_et = (int(time.time() // 3600) - 5) % 24
+    # Volume/time bucket edges are whole numbers, so flooring keeps the bucket
+    # exact while letting nearby values share a cache entry
+    if volume is not None:
+        volume = math.floor(volume)
+    if time_rem is not None:
+        time_rem = math.floor(time_rem)
+    # Price and momentum are raw floats that differ every tick; key the cache
+    # on their bucket indices so it actually hits
+    return list(_extract_features(
+        _bucket_index(PRICE_BUCKETS, market_price),
+        _bucket_index(MOMENTUM_BUCKETS, price_momentum),
+        hour_et, volume, time_rem,
+    ))
+
+
+def _bucket_index(buckets, value):
+    """Index of the first (name, lo, hi) bucket with lo <= value < hi, or None."""
+    for i, (_, lo, hi) in enumerate(buckets):
+        if lo <= value < hi:
+            return i
+    return None
+
 
-    # Price bucket
-    for name, lo, hi in PRICE_BUCKETS:
-        if lo <= market_price < hi:
-            features.append(name)
-            break
+@functools.lru_cache(maxsize=4096)
+def _extract_features(price_idx, momentum_idx, hour_et, volume, time_rem):
+    features = []
 
-    # Momentum bucket
-    for name, lo, hi in MOMENTUM_BUCKETS:
-        if lo <= price_momentum < hi:
-            features.append(name)
-            break
+    # Price and momentum buckets, already located by the caller
+    if price_idx is not None:
+        features.append(PRICE_BUCKETS[price_idx][0])
+    if momentum_idx is not None:
+        features.append(MOMENTUM_BUCKETS[momentum_idx][0])
 
     # Hour bucket
-    if hour_et is None:
-        hour_et = (datetime.utcnow().hour - 5) % 24  # UTC to ET approx
     for name, start, end in HOUR_BUCKETS:
         if start < end:
             if start <= hour_et < end:
@@ -106,7 +133,7 @@ def extract_features(market_price, price_momentum, hour_et=None, volume=None, ti
                 features.append(name)
                 break
 
-    return features
+    return tuple(features)
 
 
 def get_learned_bias(bot_name, features, prior_yes=0.5):
@@ -158,6 +185,72 @@ def get_learned_bias(bot_name, features, prior_yes=0.5):
     return max(0.05, min(0.95, yes_bias))
 
 
+def get_learned_bias_batch(bot_names, features, priors):
+    """Vectorized get_learned_bias() for several bots sharing one feature set.
+
+    All bots trading a market see the same features, so their learned rows
+    come back in one query and the Bayesian update runs as array math over
+    a (bots x features) grid instead of a query + Python loop per bot.
+
+    Args:
+        bot_names: sequence of bot names
+        features: list of feature keys from extract_features()
+        priors: sequence of prior_yes values, aligned with bot_names
+
+    Returns:
+        ndarray of yes biases (0.05-0.95), aligned with bot_names
+    """
+    bot_names = list(bot_names)
+    priors = np.asarray(priors, dtype=np.float64)
+    if not bot_names:
+        return priors
+
+    wins = np.zeros((len(bot_names), len(features)))
+    losses = np.zeros_like(wins)
+    if features:
+        bot_idx = {name: i for i, name in enumerate(bot_names)}
+        feat_idx = {feat: j for j, feat in enumerate(features)}
+        with db.get_conn() as conn:
+            rows = conn.execute(
+                f"SELECT bot_name, feature_key, wins, losses FROM bot_learning "
+                f"WHERE bot_name IN ({','.join('?' * len(bot_idx))}) "
+                f"AND feature_key IN ({','.join('?' * len(feat_idx))})",
+                (*bot_idx, *feat_idx),
+            ).fetchall()
+        for r in rows:
+            i, j = bot_idx[r["bot_name"]], feat_idx[r["feature_key"]]
+            wins[i, j] = r["wins"]
+            losses[i, j] = r["losses"]
+
+    # Same update as get_learned_bias(), one column per feature
+    total = wins + losses
+    feat_wr = (wins + 1) / (total + 2)
+    strength = np.minimum(np.sqrt(total) * 0.5, 3.0)
+    contrib = np.where(total >= 2, np.log(feat_wr / (1 - feat_wr)) * strength * 0.35, 0.0)
+
+    valid = (priors > 0) & (priors < 1)
+    safe = np.where(valid, priors, 0.5)
+    log_odds = np.where(valid, np.log(safe / (1 - safe)), 0.0) + contrib.sum(axis=1)
+
+    yes_bias = 1.0 / (1.0 + np.exp(-log_odds))
+    return np.clip(yes_bias, 0.05, 0.95)
+
+
+_YES_WON_SQL = """
+    INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
+    VALUES (?, ?, 1, 0)
+    ON CONFLICT(bot_name, feature_key)
+    DO UPDATE SET wins=wins+1, updated_at=datetime('now')
+"""
+
+_YES_LOST_SQL = """
+    INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
+    VALUES (?, ?, 0, 1)
+    ON CONFLICT(bot_name, feature_key)
+    DO UPDATE SET losses=losses+1, updated_at=datetime('now')
+"""
+
+
 def record_outcome(bot_name, features, side, won):
     """Update learning table after a trade resolves.
 
@@ -165,40 +258,88 @@ def record_outcome(bot_name, features, side, won):
     If side='yes' and won → increment wins
     If side='no' and won → increment losses (YES lost)
     """
+    record_outcomes([(bot_name, features, side, won)])
+
+
+def record_outcomes(outcomes):
+    """Batch form of record_outcome() — all upserts share one transaction.
+
+    Args:
+        outcomes: iterable of (bot_name, features, side, won) tuples
+    """
+    yes_won, yes_lost = [], []
+    for bot_name, features, side, won in outcomes:
+        # NO won → YES lost, NO lost → YES won
+        rows = yes_won if (side == "yes") == bool(won) else yes_lost
+        rows.extend((bot_name, feat) for feat in features)
+
+    if not yes_won and not yes_lost:
+        return
     with db.get_conn() as conn:
-        for feat in features:
-            if side == "yes":
-                if won:
-                    conn.execute("""
-                        INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
-                        VALUES (?, ?, 1, 0)
-                        ON CONFLICT(bot_name, feature_key)
-                        DO UPDATE SET wins=wins+1, updated_at=datetime('now')
-                    """, (bot_name, feat))
-                else:
-                    conn.execute("""
-                        INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
-                        VALUES (?, ?, 0, 1)
-                        ON CONFLICT(bot_name, feature_key)
-                        DO UPDATE SET losses=losses+1, updated_at=datetime('now')
-                    """, (bot_name, feat))
-            else:  # side == "no"
-                if won:
-                    # NO won → YES lost
-                    conn.execute("""
-                        INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
-                        VALUES (?, ?, 0, 1)
-                        ON CONFLICT(bot_name, feature_key)
-                        DO UPDATE SET losses=losses+1, updated_at=datetime('now')
-                    """, (bot_name, feat))
-                else:
-                    # NO lost → YES won
-                    conn.execute("""
-                        INSERT INTO bot_learning (bot_name, feature_key, wins, losses)
-                        VALUES (?, ?, 1, 0)
-                        ON CONFLICT(bot_name, feature_key)
-                        DO UPDATE SET wins=wins+1, updated_at=datetime('now')
-                    """, (bot_name, feat))
+        if yes_won:
+            conn.executemany(_YES_WON_SQL, yes_won)
+        if yes_lost:
+            conn.executemany(_YES_LOST_SQL, yes_lost)
+
+
+# Outcomes waiting to be written by the background recorder. Bounded so a
+# stalled DB can't grow memory without limit — see record_outcomes_async().
+_outcome_q = queue.Queue(maxsize=10_000)
+_outcome_worker = None
+_outcome_worker_lock = threading.Lock()
+
+
+def _drain_outcomes():
+    """Background worker: write queued outcomes in batches as they arrive."""
+    while True:
+        batch = [_outcome_q.get()]
+        while True:
+            try:
+                batch.append(_outcome_q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            record_outcomes(batch)
+        except Exception as e:
+            logger.error(f"Learning update failed for {len(batch)} outcomes: {e}")
+        finally:
+            for _ in batch:
+                _outcome_q.task_done()
+
+
+def record_outcomes_async(outcomes):
+    """Queue outcomes for record_outcomes() on a background thread.
+
+    Keeps learning upserts off the trade-resolution path. If the queue is
+    full the remaining outcomes are written inline rather than dropped.
+    """
+    global _outcome_worker
+    if _outcome_worker is None:
+        with _outcome_worker_lock:
+            if _outcome_worker is None:
+                _outcome_worker = threading.Thread(
+                    target=_drain_outcomes, name="learning-recorder", daemon=True
+                )
+                _outcome_worker.start()
+
+    overflow = []
+    for item in outcomes:
+        try:
+            _outcome_q.put_nowait(item)
+        except queue.Full:
+            overflow.append(item)
+    if overflow:
+        logger.warning(f"Learning queue full — recording {len(overflow)} outcomes inline")
+        record_outcomes(overflow)
+
+
+def flush_outcomes():
+    """Block until every queued outcome has been written."""
+    if _outcome_worker is not None:
+        _outcome_q.join()
+
+
+atexit.register(flush_outcomes)
 
 
 def extract_features_from_reasoning(reasoning):
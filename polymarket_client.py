@@ -3,10 +3,14 @@
 import json
 import logging
 import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType
+from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 from py_clob_client.order_builder.constants import BUY
 from py_order_utils.model import POLY_PROXY
 
@@ -15,6 +19,7 @@ import config
 logger = logging.getLogger(__name__)
 
 _client = None
+_client_lock = threading.Lock()
 
 
 def _load_creds():
@@ -22,23 +27,76 @@ def _load_creds():
         return json.load(f)
 
 
+def _load_derived_creds(address):
+    """API creds saved by an earlier run for this wallet, or None if missing,
+    stale, or derived for a different wallet."""
+    path = config.POLYMARKET_DERIVED_CREDS_PATH
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > config.POLYMARKET_DERIVED_CREDS_MAX_AGE_DAYS * 86400:
+            return None
+        with open(path) as f:
+            saved = json.load(f)
+        if saved.get("address", "").lower() != address.lower():
+            return None
+        return ApiCreds(
+            api_key=saved["api_key"],
+            api_secret=saved["api_secret"],
+            api_passphrase=saved["api_passphrase"],
+        )
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _save_derived_creds(address, api_creds):
+    path = config.POLYMARKET_DERIVED_CREDS_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Owner-only: these authenticate orders on the wallet
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "address": address,
+                "api_key": api_creds.api_key,
+                "api_secret": api_creds.api_secret,
+                "api_passphrase": api_creds.api_passphrase,
+            }, f)
+    except OSError as e:
+        logger.warning(f"Could not save derived Polymarket API creds: {e}")
+
+
 def get_client() -> ClobClient:
-    """Get or create the CLOB client singleton."""
+    """Get or create the CLOB client singleton.
+
+    Thread-safe: concurrent first callers build one client and derive the
+    API creds once.
+    """
     global _client
     if _client is None:
-        creds = _load_creds()
-        pk = creds["private_key"]
-        funder = creds.get("wallet_address")  # proxy wallet (0xcdc7609) holding USDC
-        _client = ClobClient(
-            host=config.POLYMARKET_HOST,
-            key=pk,
-            chain_id=config.POLYMARKET_CHAIN_ID,
-            funder=funder,
-            signature_type=POLY_PROXY,  # type 1: Polymarket proxy wallet
-        )
-        # Derive API credentials from the wallet
-        _client.set_api_creds(_client.create_or_derive_api_creds())
-        logger.info(f"Polymarket CLOB client initialized (funder={funder})")
+        with _client_lock:
+            if _client is None:
+                creds = _load_creds()
+                pk = creds["private_key"]
+                funder = creds.get("wallet_address")  # proxy wallet (0xcdc7609) holding USDC
+                client = ClobClient(
+                    host=config.POLYMARKET_HOST,
+                    key=pk,
+                    chain_id=config.POLYMARKET_CHAIN_ID,
+                    funder=funder,
+                    signature_type=POLY_PROXY,  # type 1: Polymarket proxy wallet
+                )
+                # API credentials: reuse the ones derived on an earlier start,
+                # else derive from the wallet (a signed request) and save them
+                address = client.get_address()
+                api_creds = _load_derived_creds(address)
+                if api_creds is None:
+                    api_creds = client.create_or_derive_api_creds()
+                    _save_derived_creds(address, api_creds)
+                client.set_api_creds(api_creds)
+                # Publish only once fully set up, so the unlocked check above
+                # never hands out a client without creds
+                _client = client
+                logger.info(f"Polymarket CLOB client initialized (funder={funder})")
     return _client
 
 
@@ -195,6 +253,23 @@ def place_limit_order(
         return {"success": False, "error": str(e)}
 
 
+def place_limit_orders(orders: list[dict]) -> list[dict]:
+    """Place several limit orders concurrently.
+
+    Each entry holds the keyword arguments for place_limit_order. The orders
+    are signed and posted in parallel, so quoting both sides of a market costs
+    one round-trip instead of two. Results come back in the order given.
+    """
+    if len(orders) <= 1:
+        return [place_limit_order(**o) for o in orders]
+    try:
+        get_client()  # build the singleton here, not raced by the workers
+    except Exception:
+        pass  # each order reports the failure itself
+    with ThreadPoolExecutor(max_workers=len(orders)) as ex:
+        return list(ex.map(lambda o: place_limit_order(**o), orders))
+
+
 def cancel_order(order_id: str) -> dict:
     """Cancel a resting limit order by order ID.
 
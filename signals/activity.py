@@ -0,0 +1,56 @@
+"""Polymarket wallet activity fetches, coalesced per wallet.
+
+CopyBot polling and the WalletMonitor (WS-triggered and fallback polls) all
+hit the same activity endpoint for the same wallets. Callers asking for a
+wallet within the same ACTIVITY_POLL_QUANTUM share one round-trip: the first
+caller fetches, the rest wait on its Future.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+ACTIVITY_API = "https://data-api.polymarket.com/activity"
+ACTIVITY_POLL_QUANTUM = 2.0   # seconds; ~one Polygon block
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# (wallet, limit, bucket) -> Future[(status_code, entries | None)]
+_poll_cache: dict[tuple[str, int, int], Future] = {}
+_poll_lock = threading.Lock()
+
+
+def fetch_activity(wallet: str, limit: int = 30, timeout: float = 10) -> tuple[int, list | None]:
+    """Return (status_code, entries) for a wallet's recent activity.
+
+    entries is the decoded JSON body on HTTP 200, else None. Raises on
+    network errors, like requests.get would.
+    """
+    bucket = int(time.time() // ACTIVITY_POLL_QUANTUM)
+    key = (wallet, limit, bucket)
+    with _poll_lock:
+        fut = _poll_cache.get(key)
+        owner = fut is None
+        if owner:
+            fut = _poll_cache[key] = Future()
+            # Drop buckets older than the previous one
+            for stale in [k for k in _poll_cache if k[2] < bucket - 1]:
+                del _poll_cache[stale]
+
+    if owner:
+        try:
+            resp = _session.get(
+                ACTIVITY_API,
+                params={"user": wallet, "limit": limit},
+                timeout=timeout,
+            )
+            entries = orjson.loads(resp.content) if resp.status_code == 200 else None
+            fut.set_result((resp.status_code, entries))
+        except Exception as e:
+            fut.set_exception(e)
+    return fut.result()
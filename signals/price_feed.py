@@ -4,7 +4,8 @@ import json
 import time
 import threading
 import logging
-from collections import deque
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +13,40 @@ BINANCE_WS = "wss://stream.binance.com:9443/ws"
 SYMBOLS = {"btc": "btcusdt", "sol": "solusdt"}
 
 
+class _Ring:
+    """Fixed-size float64 history, oldest first.
+
+    Every value is written twice, at i and i + capacity, so the current
+    window is always one contiguous slice: a snapshot is a single memcpy
+    instead of a deque -> list -> ndarray conversion per tick.
+    """
+
+    __slots__ = ("_buf", "_cap", "_n")
+
+    def __init__(self, capacity):
+        self._buf = np.zeros(2 * capacity, dtype=np.float64)
+        self._cap = capacity
+        self._n = 0
+
+    def append(self, value):
+        i = self._n % self._cap
+        self._buf[i] = value
+        self._buf[i + self._cap] = value
+        self._n += 1
+
+    def snapshot(self):
+        """Copy of the window; the feed thread keeps writing the buffer."""
+        if self._n < self._cap:
+            return self._buf[:self._n].copy()
+        start = self._n % self._cap
+        return self._buf[start:start + self._cap].copy()
+
+
 class PriceFeed:
     def __init__(self, max_candles=100):
-        self.prices = {sym: deque(maxlen=max_candles) for sym in SYMBOLS}
-        self.volumes = {sym: deque(maxlen=max_candles) for sym in SYMBOLS}
+        self.prices = {sym: _Ring(max_candles) for sym in SYMBOLS}
+        self.volumes = {sym: _Ring(max_candles) for sym in SYMBOLS}
+        self._lock = threading.Lock()  # keeps prices/volumes snapshots aligned
         self.latest = {sym: 0.0 for sym in SYMBOLS}
         self._last_update = {sym: 0.0 for sym in SYMBOLS}
         self._running = False
@@ -65,8 +96,9 @@ class PriceFeed:
                                 self.latest[name] = close
                                 self._last_update[name] = time.time()
                                 if is_closed:
-                                    self.prices[name].append(close)
-                                    self.volumes[name].append(volume)
+                                    with self._lock:
+                                        self.prices[name].append(close)
+                                        self.volumes[name].append(volume)
                                 break
                     except (KeyError, ValueError):
                         continue
@@ -77,15 +109,21 @@ class PriceFeed:
                 time.sleep(5)
 
     def get_signals(self, symbol: str) -> dict:
-        """Get current price signals for a symbol."""
+        """Get current price signals for a symbol.
+
+        prices/volumes are float64 ndarrays, oldest candle first.
+        """
         sym = symbol.lower()
         if sym not in self.prices:
-            return {"prices": [], "volumes": [], "latest": 0}
+            return {"prices": np.empty(0), "volumes": np.empty(0), "latest": 0}
 
         stale = (time.time() - self._last_update.get(sym, 0)) > 60
+        with self._lock:
+            prices = self.prices[sym].snapshot()
+            volumes = self.volumes[sym].snapshot()
         return {
-            "prices": list(self.prices[sym]),
-            "volumes": list(self.volumes[sym]),
+            "prices": prices,
+            "volumes": volumes,
             "latest": self.latest.get(sym, 0),
             "stale": stale,
         }
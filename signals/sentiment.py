@@ -5,6 +5,7 @@ import threading
 import logging
 import re
 from collections import deque
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,25 @@ INFLUENCERS = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class Sentiment:
+    """One symbol's sentiment over the feed window (signals["sentiment"])."""
+    score: float = 0.5             # 0=bearish, 0.5=neutral, 1=bullish
+    post_count: int = 0
+    influencer_score: float = 0.5
+    momentum: float = 0            # change in sentiment over the window
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Sentiment":
+        """Accept the older dict form of signals["sentiment"]."""
+        return cls(
+            score=data.get("score", 0.5),
+            post_count=data.get("post_count", 0),
+            influencer_score=data.get("influencer_score", 0.5),
+            momentum=data.get("momentum", 0),
+        )
+
+
 class SentimentFeed:
     def __init__(self, window_minutes=5, max_posts=500):
         self.posts = {"btc": deque(maxlen=max_posts), "sol": deque(maxlen=max_posts)}
@@ -132,12 +152,12 @@ class SentimentFeed:
         self.sentiment_history[sym].append(avg_score)
 
         return {
-            "sentiment": {
-                "score": avg_score,
-                "influencer_score": avg_inf_score,
-                "post_count": len(recent),
-                "momentum": momentum,
-            }
+            "sentiment": Sentiment(
+                score=avg_score,
+                post_count=len(recent),
+                influencer_score=avg_inf_score,
+                momentum=momentum,
+            )
         }
 
 
@@ -22,12 +22,12 @@ import queue
 import threading
 import time
 
-import requests
+from bloom import BloomFilter
+from signals.activity import fetch_activity
 
 logger = logging.getLogger(__name__)
 
 POLYGON_WS_URL = "wss://polygon-bor-rpc.publicnode.com"
-ACTIVITY_API = "https://data-api.polymarket.com/activity"
 FALLBACK_POLL_INTERVAL = 15    # seconds between polls when WS is silent
 WS_QUIET_THRESHOLD = 30        # seconds of WS silence before fallback kicks in
 
@@ -46,7 +46,7 @@ class WalletMonitor:
         self.wallet = wallet_address.lower()
         self.label = label or wallet_address[:16]
         self.trade_queue: queue.Queue = queue.Queue()
-        self._seen_keys: set[str] = set()
+        self._seen_keys = BloomFilter()
         self._seen_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._last_ws_trigger: float = 0.0   # timestamp of last WS-triggered poll
@@ -75,9 +75,17 @@ class WalletMonitor:
         self._stop_event.set()
 
     def seed_seen_keys(self, keys):
-        """Pre-populate seen keys from DB to avoid re-queuing old trades on startup."""
+        """Pre-populate seen keys from DB to avoid re-queuing old trades on startup.
+
+        Accepts an iterable of keys or a CopyBot's seen-keys BloomFilter. A
+        filter seeding an empty monitor is copied, so the monitor takes on
+        the CopyBot's sizing instead of needing the same shape.
+        """
         with self._seen_lock:
-            self._seen_keys.update(keys)
+            if isinstance(keys, BloomFilter) and not len(self._seen_keys):
+                self._seen_keys = keys.copy()
+            else:
+                self._seen_keys.update(keys)
         logger.debug(f"WalletMonitor [{self.label}]: seeded {len(keys)} seen keys")
 
     def drain_queue(self) -> list[dict]:
@@ -95,15 +103,10 @@ class WalletMonitor:
     def _poll_activity(self) -> list[dict]:
         """Fetch Polymarket activity API; return only unseen trades."""
         try:
-            resp = requests.get(
-                ACTIVITY_API,
-                params={"user": self.wallet, "limit": 30},
-                timeout=10,
-            )
-            if resp.status_code != 200:
+            status, entries = fetch_activity(self.wallet, limit=30, timeout=10)
+            if status != 200:
                 return []
 
-            entries = resp.json()
             if not isinstance(entries, list):
                 return []
 
@@ -118,6 +121,7 @@ class WalletMonitor:
                     if key in self._seen_keys:
                         continue
                     self._seen_keys.add(key)
+                    # fetch_activity shares entries between callers: tag a copy
                     new_trades.append({**t, "_key": key})
 
             return new_trades